@@ -0,0 +1,99 @@
+"""Convert economic_indicators to a TimescaleDB hypertable
+
+Revision ID: 4f1e7a9c2b6d
+Revises: dc3c13aec156
+Create Date: 2026-10-15 23:21:40.902114
+
+No-op on servers without the timescaledb extension available, so plain
+PostgreSQL deployments keep working.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f1e7a9c2b6d'
+down_revision: Union[str, None] = 'dc3c13aec156'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHUNK_INTERVAL = "90 days"
+COMPRESS_AFTER = "180 days"
+
+# (view name, bucket width, refresh start offset)
+ROLLUPS = [
+    ("economic_indicators_daily", "1 day", "7 days"),
+    ("economic_indicators_weekly", "7 days", "35 days"),
+    ("economic_indicators_monthly", "1 month", "93 days"),
+]
+
+
+def _timescale_available() -> bool:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return False
+    return bool(
+        bind.execute(
+            sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'timescaledb'")
+        ).scalar()
+    )
+
+
+def upgrade() -> None:
+    if not _timescale_available():
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS timescaledb")
+
+    # Unique indexes on a hypertable must include the partitioning column
+    op.execute("ALTER TABLE economic_indicators DROP CONSTRAINT economic_indicators_pkey")
+    op.execute("ALTER TABLE economic_indicators ADD PRIMARY KEY (id, data_date)")
+
+    op.execute(
+        "SELECT create_hypertable('economic_indicators', 'data_date', "
+        f"chunk_time_interval => INTERVAL '{CHUNK_INTERVAL}', migrate_data => true)"
+    )
+    op.execute(
+        "ALTER TABLE economic_indicators SET ("
+        "timescaledb.compress, "
+        "timescaledb.compress_segmentby = 'indicator_code', "
+        "timescaledb.compress_orderby = 'data_date DESC')"
+    )
+    op.execute(
+        f"SELECT add_compression_policy('economic_indicators', INTERVAL '{COMPRESS_AFTER}')"
+    )
+
+    # Continuous aggregates cannot be created inside a transaction
+    with op.get_context().autocommit_block():
+        for view, bucket, start_offset in ROLLUPS:
+            op.execute(
+                f"CREATE MATERIALIZED VIEW IF NOT EXISTS {view} "
+                "WITH (timescaledb.continuous) AS "
+                f"SELECT indicator_code, time_bucket(INTERVAL '{bucket}', data_date) AS bucket, "
+                "last(value, data_date) AS value, "
+                "min(value) AS low, max(value) AS high, avg(value) AS average "
+                "FROM economic_indicators "
+                "GROUP BY indicator_code, bucket "
+                "WITH NO DATA"
+            )
+            op.execute(
+                f"SELECT add_continuous_aggregate_policy('{view}', "
+                f"start_offset => INTERVAL '{start_offset}', "
+                "end_offset => NULL, schedule_interval => INTERVAL '1 hour')"
+            )
+
+
+def downgrade() -> None:
+    if not _timescale_available():
+        return
+
+    with op.get_context().autocommit_block():
+        for view, _, _ in reversed(ROLLUPS):
+            op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {view}")
+
+    op.execute("SELECT remove_compression_policy('economic_indicators', if_exists => true)")
+    # The hypertable itself is left in place: TimescaleDB cannot convert it
+    # back to a plain table, and it behaves like one for application queries.
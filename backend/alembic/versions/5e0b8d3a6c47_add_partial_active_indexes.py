@@ -0,0 +1,28 @@
+"""Add partial indexes for active users and open holdings
+
+Revision ID: 5e0b8d3a6c47
+Revises: a7d4f2c9e158
+Create Date: 2026-10-16 01:22:09.573310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e0b8d3a6c47'
+down_revision: Union[str, None] = 'a7d4f2c9e158'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_active', 'users', ['uid'], unique=False, postgresql_where=sa.text('is_active'))
+    op.create_index('ix_holdings_active', 'holdings', ['portfolio_id'], unique=False, postgresql_where=sa.text('quantity > 0'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_holdings_active', table_name='holdings')
+    op.drop_index('ix_users_active', table_name='users')
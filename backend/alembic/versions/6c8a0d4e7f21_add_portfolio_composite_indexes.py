@@ -0,0 +1,65 @@
+"""Add composite indexes to holdings and transactions
+
+Revision ID: 6c8a0d4e7f21
+Revises: 9b2d5e8f1a3c
+Create Date: 2026-10-16 00:12:37.284519
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c8a0d4e7f21'
+down_revision: Union[str, None] = '9b2d5e8f1a3c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Merge duplicate (portfolio_id, symbol) holdings into the oldest row
+    # before enforcing uniqueness: re-point transactions, combine quantity
+    # and weighted-average cost, then drop the extras.
+    op.execute(
+        """
+        UPDATE transactions t
+        SET holding_id = keep.id
+        FROM holdings h
+        JOIN (
+            SELECT portfolio_id, symbol, MIN(id) AS id
+            FROM holdings GROUP BY portfolio_id, symbol HAVING COUNT(*) > 1
+        ) keep ON keep.portfolio_id = h.portfolio_id AND keep.symbol = h.symbol
+        WHERE t.holding_id = h.id AND h.id <> keep.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE holdings keeper
+        SET quantity = agg.quantity, average_cost = agg.average_cost
+        FROM (
+            SELECT MIN(id) AS id,
+                   SUM(quantity) AS quantity,
+                   COALESCE(SUM(quantity * average_cost) / NULLIF(SUM(quantity), 0), 0)
+                       AS average_cost
+            FROM holdings GROUP BY portfolio_id, symbol HAVING COUNT(*) > 1
+        ) agg
+        WHERE keeper.id = agg.id
+        """
+    )
+    op.execute(
+        "DELETE FROM holdings h USING holdings k "
+        "WHERE h.portfolio_id = k.portfolio_id AND h.symbol = k.symbol AND h.id > k.id"
+    )
+
+    op.create_index('ix_holdings_portfolio_symbol', 'holdings', ['portfolio_id', 'symbol'], unique=True)
+    op.create_index('ix_tx_portfolio_date', 'transactions', ['portfolio_id', 'transaction_date'], unique=False)
+    op.create_index('ix_tx_portfolio_type_date', 'transactions', ['portfolio_id', 'transaction_type', 'transaction_date'], unique=False)
+    op.create_index('ix_tx_portfolio_symbol', 'transactions', ['portfolio_id', 'symbol'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tx_portfolio_symbol', table_name='transactions')
+    op.drop_index('ix_tx_portfolio_type_date', table_name='transactions')
+    op.drop_index('ix_tx_portfolio_date', table_name='transactions')
+    op.drop_index('ix_holdings_portfolio_symbol', table_name='holdings')
@@ -0,0 +1,86 @@
+"""Hash-partition transactions by portfolio_id
+
+Revision ID: 8a1e6b4d9f25
+Revises: c2f9a4e7b013
+Create Date: 2026-10-16 01:58:27.640193
+
+The table is rebuilt as a partitioned parent with 16 hash partitions and
+the rows are copied across. The primary key becomes
+(id, portfolio_id) because unique constraints on a partitioned table must
+include the partition key; ids still come from transactions_id_seq, so the
+ORM keeps mapping id alone.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a1e6b4d9f25'
+down_revision: Union[str, None] = 'c2f9a4e7b013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONS = 16
+
+PORTFOLIO_DAILY_VIEW = """
+CREATE MATERIALIZED VIEW mv_portfolio_daily AS
+SELECT portfolio_id,
+       date_trunc('day', transaction_date) AS day,
+       SUM(CASE transaction_type
+               WHEN 'buy' THEN total_amount
+               WHEN 'sell' THEN -total_amount
+               ELSE 0 END) AS invested,
+       SUM(CASE WHEN transaction_type = 'dividend' THEN total_amount ELSE 0 END)
+           AS dividends
+FROM transactions
+GROUP BY 1, 2
+"""
+
+
+def _swap_in(new_table: str, primary_key: Sequence[str]) -> None:
+    """Copy transactions into new_table and put it in the old table's place."""
+    op.execute(f"ALTER TABLE {new_table} ADD PRIMARY KEY ({', '.join(primary_key)})")
+    op.execute(f'INSERT INTO {new_table} SELECT * FROM transactions')
+
+    # Keep the id sequence alive when the old table is dropped
+    op.execute('ALTER SEQUENCE transactions_id_seq OWNED BY NONE')
+    op.execute('DROP TABLE transactions')
+    op.execute(f'ALTER TABLE {new_table} RENAME TO transactions')
+    op.execute(f'ALTER TABLE transactions RENAME CONSTRAINT {new_table}_pkey TO transactions_pkey')
+    op.execute('ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id')
+    op.execute("SELECT setval('transactions_id_seq', COALESCE((SELECT MAX(id) FROM transactions), 0) + 1, false)")
+
+    op.create_foreign_key('transactions_portfolio_id_fkey', 'transactions', 'portfolios', ['portfolio_id'], ['id'], ondelete='CASCADE')
+    op.create_foreign_key('transactions_holding_id_fkey', 'transactions', 'holdings', ['holding_id'], ['id'])
+    op.create_index('ix_transactions_id', 'transactions', ['id'], unique=False)
+    op.create_index('ix_tx_portfolio_date', 'transactions', ['portfolio_id', 'transaction_date'], unique=False)
+    op.create_index('ix_tx_portfolio_type_date', 'transactions', ['portfolio_id', 'transaction_type', 'transaction_date'], unique=False)
+    op.create_index('ix_tx_portfolio_symbol', 'transactions', ['portfolio_id', 'symbol'], unique=False)
+
+    op.execute(PORTFOLIO_DAILY_VIEW)
+    op.execute('CREATE UNIQUE INDEX ix_mv_portfolio_daily_portfolio_day ON mv_portfolio_daily (portfolio_id, day)')
+
+
+def upgrade() -> None:
+    # The view reads transactions and would block DROP TABLE
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS mv_portfolio_daily')
+
+    op.execute(
+        'CREATE TABLE transactions_partitioned (LIKE transactions INCLUDING DEFAULTS) '
+        'PARTITION BY HASH (portfolio_id)'
+    )
+    for remainder in range(PARTITIONS):
+        op.execute(
+            f'CREATE TABLE transactions_p{remainder} PARTITION OF transactions_partitioned '
+            f'FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})'
+        )
+    _swap_in('transactions_partitioned', ['id', 'portfolio_id'])
+
+
+def downgrade() -> None:
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS mv_portfolio_daily')
+
+    op.execute('CREATE TABLE transactions_plain (LIKE transactions INCLUDING DEFAULTS)')
+    _swap_in('transactions_plain', ['id'])
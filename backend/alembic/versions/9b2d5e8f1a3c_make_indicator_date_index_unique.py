@@ -0,0 +1,33 @@
+"""Make idx_indicator_date unique for batch upserts
+
+Revision ID: 9b2d5e8f1a3c
+Revises: 4f1e7a9c2b6d
+Create Date: 2026-10-15 23:48:03.557120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b2d5e8f1a3c'
+down_revision: Union[str, None] = '4f1e7a9c2b6d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep only the most recent row per (indicator_code, data_date)
+    op.execute(
+        "DELETE FROM economic_indicators a USING economic_indicators b "
+        "WHERE a.indicator_code = b.indicator_code "
+        "AND a.data_date = b.data_date AND a.id < b.id"
+    )
+    op.drop_index('idx_indicator_date', table_name='economic_indicators')
+    op.create_index('idx_indicator_date', 'economic_indicators', ['indicator_code', 'data_date'], unique=True, postgresql_include=['value', 'change', 'change_percent'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_indicator_date', table_name='economic_indicators')
+    op.create_index('idx_indicator_date', 'economic_indicators', ['indicator_code', 'data_date'], unique=False, postgresql_include=['value', 'change', 'change_percent'])
@@ -0,0 +1,44 @@
+"""Add mv_portfolio_daily materialized view
+
+Revision ID: a7d4f2c9e158
+Revises: e3b7c1f05a92
+Create Date: 2026-10-16 01:07:52.114806
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d4f2c9e158'
+down_revision: Union[str, None] = 'e3b7c1f05a92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_portfolio_daily AS
+        SELECT portfolio_id,
+               date_trunc('day', transaction_date) AS day,
+               SUM(CASE transaction_type
+                       WHEN 'buy' THEN total_amount
+                       WHEN 'sell' THEN -total_amount
+                       ELSE 0 END) AS invested,
+               SUM(CASE WHEN transaction_type = 'dividend' THEN total_amount ELSE 0 END)
+                   AS dividends
+        FROM transactions
+        GROUP BY 1, 2
+        """
+    )
+    # Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_mv_portfolio_daily_portfolio_day "
+        "ON mv_portfolio_daily (portfolio_id, day)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_portfolio_daily")
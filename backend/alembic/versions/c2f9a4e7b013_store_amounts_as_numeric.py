@@ -0,0 +1,60 @@
+"""Store money and quantity columns as NUMERIC(20, 8)
+
+Revision ID: c2f9a4e7b013
+Revises: 5e0b8d3a6c47
+Create Date: 2026-10-16 01:36:44.281937
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f9a4e7b013'
+down_revision: Union[str, None] = '5e0b8d3a6c47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+AMOUNT_COLUMNS = {
+    'holdings': ['quantity', 'average_cost'],
+    'transactions': ['quantity', 'price', 'total_amount', 'fees', 'dividend_per_share'],
+    'portfolio_snapshots': ['total_value', 'total_invested', 'total_dividends', 'total_return'],
+    'dividend_payments': ['quantity_held', 'dividend_per_share', 'total_dividend', 'reinvested_shares', 'reinvested_price'],
+}
+
+PORTFOLIO_DAILY_VIEW = """
+CREATE MATERIALIZED VIEW mv_portfolio_daily AS
+SELECT portfolio_id,
+       date_trunc('day', transaction_date) AS day,
+       SUM(CASE transaction_type
+               WHEN 'buy' THEN total_amount
+               WHEN 'sell' THEN -total_amount
+               ELSE 0 END) AS invested,
+       SUM(CASE WHEN transaction_type = 'dividend' THEN total_amount ELSE 0 END)
+           AS dividends
+FROM transactions
+GROUP BY 1, 2
+"""
+
+
+def _alter_amounts(from_type: sa.types.TypeEngine, to_type: sa.types.TypeEngine) -> None:
+    # mv_portfolio_daily reads transactions.total_amount, which blocks ALTER TYPE
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS mv_portfolio_daily')
+    for table, columns in AMOUNT_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, existing_type=from_type, type_=to_type)
+    op.execute(PORTFOLIO_DAILY_VIEW)
+    op.execute(
+        'CREATE UNIQUE INDEX ix_mv_portfolio_daily_portfolio_day '
+        'ON mv_portfolio_daily (portfolio_id, day)'
+    )
+
+
+def upgrade() -> None:
+    _alter_amounts(sa.Float(), sa.Numeric(20, 8))
+
+
+def downgrade() -> None:
+    _alter_amounts(sa.Numeric(20, 8), sa.Float())
@@ -0,0 +1,34 @@
+"""Add covering indexes to economic tables
+
+Revision ID: dc3c13aec156
+Revises: bad8ddc3505a
+Create Date: 2026-10-15 23:05:12.418203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'dc3c13aec156'
+down_revision: Union[str, None] = 'bad8ddc3505a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rebuild the time-series indexes with INCLUDE columns (PostgreSQL 11+)
+    op.drop_index('idx_indicator_date', table_name='economic_indicators')
+    op.create_index('idx_indicator_date', 'economic_indicators', ['indicator_code', 'data_date'], unique=False, postgresql_include=['value', 'change', 'change_percent'])
+    op.drop_index('idx_category_date', table_name='economic_indicators')
+    op.create_index('idx_category_date', 'economic_indicators', ['category', 'data_date'], unique=False, postgresql_include=['value'])
+    op.create_index('idx_update_status_indicator', 'indicator_update_logs', ['status', 'indicator_code', 'started_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_update_status_indicator', table_name='indicator_update_logs')
+    op.drop_index('idx_category_date', table_name='economic_indicators')
+    op.create_index('idx_category_date', 'economic_indicators', ['category', 'data_date'], unique=False)
+    op.drop_index('idx_indicator_date', table_name='economic_indicators')
+    op.create_index('idx_indicator_date', 'economic_indicators', ['indicator_code', 'data_date'], unique=False)
@@ -0,0 +1,45 @@
+"""Cascade portfolio foreign keys on delete
+
+Revision ID: e3b7c1f05a92
+Revises: 6c8a0d4e7f21
+Create Date: 2026-10-16 00:41:18.630457
+
+Constraint names are PostgreSQL's defaults (<table>_<column>_fkey), which is
+what create_all and the unnamed constraint in bad8ddc3505a produced.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b7c1f05a92'
+down_revision: Union[str, None] = '6c8a0d4e7f21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, referenced table, referenced column)
+FOREIGN_KEYS = [
+    ('portfolios', 'user_id', 'users', 'uid'),
+    ('holdings', 'portfolio_id', 'portfolios', 'id'),
+    ('transactions', 'portfolio_id', 'portfolios', 'id'),
+    ('portfolio_snapshots', 'portfolio_id', 'portfolios', 'id'),
+    ('dividend_payments', 'portfolio_id', 'portfolios', 'id'),
+    ('portfolio_metrics', 'portfolio_id', 'portfolios', 'id'),
+]
+
+
+def _recreate(ondelete: Union[str, None]) -> None:
+    for table, column, referent, remote_column in FOREIGN_KEYS:
+        name = f'{table}_{column}_fkey'
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, referent, [column], [remote_column], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    _recreate('CASCADE')
+
+
+def downgrade() -> None:
+    _recreate(None)
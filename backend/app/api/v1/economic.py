@@ -1,13 +1,20 @@
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Request
+from fastapi.responses import ORJSONResponse
+from datetime import datetime, timezone
+import time
 import logging
 
+from app.core.cache import AsyncTTLCache
+from app.core.config import settings
+from app.core.etag import cached_response_with_etag
+from app.services.data_scheduler import FREDDataScheduler
 from app.services.economic_data_service import (
     EconomicDataService,
     create_economic_data_service,
 )
 from app.schemas.economic_schemas import (
+    EconomicCategory,
     EconomicIndicatorsResponse,
     EconomicIndicatorDetailResponse,
 )
@@ -16,9 +23,16 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/economic", tags=["economic-data"])
 
+# FRED data changes at most daily; collapse burst reads onto one upstream fetch
+_response_cache = AsyncTTLCache(
+    ttl=settings.economic_data_cache_ttl, maxsize=settings.response_cache_size
+)
+_health_probe_cache = AsyncTTLCache(ttl=settings.health_probe_cache_ttl, maxsize=1)
+
 
 @router.get("/indicators", response_model=EconomicIndicatorsResponse)
 async def get_economic_indicators(
+    request: Request,
     economic_service: EconomicDataService = Depends(create_economic_data_service),
 ) -> EconomicIndicatorsResponse:
     """
@@ -28,7 +42,12 @@ async def get_economic_indicators(
     """
     try:
         logger.info("Fetching all economic indicators")
-        return await economic_service.get_all_indicators()
+        return await cached_response_with_etag(
+            _response_cache,
+            ("indicators",),
+            economic_service.get_all_indicators_json,
+            request,
+        )
 
     except Exception as e:
         logger.error(f"Error fetching economic indicators: {e}")
@@ -42,6 +61,7 @@ async def get_economic_indicators(
     "/indicators/{indicator_code}", response_model=EconomicIndicatorDetailResponse
 )
 async def get_indicator_detail(
+    request: Request,
     indicator_code: str,
     economic_service: EconomicDataService = Depends(create_economic_data_service),
 ) -> EconomicIndicatorDetailResponse:
@@ -50,9 +70,22 @@ async def get_indicator_detail(
 
     - **indicator_code**: FRED series ID (e.g., DGS10, UNRATE, CPIAUCSL)
     """
+    # The provider answers unknown codes with mock data; reject them before
+    # they reach FRED or the response cache
+    if indicator_code not in FREDDataScheduler.INDICATOR_SCHEDULES:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown indicator {indicator_code}",
+        )
+
     try:
         logger.info(f"Fetching indicator detail for {indicator_code}")
-        return await economic_service.get_indicator_detail(indicator_code)
+        return await cached_response_with_etag(
+            _response_cache,
+            ("indicator", indicator_code),
+            lambda: economic_service.get_indicator_detail(indicator_code),
+            request,
+        )
 
     except Exception as e:
         logger.error(f"Error fetching indicator detail for {indicator_code}: {e}")
@@ -64,11 +97,8 @@ async def get_indicator_detail(
 
 @router.get("/indicators/category/{category}")
 async def get_indicators_by_category(
-    category: str = Path(
-        ...,
-        description="Indicator category",
-        regex="^(bonds|employment|inflation|monetary|financial_stability|leading_indicators)$",
-    ),
+    request: Request,
+    category: EconomicCategory = Path(..., description="Indicator category"),
     economic_service: EconomicDataService = Depends(create_economic_data_service),
 ):
     """
@@ -77,19 +107,25 @@ async def get_indicators_by_category(
     - **category**: Category of indicators (bonds, employment, inflation, monetary, financial_stability, leading_indicators)
     """
     try:
-        logger.info(f"Fetching economic indicators for category: {category}")
-        return await economic_service.get_indicators_by_category(category)
+        logger.info(f"Fetching economic indicators for category: {category.value}")
+        return await cached_response_with_etag(
+            _response_cache,
+            ("category", category.value),
+            lambda: economic_service.get_indicators_by_category(category.value),
+            request,
+        )
 
     except Exception as e:
-        logger.error(f"Error fetching indicators for category {category}: {e}")
+        logger.error(f"Error fetching indicators for category {category.value}: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch indicators for category {category}",
+            detail=f"Failed to fetch indicators for category {category.value}",
         )
 
 
 @router.get("/bonds")
 async def get_bonds_data(
+    request: Request,
     economic_service: EconomicDataService = Depends(create_economic_data_service),
 ):
     """
@@ -102,7 +138,12 @@ async def get_bonds_data(
     """
     try:
         logger.info("Fetching bond market indicators")
-        return await economic_service.get_bonds_data()
+        return await cached_response_with_etag(
+            _response_cache,
+            ("category", "bonds"),
+            economic_service.get_bonds_data,
+            request,
+        )
 
     except Exception as e:
         logger.error(f"Error fetching bond data: {e}")
@@ -114,6 +155,7 @@ async def get_bonds_data(
 
 @router.get("/employment")
 async def get_employment_data(
+    request: Request,
     economic_service: EconomicDataService = Depends(create_economic_data_service),
 ):
     """
@@ -125,7 +167,12 @@ async def get_employment_data(
     """
     try:
         logger.info("Fetching employment indicators")
-        return await economic_service.get_employment_data()
+        return await cached_response_with_etag(
+            _response_cache,
+            ("category", "employment"),
+            economic_service.get_employment_data,
+            request,
+        )
 
     except Exception as e:
         logger.error(f"Error fetching employment data: {e}")
@@ -137,6 +184,7 @@ async def get_employment_data(
 
 @router.get("/inflation")
 async def get_inflation_data(
+    request: Request,
     economic_service: EconomicDataService = Depends(create_economic_data_service),
 ):
     """
@@ -149,7 +197,12 @@ async def get_inflation_data(
     """
     try:
         logger.info("Fetching inflation indicators")
-        return await economic_service.get_inflation_data()
+        return await cached_response_with_etag(
+            _response_cache,
+            ("category", "inflation"),
+            economic_service.get_inflation_data,
+            request,
+        )
 
     except Exception as e:
         logger.error(f"Error fetching inflation data: {e}")
@@ -161,6 +214,7 @@ async def get_inflation_data(
 
 @router.get("/monetary")
 async def get_monetary_data(
+    request: Request,
     economic_service: EconomicDataService = Depends(create_economic_data_service),
 ):
     """
@@ -171,7 +225,12 @@ async def get_monetary_data(
     """
     try:
         logger.info("Fetching monetary policy indicators")
-        return await economic_service.get_monetary_data()
+        return await cached_response_with_etag(
+            _response_cache,
+            ("category", "monetary"),
+            economic_service.get_monetary_data,
+            request,
+        )
 
     except Exception as e:
         logger.error(f"Error fetching monetary data: {e}")
@@ -183,6 +242,7 @@ async def get_monetary_data(
 
 @router.get("/financial-stability")
 async def get_financial_stability_data(
+    request: Request,
     economic_service: EconomicDataService = Depends(create_economic_data_service),
 ):
     """
@@ -193,7 +253,12 @@ async def get_financial_stability_data(
     """
     try:
         logger.info("Fetching financial stability indicators")
-        return await economic_service.get_financial_stability_data()
+        return await cached_response_with_etag(
+            _response_cache,
+            ("category", "financial_stability"),
+            economic_service.get_financial_stability_data,
+            request,
+        )
 
     except Exception as e:
         logger.error(f"Error fetching financial stability data: {e}")
@@ -205,13 +270,11 @@ async def get_financial_stability_data(
 
 @router.post("/refresh")
 async def refresh_economic_data(
-    category: Optional[str] = Query(
-        None,
-        description="Category to refresh cache for",
-        regex="^(bonds|employment|inflation|monetary|financial_stability|leading_indicators)$",
+    category: Optional[EconomicCategory] = Query(
+        None, description="Category to refresh cache for"
     ),
     economic_service: EconomicDataService = Depends(create_economic_data_service),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Force refresh of cached economic data.
 
@@ -219,16 +282,18 @@ async def refresh_economic_data(
     - Clears cache and fetches fresh data from FRED
     """
     try:
-        logger.info(f"Refreshing economic data cache for category: {category}")
-        success = await economic_service.refresh_cache(category)
+        category_code = category.value if category else None
+        logger.info(f"Refreshing economic data cache for category: {category_code}")
+        success = await economic_service.refresh_cache(category_code)
 
         if success:
-            return JSONResponse(
+            _response_cache.clear()
+            return ORJSONResponse(
                 status_code=status.HTTP_200_OK,
                 content={
-                    "message": f"Successfully refreshed economic data cache for category: {category or 'all'}",
-                    "category": category,
-                    "timestamp": str(datetime.now()),
+                    "message": f"Successfully refreshed economic data cache for category: {category_code or 'all'}",
+                    "category": category_code,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
                 },
             )
         else:
@@ -250,49 +315,55 @@ async def refresh_economic_data(
 @router.get("/health")
 async def economic_data_health_check(
     economic_service: EconomicDataService = Depends(create_economic_data_service),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Health check endpoint for economic data service.
 
     - Tests connection to FRED API
     - Returns service status and response times
     """
+    # Serve the last successful probe so frequent checks don't hit the provider
+    cached_probe = _health_probe_cache.get("probe")
+    if cached_probe is not None:
+        return ORJSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={**cached_probe, "response_time_ms": 0, "cached": True},
+        )
+
+    last_check = datetime.now(timezone.utc).isoformat()
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Try to fetch a simple indicator to test FRED connectivity
         test_data = await economic_service.get_indicator_detail("DGS10")
 
-        response_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+        # Convert to milliseconds
+        response_time = (time.perf_counter() - start_time) * 1000
 
-        return JSONResponse(
-            status_code=status.HTTP_200_OK,
-            content={
-                "status": "healthy",
-                "service": "economic-data",
-                "provider": "FRED",
-                "response_time_ms": round(response_time, 2),
-                "last_check": str(datetime.now()),
-                "provider_status": "connected",
-                "test_indicator": test_data.indicator.indicator_code,
-            },
-        )
+        probe = {
+            "status": "healthy",
+            "service": "economic-data",
+            "provider": "FRED",
+            "response_time_ms": round(response_time, 2),
+            "last_check": last_check,
+            "provider_status": "connected",
+            "cached": False,
+            "test_indicator": test_data.indicator.indicator_code,
+        }
+        _health_probe_cache.set("probe", probe)
+
+        return ORJSONResponse(status_code=status.HTTP_200_OK, content=probe)
 
     except Exception as e:
         logger.error(f"Economic data health check failed: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content={
                 "status": "unhealthy",
                 "service": "economic-data",
                 "provider": "FRED",
                 "error": str(e),
-                "last_check": str(datetime.now()),
+                "last_check": last_check,
                 "provider_status": "disconnected",
             },
         )
-
-
-# Import necessary modules for the endpoints
-from datetime import datetime
-import time
@@ -1,10 +1,16 @@
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from fastapi.responses import JSONResponse
-from datetime import datetime
+from typing import AsyncIterator, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from datetime import datetime, timezone
+import asyncio
 import time
 import logging
 
+import orjson
+
+from app.core.cache import AsyncTTLCache
+from app.core.config import settings
+from app.core.etag import cached_response_with_etag
 from app.services.market_data_service import (
     MarketDataService,
     create_market_data_service,
@@ -13,17 +19,73 @@ from app.schemas.market_schemas import (
     MarketIndicesResponse,
     MarketOverviewResponse,
     MarketIndexDetailResponse,
+    MarketIndex,
+    MarketRegion,
+    HistoricalPeriod,
 )
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/market", tags=["market-data"])
 
+# Short-lived cache so concurrent dashboard loads share one upstream fetch
+_response_cache = AsyncTTLCache(
+    ttl=settings.market_response_cache_ttl, maxsize=settings.response_cache_size
+)
+_health_probe_cache = AsyncTTLCache(ttl=settings.health_probe_cache_ttl, maxsize=1)
+
+# Periods with multi-year histories are streamed instead of encoded in one body
+_STREAMED_PERIODS = {
+    HistoricalPeriod.two_years,
+    HistoricalPeriod.five_years,
+    HistoricalPeriod.ten_years,
+    HistoricalPeriod.max,
+}
+_STREAM_BATCH_SIZE = 500
+
+# Test symbols as requested by user, flattened once for the quote fan-out
+_TEST_SYMBOLS = {
+    "volatility": ["VIX", "VXN", "VSTOXX", "VKOSPI"],
+    "us_indices": ["DJIA", "SP500", "NASDAQ", "RUSsell2000", "PHLX_SOX"],
+    "japan": ["NIKKEI225", "TOPIX"],
+    "korea": ["KOSPI", "KOSDAQ"],
+    "hong_kong": ["HANG_SENG"],
+}
+_TEST_PAIRS = tuple(
+    (category, symbol)
+    for category, symbols in _TEST_SYMBOLS.items()
+    for symbol in symbols
+)
+
+
+async def _stream_index_detail(
+    index: MarketIndex, rows: Optional[List[dict]]
+) -> AsyncIterator[bytes]:
+    """
+    Yield the index detail JSON with historical rows encoded in batches.
+
+    The rows are already in memory; batching avoids one large encoded body.
+    """
+    yield b'{"index":' + orjson.dumps(index.model_dump(mode="json"))
+    yield b',"related_indices":null'
+
+    if rows is None:
+        yield b',"historical_data":null}'
+        return
+
+    yield b',"historical_data":['
+    for start in range(0, len(rows), _STREAM_BATCH_SIZE):
+        batch = orjson.dumps(rows[start : start + _STREAM_BATCH_SIZE], default=str)
+        # Strip the batch's brackets so batches join into one array
+        yield (b"," if start else b"") + batch[1:-1]
+    yield b"]}"
+
 
 @router.get("/indices", response_model=MarketIndicesResponse)
 async def get_market_indices(
-    region: Optional[str] = Query(
-        None, description="Region filter: US, EU, ASIA", regex="^(US|EU|ASIA)$"
+    request: Request,
+    region: Optional[MarketRegion] = Query(
+        None, description="Region filter: US, EU, ASIA"
     ),
     market_service: MarketDataService = Depends(create_market_data_service),
 ) -> MarketIndicesResponse:
@@ -34,8 +96,14 @@ async def get_market_indices(
     - Returns market indices for the specified region or all regions if not specified
     """
     try:
-        logger.info(f"Fetching market indices for region: {region}")
-        return await market_service.get_indices(region)
+        region_code = region.value if region else None
+        logger.info(f"Fetching market indices for region: {region_code}")
+        return await cached_response_with_etag(
+            _response_cache,
+            ("indices", region_code),
+            lambda: market_service.get_indices(region_code),
+            request,
+        )
 
     except Exception as e:
         logger.error(f"Error fetching market indices: {e}")
@@ -53,40 +121,31 @@ async def test_specific_indices(
     Test specific indices mentioned by the user.
     Tests VIX, VXN, VSTOXX, VKOSPI and major market indices.
     """
-    # Test symbols as requested by user
-    test_symbols = {
-        "volatility": ["VIX", "VXN", "VSTOXX", "VKOSPI"],
-        "us_indices": ["DJIA", "SP500", "NASDAQ", "RUSsell2000", "PHLX_SOX"],
-        "japan": ["NIKKEI225", "TOPIX"],
-        "korea": ["KOSPI", "KOSDAQ"],
-        "hong_kong": ["HANG_SENG"],
-    }
-
-    results = {}
-
-    for category, symbols in test_symbols.items():
-        results[category] = {}
-        for symbol in symbols:
-            try:
-                quote_data = await market_service.get_quote(symbol)
-                results[category][symbol] = {"status": "success", "data": quote_data}
-            except Exception as e:
-                results[category][symbol] = {"status": "error", "error": str(e)}
+    # Fan out all quote requests concurrently
+    results_list = await asyncio.gather(
+        *(market_service.get_quote(symbol) for _, symbol in _TEST_PAIRS),
+        return_exceptions=True,
+    )
+
+    results = {category: {} for category in _TEST_SYMBOLS}
+    for (category, symbol), result in zip(_TEST_PAIRS, results_list):
+        if isinstance(result, Exception):
+            results[category][symbol] = {"status": "error", "error": str(result)}
+        else:
+            results[category][symbol] = {"status": "success", "data": result}
 
     return {
         "message": "Test of specific indices requested by user",
         "results": results,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
     }
 
 
 @router.get("/indices/{symbol}", response_model=MarketIndexDetailResponse)
 async def get_index_detail(
     symbol: str,
-    period: str = Query(
-        "1d",
-        description="Time period for historical data",
-        regex="^(1d|5d|1mo|3mo|6mo|1y|2y|5y|10y|ytd|max)$",
+    period: HistoricalPeriod = Query(
+        HistoricalPeriod.one_day, description="Time period for historical data"
     ),
     market_service: MarketDataService = Depends(create_market_data_service),
 ) -> MarketIndexDetailResponse:
@@ -97,8 +156,20 @@ async def get_index_detail(
     - **period**: Time period for historical data (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
     """
     try:
-        logger.info(f"Fetching index detail for {symbol} with period {period}")
-        return await market_service.get_index_detail(symbol, period)
+        logger.info(f"Fetching index detail for {symbol} with period {period.value}")
+        # Concurrent misses for the same symbol share one upstream fetch
+        if period in _STREAMED_PERIODS:
+            index, rows = await _response_cache.get_or_load(
+                ("detail_rows", symbol, period.value),
+                lambda: market_service.get_index_detail_rows(symbol, period.value),
+            )
+            return StreamingResponse(
+                _stream_index_detail(index, rows), media_type="application/json"
+            )
+        return await _response_cache.get_or_load(
+            ("detail", symbol, period.value),
+            lambda: market_service.get_index_detail(symbol, period.value),
+        )
 
     except Exception as e:
         logger.error(f"Error fetching index detail for {symbol}: {e}")
@@ -112,7 +183,7 @@ async def get_index_detail(
 async def get_quote(
     symbol: str,
     market_service: MarketDataService = Depends(create_market_data_service),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Get quote data for a specific market index.
 
@@ -120,8 +191,10 @@ async def get_quote(
     """
     try:
         logger.info(f"Fetching quote for {symbol}")
-        quote_data = await market_service.get_quote(symbol)
-        return JSONResponse(
+        quote_data = await _response_cache.get_or_load(
+            ("quote", symbol), lambda: market_service.get_quote(symbol)
+        )
+        return ORJSONResponse(
             status_code=status.HTTP_200_OK,
             content={"status": "success", "data": quote_data},
         )
@@ -136,6 +209,7 @@ async def get_quote(
 
 @router.get("/overview", response_model=MarketOverviewResponse)
 async def get_market_overview(
+    request: Request,
     market_service: MarketDataService = Depends(create_market_data_service),
 ) -> MarketOverviewResponse:
     """
@@ -145,7 +219,12 @@ async def get_market_overview(
     """
     try:
         logger.info("Fetching market overview")
-        return await market_service.get_market_overview()
+        return await cached_response_with_etag(
+            _response_cache,
+            ("overview",),
+            market_service.get_market_overview,
+            request,
+        )
 
     except Exception as e:
         logger.error(f"Error fetching market overview: {e}")
@@ -157,11 +236,11 @@ async def get_market_overview(
 
 @router.post("/refresh")
 async def refresh_market_data(
-    region: Optional[str] = Query(
-        None, description="Region to refresh cache for", regex="^(US|EU|ASIA)$"
+    region: Optional[MarketRegion] = Query(
+        None, description="Region to refresh cache for"
     ),
     market_service: MarketDataService = Depends(create_market_data_service),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Force refresh of cached market data.
 
@@ -169,16 +248,18 @@ async def refresh_market_data(
     - Clears cache and fetches fresh data from providers
     """
     try:
-        logger.info(f"Refreshing market data cache for region: {region}")
-        success = await market_service.refresh_cache(region)
+        region_code = region.value if region else None
+        logger.info(f"Refreshing market data cache for region: {region_code}")
+        success = await market_service.refresh_cache(region_code)
 
         if success:
-            return JSONResponse(
+            _response_cache.clear()
+            return ORJSONResponse(
                 status_code=status.HTTP_200_OK,
                 content={
-                    "message": f"Successfully refreshed market data cache for region: {region or 'all'}",
-                    "region": region,
-                    "timestamp": str(datetime.now()),
+                    "message": f"Successfully refreshed market data cache for region: {region_code or 'all'}",
+                    "region": region_code,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
                 },
             )
         else:
@@ -200,41 +281,52 @@ async def refresh_market_data(
 @router.get("/health")
 async def market_data_health_check(
     market_service: MarketDataService = Depends(create_market_data_service),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Health check endpoint for market data service.
 
     - Tests connection to data providers
     - Returns service status and response times
     """
+    # Serve the last successful probe so frequent checks don't hit the provider
+    cached_probe = _health_probe_cache.get("probe")
+    if cached_probe is not None:
+        return ORJSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={**cached_probe, "response_time_ms": 0, "cached": True},
+        )
+
+    last_check = datetime.now(timezone.utc).isoformat()
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Try to fetch a simple quote to test provider connectivity
         test_data = await market_service.get_index_detail("SP500", "1d")
 
-        response_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+        # Convert to milliseconds
+        response_time = (time.perf_counter() - start_time) * 1000
 
-        return JSONResponse(
-            status_code=status.HTTP_200_OK,
-            content={
-                "status": "healthy",
-                "service": "market-data",
-                "response_time_ms": round(response_time, 2),
-                "last_check": str(datetime.now()),
-                "provider_status": "connected",
-            },
-        )
+        probe = {
+            "status": "healthy",
+            "service": "market-data",
+            "response_time_ms": round(response_time, 2),
+            "last_check": last_check,
+            "provider_status": "connected",
+            "cached": False,
+        }
+        _health_probe_cache.set("probe", probe)
+
+        return ORJSONResponse(status_code=status.HTTP_200_OK, content=probe)
 
     except Exception as e:
         logger.error(f"Market data health check failed: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content={
                 "status": "unhealthy",
                 "service": "market-data",
                 "error": str(e),
-                "last_check": str(datetime.now()),
+                "last_check": last_check,
                 "provider_status": "disconnected",
             },
         )
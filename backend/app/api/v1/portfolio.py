@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 from datetime import datetime
+from pydantic import BaseModel
 
-from app.core.database import get_sync_db
 from app.core.auth import get_current_user, FirebaseUser
-from app.services.portfolio_service import PortfolioService
+from app.core.etag import serialize_payload
+from app.services.portfolio_service import PortfolioService, get_portfolio_service
 from app.schemas.portfolio import (
     Portfolio,
     PortfolioCreate,
@@ -16,42 +18,49 @@ from app.schemas.portfolio import (
     PortfolioPerformance,
     DividendAnalysis,
     PortfolioAllocation,
+    PortfolioDashboard,
     ChartData,
 )
 
 router = APIRouter(prefix="/api/v1/portfolio", tags=["portfolio"])
 
 
+def _json_response(payload: BaseModel) -> Response:
+    """Encode a service-built model once, skipping response_model re-validation"""
+    return Response(content=serialize_payload(payload), media_type="application/json")
+
+
 @router.post("/", response_model=Portfolio, status_code=status.HTTP_201_CREATED)
 async def create_portfolio(
     portfolio_data: PortfolioCreate,
-    db: Session = Depends(get_sync_db),
+    portfolio_service: PortfolioService = Depends(get_portfolio_service),
     current_user: FirebaseUser = Depends(get_current_user),
 ):
     """Create a new portfolio"""
-    portfolio_service = PortfolioService(db)
-    return portfolio_service.create_portfolio(current_user.uid, portfolio_data)
+    return await run_in_threadpool(
+        portfolio_service.create_portfolio, current_user.uid, portfolio_data
+    )
 
 
 @router.get("/", response_model=List[Portfolio])
 async def get_portfolios(
-    db: Session = Depends(get_sync_db),
+    portfolio_service: PortfolioService = Depends(get_portfolio_service),
     current_user: FirebaseUser = Depends(get_current_user),
 ):
     """Get all portfolios for the current user"""
-    portfolio_service = PortfolioService(db)
-    return portfolio_service.get_portfolios(current_user.uid)
+    return await run_in_threadpool(portfolio_service.get_portfolios, current_user.uid)
 
 
 @router.get("/{portfolio_id}", response_model=Portfolio)
 async def get_portfolio(
     portfolio_id: int,
-    db: Session = Depends(get_sync_db),
+    portfolio_service: PortfolioService = Depends(get_portfolio_service),
     current_user: FirebaseUser = Depends(get_current_user),
 ):
     """Get a specific portfolio"""
-    portfolio_service = PortfolioService(db)
-    portfolio = portfolio_service.get_portfolio(portfolio_id, current_user.uid)
+    portfolio = await run_in_threadpool(
+        portfolio_service.get_portfolio, portfolio_id, current_user.uid
+    )
     if not portfolio:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Portfolio not found"
@@ -63,13 +72,12 @@ async def get_portfolio(
 async def update_portfolio(
     portfolio_id: int,
     update_data: PortfolioUpdate,
-    db: Session = Depends(get_sync_db),
+    portfolio_service: PortfolioService = Depends(get_portfolio_service),
     current_user: FirebaseUser = Depends(get_current_user),
 ):
     """Update a portfolio"""
-    portfolio_service = PortfolioService(db)
-    portfolio = portfolio_service.update_portfolio(
-        portfolio_id, current_user.uid, update_data
+    portfolio = await run_in_threadpool(
+        portfolio_service.update_portfolio, portfolio_id, current_user.uid, update_data
     )
     if not portfolio:
         raise HTTPException(
@@ -81,12 +89,13 @@ async def update_portfolio(
 @router.delete("/{portfolio_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_portfolio(
     portfolio_id: int,
-    db: Session = Depends(get_sync_db),
+    portfolio_service: PortfolioService = Depends(get_portfolio_service),
     current_user: FirebaseUser = Depends(get_current_user),
 ):
     """Delete a portfolio"""
-    portfolio_service = PortfolioService(db)
-    success = portfolio_service.delete_portfolio(portfolio_id, current_user.uid)
+    success = await run_in_threadpool(
+        portfolio_service.delete_portfolio, portfolio_id, current_user.uid
+    )
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Portfolio not found"
@@ -96,12 +105,13 @@ async def delete_portfolio(
 @router.get("/{portfolio_id}/summary", response_model=PortfolioSummary)
 async def get_portfolio_summary(
     portfolio_id: int,
-    db: Session = Depends(get_sync_db),
+    portfolio_service: PortfolioService = Depends(get_portfolio_service),
     current_user: FirebaseUser = Depends(get_current_user),
 ):
     """Get comprehensive portfolio summary"""
-    portfolio_service = PortfolioService(db)
-    summary = portfolio_service.get_portfolio_summary(portfolio_id, current_user.uid)
+    summary = await run_in_threadpool(
+        portfolio_service.get_portfolio_summary, portfolio_id, current_user.uid
+    )
     if not summary:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Portfolio not found"
@@ -114,66 +124,114 @@ async def get_portfolio_performance(
     portfolio_id: int,
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
-    db: Session = Depends(get_sync_db),
+    portfolio_service: PortfolioService = Depends(get_portfolio_service),
     current_user: FirebaseUser = Depends(get_current_user),
 ):
     """Get portfolio performance over time"""
-    portfolio_service = PortfolioService(db)
-    performance = portfolio_service.get_portfolio_performance(
-        portfolio_id, current_user.uid, start_date, end_date
+    performance = await run_in_threadpool(
+        portfolio_service.get_portfolio_performance,
+        portfolio_id,
+        current_user.uid,
+        start_date,
+        end_date,
     )
     if not performance:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Portfolio not found"
         )
-    return performance
+    return _json_response(performance)
 
 
 @router.get("/{portfolio_id}/dividends", response_model=DividendAnalysis)
 async def get_dividend_analysis(
     portfolio_id: int,
-    db: Session = Depends(get_sync_db),
+    portfolio_service: PortfolioService = Depends(get_portfolio_service),
     current_user: FirebaseUser = Depends(get_current_user),
 ):
     """Get dividend analysis for portfolio"""
-    portfolio_service = PortfolioService(db)
-    analysis = portfolio_service.get_dividend_analysis(portfolio_id, current_user.uid)
+    analysis = await run_in_threadpool(
+        portfolio_service.get_dividend_analysis, portfolio_id, current_user.uid
+    )
     if not analysis:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Portfolio not found"
         )
-    return analysis
+    return _json_response(analysis)
 
 
 @router.get("/{portfolio_id}/allocation", response_model=PortfolioAllocation)
 async def get_asset_allocation(
     portfolio_id: int,
-    db: Session = Depends(get_sync_db),
+    portfolio_service: PortfolioService = Depends(get_portfolio_service),
     current_user: FirebaseUser = Depends(get_current_user),
 ):
     """Get asset allocation breakdown"""
-    portfolio_service = PortfolioService(db)
-    allocation = portfolio_service.get_asset_allocation(portfolio_id, current_user.uid)
+    allocation = await run_in_threadpool(
+        portfolio_service.get_asset_allocation, portfolio_id, current_user.uid
+    )
     if not allocation:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Portfolio not found"
         )
-    return allocation
+    return _json_response(allocation)
+
+
+@router.get("/{portfolio_id}/dashboard", response_model=PortfolioDashboard)
+async def get_portfolio_dashboard(
+    portfolio_id: int,
+    portfolio_service: PortfolioService = Depends(get_portfolio_service),
+    current_user: FirebaseUser = Depends(get_current_user),
+):
+    """Get summary, performance, dividends, allocation and charts in one call"""
+    dashboard = await run_in_threadpool(
+        portfolio_service.get_portfolio_dashboard, portfolio_id, current_user.uid
+    )
+    if not dashboard:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Portfolio not found"
+        )
+    return _json_response(dashboard)
 
 
 # Transaction endpoints
 @router.get("/{portfolio_id}/transactions", response_model=List[Transaction])
 async def get_transactions(
     portfolio_id: int,
-    db: Session = Depends(get_sync_db),
+    portfolio_service: PortfolioService = Depends(get_portfolio_service),
     current_user: FirebaseUser = Depends(get_current_user),
 ):
     """Get all transactions for a portfolio"""
-    portfolio_service = PortfolioService(db)
-    transactions = portfolio_service.get_transactions(portfolio_id, current_user.uid)
+    transactions = await run_in_threadpool(
+        portfolio_service.get_transactions, portfolio_id, current_user.uid
+    )
     return transactions
 
 
+@router.get("/{portfolio_id}/transactions/export")
+async def export_transactions(
+    portfolio_id: int,
+    portfolio_service: PortfolioService = Depends(get_portfolio_service),
+    current_user: FirebaseUser = Depends(get_current_user),
+):
+    """Download the full transaction history as CSV, streamed in chunks"""
+    rows = await run_in_threadpool(
+        portfolio_service.export_transactions_csv, portfolio_id, current_user.uid
+    )
+    if rows is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Portfolio not found"
+        )
+    return StreamingResponse(
+        rows,
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="portfolio-{portfolio_id}-transactions.csv"'
+            )
+        },
+    )
+
+
 @router.post(
     "/{portfolio_id}/transactions",
     response_model=Transaction,
@@ -182,13 +240,15 @@ async def get_transactions(
 async def add_transaction(
     portfolio_id: int,
     transaction_data: TransactionCreate,
-    db: Session = Depends(get_sync_db),
+    portfolio_service: PortfolioService = Depends(get_portfolio_service),
     current_user: FirebaseUser = Depends(get_current_user),
 ):
     """Add a transaction to portfolio"""
-    portfolio_service = PortfolioService(db)
-    transaction = portfolio_service.add_transaction(
-        portfolio_id, current_user.uid, transaction_data
+    transaction = await run_in_threadpool(
+        portfolio_service.add_transaction,
+        portfolio_id,
+        current_user.uid,
+        transaction_data,
     )
     if not transaction:
         raise HTTPException(
@@ -201,13 +261,12 @@ async def add_transaction(
 @router.get("/{portfolio_id}/charts/value", response_model=ChartData)
 async def get_portfolio_value_chart(
     portfolio_id: int,
-    db: Session = Depends(get_sync_db),
+    portfolio_service: PortfolioService = Depends(get_portfolio_service),
     current_user: FirebaseUser = Depends(get_current_user),
 ):
     """Get portfolio value chart data"""
-    portfolio_service = PortfolioService(db)
-    chart_data = portfolio_service.get_portfolio_value_chart(
-        portfolio_id, current_user.uid
+    chart_data = await run_in_threadpool(
+        portfolio_service.get_portfolio_value_chart, portfolio_id, current_user.uid
     )
     if not chart_data:
         raise HTTPException(
@@ -220,12 +279,13 @@ async def get_portfolio_value_chart(
 @router.get("/{portfolio_id}/charts/dividends", response_model=ChartData)
 async def get_dividend_chart(
     portfolio_id: int,
-    db: Session = Depends(get_sync_db),
+    portfolio_service: PortfolioService = Depends(get_portfolio_service),
     current_user: FirebaseUser = Depends(get_current_user),
 ):
     """Get dividend chart data"""
-    portfolio_service = PortfolioService(db)
-    chart_data = portfolio_service.get_dividend_chart(portfolio_id, current_user.uid)
+    chart_data = await run_in_threadpool(
+        portfolio_service.get_dividend_chart, portfolio_id, current_user.uid
+    )
     if not chart_data:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
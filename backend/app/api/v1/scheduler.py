@@ -1,17 +1,88 @@
-from fastapi import APIRouter, HTTPException, status, BackgroundTasks
-from fastapi.responses import JSONResponse
-from typing import Optional, Dict, Any
-from datetime import datetime
+from fastapi import APIRouter, HTTPException, status, BackgroundTasks, Request, Response
+from fastapi.responses import ORJSONResponse
+from typing import Optional, Dict, Any, Callable
 import logging
 
-from app.services.data_scheduler import scheduler, FREDDataScheduler
+import orjson
+from arq.jobs import Job
+
+from app.core.cache import AsyncTTLCache
+from app.core.config import settings
+from app.services.data_scheduler import scheduler, FREDDataScheduler, UpdateFrequency
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Shared by /status and /health so concurrent pollers trigger one status read
+_status_cache = AsyncTTLCache(ttl=settings.scheduler_status_cache_ttl, maxsize=1)
+_STATUS_CACHE_CONTROL = "max-age=1"
+
+
+async def _get_update_status() -> Dict[str, Any]:
+    """Return the scheduler status, cached for a short TTL."""
+    return await _status_cache.get_or_load("status", scheduler.get_update_status)
+
+
+def _build_schedules_payload() -> bytes:
+    """Serialize the static indicator schedule configuration once."""
+    schedules = {
+        code: {
+            "indicator_code": schedule.indicator_code,
+            "frequency": schedule.frequency.value,
+            "release_time": schedule.release_time.strftime("%H:%M"),
+            "release_day": schedule.release_day,
+            "business_days_delay": schedule.business_days_delay,
+        }
+        for code, schedule in FREDDataScheduler.INDICATOR_SCHEDULES.items()
+    }
+
+    return orjson.dumps(
+        {
+            "total_indicators": len(FREDDataScheduler.INDICATOR_SCHEDULES),
+            "schedules": schedules,
+            # 주기별 통계
+            "frequency_statistics": {
+                freq.value: FREDDataScheduler.FREQUENCY_STATS[freq.value]
+                for freq in UpdateFrequency
+            },
+            "timezone": "KST (Korea Standard Time)",
+            "notes": {
+                "daily": "Updated every business day at 6 AM KST",
+                "weekly": "Updated every Thursday at 6 AM KST",
+                "monthly": "Checked daily at 11 PM KST, updated when release date passes",
+            },
+        }
+    )
+
+
+# Schedules never change at runtime, so the response body is built at import
+_SCHEDULES_PAYLOAD = _build_schedules_payload()
+
+
+async def _enqueue_update(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    job_name: str,
+    fallback: Callable,
+    *args: Any,
+) -> Optional[str]:
+    """
+    Enqueue an update job on the ARQ worker and return its id.
+
+    Falls back to an in-process background task (returning None) when the
+    job queue is not configured.
+    """
+    arq_pool = request.app.state.arq
+    if arq_pool is None:
+        background_tasks.add_task(fallback, *args)
+        return None
+
+    job = await arq_pool.enqueue_job(job_name, *args)
+    return job.job_id
+
 
 @router.get("/status")
-async def get_scheduler_status() -> Dict[str, Any]:
+async def get_scheduler_status(request: Request, response: Response) -> Dict[str, Any]:
     """
     Get current status of FRED data scheduler.
 
@@ -21,18 +92,19 @@ async def get_scheduler_status() -> Dict[str, Any]:
     - Indicators count by frequency
     """
     try:
-        status = await scheduler.get_update_status()
+        status_info = await _get_update_status()
+        response.headers["Cache-Control"] = _STATUS_CACHE_CONTROL
 
         return {
             "scheduler_status": "running" if scheduler.running_jobs else "stopped",
-            "total_indicators": status["total_indicators"],
-            "running_jobs": status["running_jobs"],
-            "indicators_by_frequency": status["indicators_by_frequency"],
+            "total_indicators": status_info["total_indicators"],
+            "running_jobs": status_info["running_jobs"],
+            "indicators_by_frequency": status_info["indicators_by_frequency"],
             "last_checks": {
                 code: time.isoformat() if time else None
-                for code, time in status["last_checks"].items()
+                for code, time in status_info["last_checks"].items()
             },
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": request.state.now_iso,
         }
 
     except Exception as e:
@@ -44,7 +116,9 @@ async def get_scheduler_status() -> Dict[str, Any]:
 
 
 @router.post("/start")
-async def start_scheduler(background_tasks: BackgroundTasks) -> JSONResponse:
+async def start_scheduler(
+    request: Request, background_tasks: BackgroundTasks
+) -> ORJSONResponse:
     """
     Start the FRED data scheduler.
 
@@ -55,23 +129,23 @@ async def start_scheduler(background_tasks: BackgroundTasks) -> JSONResponse:
     """
     try:
         if scheduler.running_jobs:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_200_OK,
                 content={
                     "message": "Scheduler is already running",
                     "running_jobs": len(scheduler.running_jobs),
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": request.state.now_iso,
                 },
             )
 
         background_tasks.add_task(scheduler.start_scheduler)
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_200_OK,
             content={
                 "message": "FRED data scheduler started successfully",
                 "scheduled_jobs": ["daily", "weekly", "monthly"],
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": request.state.now_iso,
             },
         )
 
@@ -84,7 +158,7 @@ async def start_scheduler(background_tasks: BackgroundTasks) -> JSONResponse:
 
 
 @router.post("/stop")
-async def stop_scheduler() -> JSONResponse:
+async def stop_scheduler(request: Request) -> ORJSONResponse:
     """
     Stop the FRED data scheduler.
 
@@ -92,21 +166,22 @@ async def stop_scheduler() -> JSONResponse:
     """
     try:
         if not scheduler.running_jobs:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_200_OK,
                 content={
                     "message": "Scheduler is not running",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": request.state.now_iso,
                 },
             )
 
         await scheduler.stop_scheduler()
+        _status_cache.clear()
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_200_OK,
             content={
                 "message": "FRED data scheduler stopped successfully",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": request.state.now_iso,
             },
         )
 
@@ -119,22 +194,30 @@ async def stop_scheduler() -> JSONResponse:
 
 
 @router.post("/update/manual")
-async def manual_update_all(background_tasks: BackgroundTasks) -> JSONResponse:
+async def manual_update_all(
+    request: Request, background_tasks: BackgroundTasks
+) -> ORJSONResponse:
     """
     Manually trigger update for all FRED indicators.
 
     Forces update of all indicators regardless of schedule.
     """
     try:
-        background_tasks.add_task(scheduler.check_all_indicators)
+        job_id = await _enqueue_update(
+            request,
+            background_tasks,
+            "check_all_indicators_task",
+            scheduler.check_all_indicators,
+        )
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_202_ACCEPTED,
             content={
                 "message": "Manual update triggered for all FRED indicators",
+                "job_id": job_id,
                 "total_indicators": len(scheduler.INDICATOR_SCHEDULES),
-                "timestamp": datetime.now().isoformat(),
-                "note": "Update is running in background. Check status endpoint for progress.",
+                "timestamp": request.state.now_iso,
+                "note": "Update is running in background. Poll /jobs/{job_id} for progress when a job_id is returned.",
             },
         )
 
@@ -148,8 +231,8 @@ async def manual_update_all(background_tasks: BackgroundTasks) -> JSONResponse:
 
 @router.post("/update/indicator/{indicator_code}")
 async def force_update_indicator(
-    indicator_code: str, background_tasks: BackgroundTasks
-) -> JSONResponse:
+    indicator_code: str, request: Request, background_tasks: BackgroundTasks
+) -> ORJSONResponse:
     """
     Force update a specific FRED indicator.
 
@@ -162,18 +245,25 @@ async def force_update_indicator(
                 detail=f"Indicator {indicator_code} not found in scheduler configuration",
             )
 
-        background_tasks.add_task(scheduler.force_update_indicator, indicator_code)
+        job_id = await _enqueue_update(
+            request,
+            background_tasks,
+            "force_update_indicator_task",
+            scheduler.force_update_indicator,
+            indicator_code,
+        )
 
         schedule_info = scheduler.INDICATOR_SCHEDULES[indicator_code]
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_202_ACCEPTED,
             content={
                 "message": f"Force update triggered for indicator {indicator_code}",
+                "job_id": job_id,
                 "indicator_code": indicator_code,
                 "frequency": schedule_info.frequency.value,
-                "timestamp": datetime.now().isoformat(),
-                "note": "Update is running in background. Check status endpoint for progress.",
+                "timestamp": request.state.now_iso,
+                "note": "Update is running in background. Poll /jobs/{job_id} for progress when a job_id is returned.",
             },
         )
 
@@ -187,72 +277,58 @@ async def force_update_indicator(
         )
 
 
+@router.get("/jobs/{job_id}")
+async def get_update_job(job_id: str, request: Request) -> Dict[str, Any]:
+    """
+    Get status of a queued FRED update job.
+
+    - **job_id**: Job id returned by the manual/force update endpoints
+    """
+    arq_pool = request.app.state.arq
+    if arq_pool is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Job queue is not configured",
+        )
+
+    job = Job(job_id, arq_pool)
+    job_status = await job.status()
+    result_info = await job.result_info()
+
+    return {
+        "job_id": job_id,
+        "status": job_status.value,
+        "success": result_info.success if result_info else None,
+        "finished_at": (result_info.finish_time.isoformat() if result_info else None),
+    }
+
+
 @router.get("/schedules")
-async def get_indicator_schedules() -> Dict[str, Any]:
+async def get_indicator_schedules() -> Response:
     """
     Get schedule configuration for all FRED indicators.
 
     Returns update frequency and timing for each indicator.
     """
-    try:
-        schedules = {}
-
-        for code, schedule in scheduler.INDICATOR_SCHEDULES.items():
-            schedules[code] = {
-                "indicator_code": schedule.indicator_code,
-                "frequency": schedule.frequency.value,
-                "release_time": schedule.release_time.strftime("%H:%M"),
-                "release_day": schedule.release_day,
-                "business_days_delay": schedule.business_days_delay,
-            }
-
-        # 주기별 통계
-        frequency_stats = {}
-        for freq in ["daily", "weekly", "monthly", "quarterly"]:
-            frequency_stats[freq] = len(
-                [
-                    s
-                    for s in scheduler.INDICATOR_SCHEDULES.values()
-                    if s.frequency.value == freq
-                ]
-            )
-
-        return {
-            "total_indicators": len(scheduler.INDICATOR_SCHEDULES),
-            "schedules": schedules,
-            "frequency_statistics": frequency_stats,
-            "timezone": "KST (Korea Standard Time)",
-            "notes": {
-                "daily": "Updated every business day at 6 AM KST",
-                "weekly": "Updated every Thursday at 6 AM KST",
-                "monthly": "Checked daily at 11 PM KST, updated when release date passes",
-            },
-        }
-
-    except Exception as e:
-        logger.error(f"Error getting indicator schedules: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to get indicator schedules",
-        )
+    return Response(content=_SCHEDULES_PAYLOAD, media_type="application/json")
 
 
 @router.get("/health")
-async def scheduler_health_check() -> JSONResponse:
+async def scheduler_health_check(request: Request) -> ORJSONResponse:
     """
     Health check for FRED data scheduler.
 
     Checks if scheduler is properly configured and running.
     """
     try:
-        status_info = await scheduler.get_update_status()
+        status_info = await _get_update_status()
 
         health_status = {
             "status": "healthy" if scheduler.running_jobs else "idle",
             "configured_indicators": status_info["total_indicators"],
             "running_jobs": status_info["running_jobs"],
             "last_activity": None,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": request.state.now_iso,
         }
 
         # 마지막 활동 시간 찾기
@@ -260,15 +336,19 @@ async def scheduler_health_check() -> JSONResponse:
             latest_check = max(status_info["last_checks"].values())
             health_status["last_activity"] = latest_check.isoformat()
 
-        return JSONResponse(status_code=status.HTTP_200_OK, content=health_status)
+        return ORJSONResponse(
+            status_code=status.HTTP_200_OK,
+            content=health_status,
+            headers={"Cache-Control": _STATUS_CACHE_CONTROL},
+        )
 
     except Exception as e:
         logger.error(f"Scheduler health check failed: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content={
                 "status": "unhealthy",
                 "error": str(e),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": request.state.now_iso,
             },
         )
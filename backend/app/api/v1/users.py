@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_sync_db
+from app.core.database import get_db
 from app.core.auth import get_current_user, FirebaseUser
 from app.services.user_service import UserService
 from app.schemas.user import UserResponse, UserUpdate, UserProfile
@@ -12,14 +12,14 @@ router = APIRouter(prefix="/api/v1/users", tags=["users"])
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
-    db: Session = Depends(get_sync_db),
+    db: AsyncSession = Depends(get_db),
     current_user: FirebaseUser = Depends(get_current_user),
 ):
     """현재 로그인한 사용자 정보 조회"""
     user_service = UserService(db)
 
     # Firebase 사용자 정보에서 DB 사용자 정보 가져오거나 생성
-    db_user = user_service.get_or_create_user_from_firebase(current_user)
+    db_user = await user_service.get_or_create_user_from_firebase(current_user)
 
     return db_user
 
@@ -27,20 +27,22 @@ async def get_current_user_info(
 @router.put("/me", response_model=UserResponse)
 async def update_current_user(
     user_data: UserUpdate,
-    db: Session = Depends(get_sync_db),
+    db: AsyncSession = Depends(get_db),
     current_user: FirebaseUser = Depends(get_current_user),
 ):
     """현재 로그인한 사용자 정보 업데이트"""
     user_service = UserService(db)
 
     # 사용자가 존재하는지 확인
-    existing_user = user_service.get_user_by_uid(current_user.uid)
+    existing_user = await user_service.get_user_by_uid(current_user.uid)
     if not existing_user:
         # 사용자가 없으면 먼저 생성
-        existing_user = user_service.get_or_create_user_from_firebase(current_user)
+        existing_user = await user_service.get_or_create_user_from_firebase(
+            current_user
+        )
 
     # 사용자 정보 업데이트
-    updated_user = user_service.update_user(current_user.uid, user_data)
+    updated_user = await user_service.update_user(current_user.uid, user_data)
     if not updated_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다."
@@ -52,12 +54,12 @@ async def update_current_user(
 @router.get("/profile/{uid}", response_model=UserProfile)
 async def get_user_profile(
     uid: str,
-    db: Session = Depends(get_sync_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """사용자 공개 프로필 조회"""
     user_service = UserService(db)
 
-    user = user_service.get_user_by_uid(uid)
+    user = await user_service.get_user_by_uid(uid)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다."
@@ -71,18 +73,16 @@ async def get_user_profile(
     return user
 
 
-@router.delete("/me")
+@router.delete("/me", status_code=status.HTTP_204_NO_CONTENT)
 async def deactivate_current_user(
-    db: Session = Depends(get_sync_db),
+    db: AsyncSession = Depends(get_db),
     current_user: FirebaseUser = Depends(get_current_user),
 ):
     """현재 로그인한 사용자 계정 비활성화"""
     user_service = UserService(db)
 
-    success = user_service.deactivate_user(current_user.uid)
+    success = await user_service.deactivate_user(current_user.uid)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다."
         )
-
-    return {"message": "계정이 비활성화되었습니다."}
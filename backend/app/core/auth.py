@@ -1,18 +1,24 @@
 import os
 import json
-from typing import Optional
+import hashlib
+import time
+from typing import Any, Dict, Optional
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from starlette.concurrency import run_in_threadpool
 import firebase_admin
 from firebase_admin import credentials, auth
 import logging
 
+from app.core.cache import AsyncTTLCache
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 
 # Initialize Firebase Admin SDK
 def initialize_firebase():
-    """Initialize Firebase Admin SDK"""
+    """Initialize Firebase Admin SDK (called from the app lifespan; idempotent)"""
     if firebase_admin._apps:
         return
 
@@ -41,16 +47,21 @@ def initialize_firebase():
         raise
 
 
-# Initialize Firebase on module import
-initialize_firebase()
-
-# Security scheme
+# Security schemes (module-level so every request shares the same instances)
 security = HTTPBearer()
+_optional_security = HTTPBearer(auto_error=False)
+
+# Verified tokens, keyed by sha256(token) so raw tokens are never held in memory
+_token_cache = AsyncTTLCache(
+    ttl=settings.auth_token_cache_ttl, maxsize=settings.auth_token_cache_size
+)
 
 
 class FirebaseUser:
     """Firebase user information"""
 
+    __slots__ = ("uid", "email", "name")
+
     def __init__(
         self, uid: str, email: Optional[str] = None, name: Optional[str] = None
     ):
@@ -59,6 +70,19 @@ class FirebaseUser:
         self.name = name
 
 
+def _token_cache_key(token: str) -> bytes:
+    """Return the cache key for an ID token."""
+    return hashlib.sha256(token.encode()).digest()
+
+
+def _token_cache_ttl(decoded_token: Dict[str, Any]) -> float:
+    """Cache a verified token no longer than its remaining lifetime."""
+    expires_at = decoded_token.get("exp")
+    if expires_at is None:
+        return 0
+    return min(expires_at - time.time(), settings.auth_token_cache_ttl)
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> FirebaseUser:
@@ -76,9 +100,17 @@ async def get_current_user(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Firebase is not initialized on the server.",
         )
+
+    cache_key = _token_cache_key(credentials.credentials)
+    cached_user = _token_cache.get(cache_key)
+    if cached_user is not None:
+        return cached_user
+
     try:
-        # Verify the ID token
-        decoded_token = auth.verify_id_token(credentials.credentials)
+        # Verify the ID token (crypto + occasional cert fetch, so off the loop)
+        decoded_token = await run_in_threadpool(
+            auth.verify_id_token, credentials.credentials
+        )
 
         # Extract basic user information
         uid = decoded_token.get("uid")
@@ -90,7 +122,7 @@ async def get_current_user(
 
         # Get additional user information from Firebase Admin SDK
         try:
-            user_record = auth.get_user(uid)
+            user_record = await run_in_threadpool(auth.get_user, uid)
             name = user_record.display_name
             email = user_record.email
         except Exception as e:
@@ -104,7 +136,11 @@ async def get_current_user(
                 or "User"
             )
 
-        return FirebaseUser(uid=uid, email=email, name=name)
+        firebase_user = FirebaseUser(uid=uid, email=email, name=name)
+        ttl = _token_cache_ttl(decoded_token)
+        if ttl > 0:
+            _token_cache.set(cache_key, firebase_user, ttl=ttl)
+        return firebase_user
 
     except auth.InvalidIdTokenError:
         raise HTTPException(
@@ -140,9 +176,7 @@ async def get_current_user(
 
 # Optional dependency for endpoints that can work with or without auth
 async def get_current_user_optional(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(
-        HTTPBearer(auto_error=False)
-    ),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_optional_security),
 ) -> Optional[FirebaseUser]:
     """
     Optional authentication - returns None if no token provided
@@ -0,0 +1,94 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent awaits for the same key into one in-flight call.
+
+    Nothing is kept once the call settles; pair it with a cache when results
+    should outlive the burst.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def run(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Await loader(), or join the call already running for key."""
+        task = self._inflight.get(key)
+        if task is None:
+            # The load runs in its own task, so cancelling whichever caller
+            # started it does not cancel the callers that joined it
+            task = asyncio.ensure_future(loader())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._settle(key, done))
+        return await asyncio.shield(task)
+
+    def _settle(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished load."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark retrieved so a failure nobody is left awaiting doesn't warn at GC
+        if not task.cancelled():
+            task.exception()
+
+
+class AsyncTTLCache:
+    """
+    In-process TTL cache with single-flight loading.
+
+    Concurrent callers that miss on the same key share one in-flight load
+    instead of each hitting the upstream provider.
+    """
+
+    def __init__(self, ttl: float, maxsize: Optional[int] = None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._loads = SingleFlight()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key for ttl seconds (defaults to the cache TTL)."""
+        if ttl is None:
+            ttl = self.ttl
+        self._entries.pop(key, None)
+        if self.maxsize is not None and len(self._entries) >= self.maxsize:
+            # Dicts keep insertion order, so the first key is the oldest write
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value or load it once for all concurrent callers."""
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        async def load_and_store() -> Any:
+            loaded = await loader()
+            self.set(key, loaded)
+            return loaded
+
+        return await self._loads.run(key, load_and_store)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single key."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
@@ -1,9 +1,14 @@
-from typing import List, Optional
-import os
+from functools import lru_cache
+from typing import List, Optional, Union
 
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-class Settings:
-    """Application settings with environment variable support."""
+
+class Settings(BaseSettings):
+    """Application settings, overridable by environment variables or .env."""
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
     # Application
     app_name: str = "Macro Finance Dashboard API"
@@ -12,11 +17,29 @@ class Settings:
 
     # API
     api_v1_prefix: str = "/api/v1"
-    cors_origins: List[str] = ["http://localhost:3000"]
+    # Accepts a comma-separated string (CORS_ORIGINS=a,b) or a JSON list
+    cors_origins: Union[List[str], str] = ["http://localhost:3000"]
 
     # Database
     database_url: str = "postgresql+asyncpg://postgres:postgres@db:5432/macro_finance"
 
+    # Connection pool (per engine, per process)
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    # The sync engine is only used from the threadpool (40 threads by default),
+    # so it never needs more connections than that
+    db_sync_pool_size: int = 10
+    db_sync_max_overflow: int = 30
+    db_pool_recycle: int = 1800  # seconds
+    db_pool_pre_ping: bool = False
+    db_statement_cache_size: int = 500  # asyncpg prepared statements per connection
+
+    # SQL statement logging, independent of DEBUG (set SQL_ECHO=true explicitly)
+    sql_echo: bool = False
+
+    # Run Base.metadata.create_all on startup; disable where Alembic owns the schema
+    db_create_all: bool = True
+
     # Redis
     redis_url: str = "redis://redis:6379"
 
@@ -36,26 +59,30 @@ class Settings:
     # Data refresh settings
     market_data_cache_ttl: int = 60  # 1 minute
     economic_data_cache_ttl: int = 3600  # 1 hour
+    market_response_cache_ttl: int = 15  # 15 seconds (in-process router cache)
+    response_cache_size: int = 512  # entries per in-process router cache
+    health_probe_cache_ttl: int = 10  # 10 seconds (last successful health probe)
+    scheduler_status_cache_ttl: float = 1.5  # coalesces dashboard pollers
+    auth_token_cache_ttl: int = 300  # 5 minutes (capped by the token's own exp)
+    auth_token_cache_size: int = 10_000
+
+    # Outbound concurrency caps (shared across requests)
+    fred_max_concurrency: int = 20
+    market_max_concurrency: int = 50
+
+    @field_validator("cors_origins", mode="before")
+    @classmethod
+    def split_cors_origins(cls, value):
+        if isinstance(value, str):
+            return [origin.strip() for origin in value.split(",")]
+        return value
+
 
-    def __init__(self):
-        # Override with environment variables if they exist
-        if os.getenv("DATABASE_URL"):
-            self.database_url = os.getenv("DATABASE_URL")
-        if os.getenv("REDIS_URL"):
-            self.redis_url = os.getenv("REDIS_URL")
-        if os.getenv("SECRET_KEY"):
-            self.secret_key = os.getenv("SECRET_KEY")
-        if os.getenv("DEBUG"):
-            self.debug = os.getenv("DEBUG").lower() == "true"
-        if os.getenv("CORS_ORIGINS"):
-            self.cors_origins = [
-                origin.strip() for origin in os.getenv("CORS_ORIGINS").split(",")
-            ]
-        if os.getenv("FRED_API_KEY"):
-            self.fred_api_key = os.getenv("FRED_API_KEY")
-        if os.getenv("ALPHA_VANTAGE_API_KEY"):
-            self.alpha_vantage_api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings (use as a dependency to override in tests)."""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
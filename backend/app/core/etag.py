@@ -0,0 +1,62 @@
+import hashlib
+from typing import Any, Awaitable, Callable, Hashable, Tuple
+
+import orjson
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from app.core.cache import AsyncTTLCache
+
+
+def serialize_payload(payload: Any) -> bytes:
+    """Serialize a service payload (Pydantic model or plain data) to JSON bytes."""
+    if isinstance(payload, bytes):
+        # Already serialized by the service (e.g. passed through from Redis)
+        return payload
+    if isinstance(payload, BaseModel):
+        return payload.model_dump_json().encode()
+    return orjson.dumps(payload, default=str)
+
+
+def compute_etag(body: bytes) -> str:
+    """Return a strong ETag for a serialized response body."""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header covers etag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in header.split(","))
+    return etag in candidates
+
+
+async def cached_response_with_etag(
+    cache: AsyncTTLCache,
+    key: Hashable,
+    loader: Callable[[], Awaitable[Any]],
+    request: Request,
+    max_age: int = 60,
+) -> Response:
+    """
+    Serve a cached, pre-serialized payload with ETag revalidation.
+
+    The body and its ETag are computed once per cache load, so repeat hits
+    skip response_model validation and JSON encoding entirely. Returns a
+    bare 304 response when the client copy is current.
+    """
+
+    async def load_serialized() -> Tuple[bytes, str]:
+        body = serialize_payload(await loader())
+        return body, compute_etag(body)
+
+    body, etag = await cache.get_or_load(key, load_serialized)
+    headers = {"ETag": etag, "Cache-Control": f"max-age={max_age}"}
+
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,22 @@
+from datetime import datetime, timezone
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class RequestTimestampMiddleware:
+    """
+    Stamp each HTTP request with a single UTC ISO timestamp.
+
+    Handlers read it as `request.state.now_iso` instead of formatting
+    `datetime.now()` on every response path. Pure ASGI, so it adds no
+    per-request task the way BaseHTTPMiddleware does.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            state = scope.setdefault("state", {})
+            state["now_iso"] = datetime.now(timezone.utc).isoformat()
+        await self.app(scope, receive, send)
@@ -1,16 +1,27 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+import asyncio
+import dataclasses
 import logging
+import httpx
+import orjson
 import uvicorn
+from arq import create_pool
 
+from app.core.auth import initialize_firebase
 from app.core.config import settings
-from app.core.database import create_tables
+from app.core.database import init_db
+from app.core.middleware import RequestTimestampMiddleware
 from app.api.v1.market import router as market_router
 from app.api.v1.economic import router as economic_router
 from app.api.v1.scheduler import router as scheduler_router
 from app.api.v1.portfolio import router as portfolio_router
+from app.api.v1.users import router as users_router
+from app.services.data_scheduler import scheduler
+from app.workers.arq_config import redis_settings
 
 # Configure logging
 logging.basicConfig(
@@ -19,6 +30,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# DEBUG lowers the root level, which would otherwise make SQLAlchemy log every
+# statement; keep engine logging opt-in via SQL_ECHO
+if not settings.sql_echo:
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -26,17 +42,50 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up Macro Finance Dashboard API...")
 
-    # Initialize database
+    # Firebase Admin SDK (kept out of import so scripts/migrations skip it)
+    initialize_firebase()
+
+    # Initialize database (production runs `alembic upgrade head` instead)
+    if settings.db_create_all:
+        try:
+            await init_db()
+            logger.info("Database initialized successfully")
+        except Exception as e:
+            logger.error(f"Failed to initialize database: {e}")
+
+    # Shared outbound HTTP client (keep-alive pool for FRED / market providers)
+    app.state.http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        http2=True,
+        timeout=30.0,
+    )
+    # Process-wide caps so bursts of requests can't stampede upstream APIs
+    app.state.fred_semaphore = asyncio.Semaphore(settings.fred_max_concurrency)
+    app.state.market_semaphore = asyncio.Semaphore(settings.market_max_concurrency)
+    # In-process scheduler runs share the same client instead of opening one
+    await scheduler.open_http_client(app.state.http_client)
+
+    # Job queue for FRED updates; without Redis, updates run in-process
     try:
-        create_tables()
-        logger.info("Database initialized successfully")
+        app.state.arq = await create_pool(
+            dataclasses.replace(redis_settings, conn_retries=0)
+        )
+        logger.info("ARQ job queue connected")
     except Exception as e:
-        logger.error(f"Failed to initialize database: {e}")
+        logger.warning(f"ARQ job queue unavailable, using in-process tasks: {e}")
+        app.state.arq = None
+    # Updates may run in the ARQ worker, so status reads go through Redis
+    scheduler.use_redis(app.state.arq)
 
     yield
 
     # Shutdown
     logger.info("Shutting down Macro Finance Dashboard API...")
+    await scheduler.close_http_client()
+    scheduler.use_redis(None)
+    await app.state.http_client.aclose()
+    if app.state.arq is not None:
+        await app.state.arq.close()
 
 
 # Create FastAPI application
@@ -47,6 +96,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -59,13 +109,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress the large indicator/overview payloads; tiny bodies aren't worth it
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# One timestamp per request for handlers that echo the response time
+app.add_middleware(RequestTimestampMiddleware)
+
 
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler for unhandled exceptions."""
     logger.error(f"Global exception handler caught: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
@@ -74,29 +130,38 @@ async def global_exception_handler(request, exc):
     )
 
 
-# Health check endpoint
-@app.get("/health")
-async def health_check():
-    """Application health check endpoint."""
-    return {
+# Liveness/root bodies only depend on settings, so serialize them once
+_HEALTH_BYTES = orjson.dumps(
+    {
         "status": "healthy",
         "service": settings.app_name,
         "version": settings.app_version,
         "environment": "development" if settings.debug else "production",
     }
-
-
-# Root endpoint
-@app.get("/")
-async def root():
-    """Root endpoint with API information."""
-    return {
+)
+_ROOT_BYTES = orjson.dumps(
+    {
         "message": "Welcome to Macro Finance Dashboard API",
         "version": settings.app_version,
         "docs": "/docs",
         "redoc": "/redoc",
         "api_v1": settings.api_v1_prefix,
     }
+)
+
+
+# Health check endpoint
+@app.get("/health")
+async def health_check():
+    """Application health check endpoint."""
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
+
+
+# Root endpoint
+@app.get("/")
+async def root():
+    """Root endpoint with API information."""
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 # Include API routers
@@ -110,10 +175,6 @@ app.include_router(
     prefix=f"{settings.api_v1_prefix}/scheduler",
     tags=["Data Scheduler"],
 )
-
-# User management router
-from app.api.v1.users import router as users_router
-
 app.include_router(users_router, tags=["Users"])
 
 # Future routers (placeholder for extension)
@@ -126,5 +187,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.debug,
+        loop="auto",  # uvloop when installed, asyncio otherwise (e.g. Windows)
         log_level="info",
     )
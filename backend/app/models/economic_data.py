@@ -1,6 +1,9 @@
 from sqlalchemy import Column, Integer, Float, String, DateTime, Text, Index
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import func
 from datetime import datetime
+from typing import Any, Dict, List
 
 from app.core.database import Base
 
@@ -61,13 +64,60 @@ class EconomicIndicatorRecord(Base):
     # 추가 정보
     notes = Column(Text, nullable=True, comment="지표 관련 메모")
 
-    # 인덱스 설정
+    # 인덱스 설정 (INCLUDE 컬럼으로 시계열 조회를 index-only scan으로 처리)
     __table_args__ = (
-        Index("idx_indicator_date", "indicator_code", "data_date"),
-        Index("idx_category_date", "category", "data_date"),
+        # 지표별 기준일당 한 행 (bulk_upsert의 ON CONFLICT 대상)
+        Index(
+            "idx_indicator_date",
+            "indicator_code",
+            "data_date",
+            unique=True,
+            postgresql_include=["value", "change", "change_percent"],
+        ),
+        Index(
+            "idx_category_date",
+            "category",
+            "data_date",
+            postgresql_include=["value"],
+        ),
         Index("idx_timestamp", "timestamp"),
     )
 
+    UPSERT_KEYS = ("indicator_code", "data_date")
+
+    @classmethod
+    async def bulk_upsert(
+        cls,
+        session: AsyncSession,
+        rows: List[Dict[str, Any]],
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        (indicator_code, data_date) 기준으로 여러 행을 배치 단위로 upsert.
+
+        PostgreSQL의 INSERT ... ON CONFLICT DO UPDATE를 배치당 한 번 실행하므로
+        행 단위 INSERT 대비 왕복 횟수가 크게 줄어든다. 커밋은 호출자가 담당.
+        """
+        if not rows:
+            return 0
+
+        update_columns = [
+            key for key in rows[0] if key not in cls.UPSERT_KEYS and key != "id"
+        ]
+
+        for start in range(0, len(rows), batch_size):
+            stmt = insert(cls).values(rows[start : start + batch_size])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(cls.UPSERT_KEYS),
+                set_={
+                    **{column: stmt.excluded[column] for column in update_columns},
+                    "last_updated": func.now(),
+                },
+            )
+            await session.execute(stmt)
+
+        return len(rows)
+
     def __repr__(self):
         return f"<EconomicIndicator(code={self.indicator_code}, value={self.value}, date={self.data_date})>"
 
@@ -89,9 +139,7 @@ class IndicatorUpdateLog(Base):
 
     # 업데이트 결과
     records_updated = Column(Integer, default=0, comment="업데이트된 레코드 수")
-    latest_data_date = Column(
-        DateTime, nullable=True, comment="가장 최신 데이터의 기준일"
-    )
+    latest_data_date = Column(DateTime, nullable=True, comment="가장 최신 데이터의 기준일")
     error_message = Column(Text, nullable=True, comment="오류 메시지 (실패시)")
 
     # 시간 정보
@@ -103,6 +151,7 @@ class IndicatorUpdateLog(Base):
     __table_args__ = (
         Index("idx_update_indicator_date", "indicator_code", "started_at"),
         Index("idx_update_status", "status", "started_at"),
+        Index("idx_update_status_indicator", "status", "indicator_code", "started_at"),
     )
 
     def __repr__(self):
@@ -131,9 +180,7 @@ class DataQualityCheck(Base):
     # 체크 결과
     status = Column(String(50), nullable=False, comment="pass, warning, fail")
     message = Column(Text, nullable=False, comment="체크 결과 메시지")
-    affected_data_date = Column(
-        DateTime, nullable=True, comment="문제가 발견된 데이터 기준일"
-    )
+    affected_data_date = Column(DateTime, nullable=True, comment="문제가 발견된 데이터 기준일")
 
     # 시간 정보
     checked_at = Column(DateTime, default=func.now(), comment="체크 수행 시각")
@@ -0,0 +1,73 @@
+from sqlalchemy import (
+    DDL,
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    Table,
+    event,
+    text,
+)
+
+from app.core.database import engine
+from app.models.portfolio import Amount, Transaction
+
+PORTFOLIO_DAILY_VIEW = "mv_portfolio_daily"
+
+# Net cash invested (buys minus sells) and dividends per portfolio per day
+PORTFOLIO_DAILY_SELECT = """
+SELECT portfolio_id,
+       date_trunc('day', transaction_date) AS day,
+       SUM(CASE transaction_type
+               WHEN 'buy' THEN total_amount
+               WHEN 'sell' THEN -total_amount
+               ELSE 0 END) AS invested,
+       SUM(CASE WHEN transaction_type = 'dividend' THEN total_amount ELSE 0 END)
+           AS dividends
+FROM transactions
+GROUP BY 1, 2
+"""
+
+# Kept out of Base.metadata so create_all never builds it as a table
+portfolio_daily = Table(
+    PORTFOLIO_DAILY_VIEW,
+    MetaData(),
+    Column("portfolio_id", Integer, primary_key=True),
+    Column("day", DateTime(timezone=True), primary_key=True),
+    Column("invested", Amount),
+    Column("dividends", Amount),
+)
+
+# Mirror the Alembic migration for databases built with create_all
+event.listen(
+    Transaction.__table__,
+    "after_create",
+    DDL(
+        f"CREATE MATERIALIZED VIEW IF NOT EXISTS {PORTFOLIO_DAILY_VIEW} AS "
+        f"{PORTFOLIO_DAILY_SELECT}"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Transaction.__table__,
+    "after_create",
+    # The unique index is what allows REFRESH ... CONCURRENTLY
+    DDL(
+        f"CREATE UNIQUE INDEX IF NOT EXISTS ix_{PORTFOLIO_DAILY_VIEW}_portfolio_day "
+        f"ON {PORTFOLIO_DAILY_VIEW} (portfolio_id, day)"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Transaction.__table__,
+    "before_drop",
+    DDL(f"DROP MATERIALIZED VIEW IF EXISTS {PORTFOLIO_DAILY_VIEW}").execute_if(
+        dialect="postgresql"
+    ),
+)
+
+
+async def refresh_portfolio_daily() -> None:
+    """Rebuild the daily rollup without blocking readers."""
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {PORTFOLIO_DAILY_VIEW}")
+        )
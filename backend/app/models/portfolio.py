@@ -3,18 +3,29 @@ from sqlalchemy import (
     Integer,
     String,
     Float,
+    Numeric,
     DateTime,
     Boolean,
+    DDL,
     ForeignKey,
     Text,
     Enum,
+    Index,
+    event,
+    text,
 )
 from sqlalchemy.orm import relationship
+from sqlalchemy.schema import AddConstraint
 from sqlalchemy.sql import func
 import enum
 from app.core.database import Base
 
 
+# Exact decimal storage for money and share quantities, so SUMs in the
+# database don't drift; values still reach Python as float
+Amount = Numeric(20, 8, asdecimal=False)
+
+
 class TransactionType(enum.Enum):
     buy = "buy"
     sell = "sell"
@@ -31,7 +42,7 @@ class Portfolio(Base):
     __tablename__ = "portfolios"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(String, ForeignKey("users.uid"), index=True)
+    user_id = Column(String, ForeignKey("users.uid", ondelete="CASCADE"), index=True)
     name = Column(String(200), nullable=False)
     description = Column(Text)
     base_currency = Column(String(3), default="USD")
@@ -42,13 +53,20 @@ class Portfolio(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
-    # Relationships
+    # Relationships; child rows are removed by ON DELETE CASCADE, so deleting
+    # a portfolio doesn't load its history first
     user = relationship("User", back_populates="portfolios")
     holdings = relationship(
-        "Holding", back_populates="portfolio", cascade="all, delete-orphan"
+        "Holding",
+        back_populates="portfolio",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     transactions = relationship(
-        "Transaction", back_populates="portfolio", cascade="all, delete-orphan"
+        "Transaction",
+        back_populates="portfolio",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
@@ -56,11 +74,13 @@ class Holding(Base):
     __tablename__ = "holdings"
 
     id = Column(Integer, primary_key=True, index=True)
-    portfolio_id = Column(Integer, ForeignKey("portfolios.id"), nullable=False)
+    portfolio_id = Column(
+        Integer, ForeignKey("portfolios.id", ondelete="CASCADE"), nullable=False
+    )
     symbol = Column(String(20), nullable=False)
     company_name = Column(String(200))
-    quantity = Column(Float, nullable=False, default=0.0)
-    average_cost = Column(Float, nullable=False, default=0.0)
+    quantity = Column(Amount, nullable=False, default=0.0)
+    average_cost = Column(Amount, nullable=False, default=0.0)
     sector = Column(String(100))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -69,20 +89,33 @@ class Holding(Base):
     portfolio = relationship("Portfolio", back_populates="holdings")
     transactions = relationship("Transaction", back_populates="holding")
 
+    # One holding per symbol per portfolio; also serves every holding lookup
+    __table_args__ = (
+        Index("ix_holdings_portfolio_symbol", "portfolio_id", "symbol", unique=True),
+        # Open positions only; closed-out rows stay out of the index
+        Index(
+            "ix_holdings_active",
+            "portfolio_id",
+            postgresql_where=text("quantity > 0"),
+        ),
+    )
+
 
 class Transaction(Base):
     __tablename__ = "transactions"
 
     id = Column(Integer, primary_key=True, index=True)
-    portfolio_id = Column(Integer, ForeignKey("portfolios.id"), nullable=False)
+    portfolio_id = Column(
+        Integer, ForeignKey("portfolios.id", ondelete="CASCADE"), nullable=False
+    )
     holding_id = Column(Integer, ForeignKey("holdings.id"))
     symbol = Column(String(20), nullable=False)
     transaction_type = Column(Enum(TransactionType), nullable=False)
-    quantity = Column(Float, nullable=False)
-    price = Column(Float, nullable=False)
-    total_amount = Column(Float, nullable=False)  # quantity * price + fees
-    fees = Column(Float, default=0.0)
-    dividend_per_share = Column(Float)  # For dividend transactions
+    quantity = Column(Amount, nullable=False)
+    price = Column(Amount, nullable=False)
+    total_amount = Column(Amount, nullable=False)  # quantity * price + fees
+    fees = Column(Amount, default=0.0)
+    dividend_per_share = Column(Amount)  # For dividend transactions
     transaction_date = Column(DateTime(timezone=True), nullable=False)
     notes = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -91,17 +124,82 @@ class Transaction(Base):
     portfolio = relationship("Portfolio", back_populates="transactions")
     holding = relationship("Holding", back_populates="transactions")
 
+    # On PostgreSQL the table is hash-partitioned by portfolio_id (migration
+    # 8a1e6b4d9f25, or _partition_transactions under create_all), so queries
+    # should always filter on portfolio_id to prune to a single partition
+    __table_args__ = (
+        # Paginated history, newest first
+        Index("ix_tx_portfolio_date", "portfolio_id", "transaction_date"),
+        # Per-type filters and the grouped totals
+        Index(
+            "ix_tx_portfolio_type_date",
+            "portfolio_id",
+            "transaction_type",
+            "transaction_date",
+        ),
+        Index("ix_tx_portfolio_symbol", "portfolio_id", "symbol"),
+    )
+
+
+TRANSACTION_PARTITIONS = 16
+
+
+def _partition_transactions(target, connection, **kw) -> None:
+    """
+    Rebuild a freshly created transactions table as hash partitions.
+
+    Mirrors migration 8a1e6b4d9f25 for databases built with create_all,
+    including the (id, portfolio_id) primary key. The table is still empty,
+    so nothing is copied.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+
+    statements = [
+        "CREATE TABLE transactions_partitioned "
+        "(LIKE transactions INCLUDING DEFAULTS) PARTITION BY HASH (portfolio_id)",
+        *(
+            f"CREATE TABLE transactions_p{remainder} "
+            f"PARTITION OF transactions_partitioned FOR VALUES WITH "
+            f"(MODULUS {TRANSACTION_PARTITIONS}, REMAINDER {remainder})"
+            for remainder in range(TRANSACTION_PARTITIONS)
+        ),
+        "ALTER TABLE transactions_partitioned ADD PRIMARY KEY (id, portfolio_id)",
+        # Keep the id sequence alive when the plain table is dropped
+        "ALTER SEQUENCE transactions_id_seq OWNED BY NONE",
+        "DROP TABLE transactions",
+        "ALTER TABLE transactions_partitioned RENAME TO transactions",
+        "ALTER TABLE transactions "
+        "RENAME CONSTRAINT transactions_partitioned_pkey TO transactions_pkey",
+        "ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id",
+    ]
+    for statement in statements:
+        connection.execute(DDL(statement))
+
+    # LIKE copies neither foreign keys nor indexes
+    for constraint in target.foreign_key_constraints:
+        connection.execute(AddConstraint(constraint))
+    for index in target.indexes:
+        index.create(connection)
+
+
+# Registered before materialized_views' listeners, so the view is built on
+# the partitioned table
+event.listen(Transaction.__table__, "after_create", _partition_transactions)
+
 
 class PortfolioSnapshot(Base):
     __tablename__ = "portfolio_snapshots"
 
     id = Column(Integer, primary_key=True, index=True)
-    portfolio_id = Column(Integer, ForeignKey("portfolios.id"), nullable=False)
+    portfolio_id = Column(
+        Integer, ForeignKey("portfolios.id", ondelete="CASCADE"), nullable=False
+    )
     snapshot_date = Column(DateTime(timezone=True), nullable=False)
-    total_value = Column(Float, nullable=False)
-    total_invested = Column(Float, nullable=False)
-    total_dividends = Column(Float, nullable=False)
-    total_return = Column(Float, nullable=False)
+    total_value = Column(Amount, nullable=False)
+    total_invested = Column(Amount, nullable=False)
+    total_dividends = Column(Amount, nullable=False)
+    total_return = Column(Amount, nullable=False)
     return_percentage = Column(Float, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
@@ -110,16 +208,18 @@ class DividendPayment(Base):
     __tablename__ = "dividend_payments"
 
     id = Column(Integer, primary_key=True, index=True)
-    portfolio_id = Column(Integer, ForeignKey("portfolios.id"), nullable=False)
+    portfolio_id = Column(
+        Integer, ForeignKey("portfolios.id", ondelete="CASCADE"), nullable=False
+    )
     symbol = Column(String(20), nullable=False)
     payment_date = Column(DateTime(timezone=True), nullable=False)
     ex_dividend_date = Column(DateTime(timezone=True))
-    quantity_held = Column(Float, nullable=False)
-    dividend_per_share = Column(Float, nullable=False)
-    total_dividend = Column(Float, nullable=False)
+    quantity_held = Column(Amount, nullable=False)
+    dividend_per_share = Column(Amount, nullable=False)
+    total_dividend = Column(Amount, nullable=False)
     is_reinvested = Column(Boolean, default=False)
-    reinvested_shares = Column(Float, default=0.0)
-    reinvested_price = Column(Float)
+    reinvested_shares = Column(Amount, default=0.0)
+    reinvested_price = Column(Amount)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
@@ -127,7 +227,9 @@ class PortfolioMetrics(Base):
     __tablename__ = "portfolio_metrics"
 
     id = Column(Integer, primary_key=True, index=True)
-    portfolio_id = Column(Integer, ForeignKey("portfolios.id"), nullable=False)
+    portfolio_id = Column(
+        Integer, ForeignKey("portfolios.id", ondelete="CASCADE"), nullable=False
+    )
     metric_date = Column(DateTime(timezone=True), nullable=False)
 
     # Performance Metrics
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Text
+from sqlalchemy import Column, String, Boolean, DateTime, Index, Text, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -16,8 +16,12 @@ class User(Base):
     uid = Column(String(128), primary_key=True, index=True, comment="Firebase UID")
 
     # Relationships
+    # 포트폴리오는 DB의 ON DELETE CASCADE로 삭제 (자식 행을 미리 로드하지 않음)
     portfolios = relationship(
-        "Portfolio", back_populates="user", cascade="all, delete-orphan"
+        "Portfolio",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     # 기본 정보
@@ -45,11 +49,12 @@ class User(Base):
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), comment="계정 생성일"
     )
-    updated_at = Column(
-        DateTime(timezone=True), onupdate=func.now(), comment="마지막 수정일"
-    )
-    last_login_at = Column(
-        DateTime(timezone=True), nullable=True, comment="마지막 로그인일"
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), comment="마지막 수정일")
+    last_login_at = Column(DateTime(timezone=True), nullable=True, comment="마지막 로그인일")
+
+    # 활성 사용자 조회용 부분 인덱스 (비활성 계정은 인덱스에서 제외)
+    __table_args__ = (
+        Index("ix_users_active", "uid", postgresql_where=text("is_active")),
     )
 
     def __repr__(self):
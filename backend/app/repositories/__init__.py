@@ -1,4 +1,4 @@
-from .base_repository import BaseRepository
+from .base_repository import BaseRepository, AsyncBaseRepository
 from .user_repository import UserRepository
 from .portfolio_repository import (
     PortfolioRepository,
@@ -9,6 +9,7 @@ from .portfolio_repository import (
 
 __all__ = [
     "BaseRepository",
+    "AsyncBaseRepository",
     "UserRepository",
     "PortfolioRepository",
     "HoldingRepository",
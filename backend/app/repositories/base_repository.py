@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import List, Optional, TypeVar, Generic, Type, Dict, Any
+from sqlalchemy import func, inspect, literal, select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 ModelType = TypeVar("ModelType")
@@ -8,8 +11,29 @@ CreateSchemaType = TypeVar("CreateSchemaType")
 UpdateSchemaType = TypeVar("UpdateSchemaType")
 
 
+@lru_cache(maxsize=None)
+def _column_attributes(model: type) -> Dict[str, Any]:
+    """Map each mapped column name to its attribute; built once per model"""
+    return {attr.key: getattr(model, attr.key) for attr in inspect(model).column_attrs}
+
+
+def _filter_conditions(model: type, filters: Dict[str, Any]) -> List[Any]:
+    """Build equality conditions for the filters that name model columns"""
+    columns = _column_attributes(model)
+    return [
+        columns[field] == value
+        for field, value in filters.items()
+        if value is not None and field in columns
+    ]
+
+
 class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC):
-    """Base repository class with common CRUD operations"""
+    """
+    Base repository class with common CRUD operations.
+
+    Writes only flush; the calling service commits once per use case so
+    several repository writes land in one transaction.
+    """
 
     def __init__(self, db: Session, model: Type[ModelType]):
         self.db = db
@@ -23,23 +47,19 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
         self, *, skip: int = 0, limit: int = 100, **filters
     ) -> List[ModelType]:
         """Get multiple records with optional filtering"""
-        query = self.db.query(self.model)
-
-        # Apply filters
-        for field, value in filters.items():
-            if hasattr(self.model, field) and value is not None:
-                query = query.filter(getattr(self.model, field) == value)
-
+        query = self.db.query(self.model).filter(
+            *_filter_conditions(self.model, filters)
+        )
         return query.offset(skip).limit(limit).all()
 
     def create(self, *, obj_in: CreateSchemaType, **kwargs) -> ModelType:
         """Create a new record"""
-        obj_in_data = obj_in.dict() if hasattr(obj_in, "dict") else obj_in
+        obj_in_data = obj_in.model_dump() if hasattr(obj_in, "model_dump") else obj_in
         obj_in_data.update(kwargs)
         db_obj = self.model(**obj_in_data)
 
         self.db.add(db_obj)
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(db_obj)
         return db_obj
 
@@ -48,7 +68,9 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
     ) -> ModelType:
         """Update an existing record"""
         obj_data = (
-            obj_in.dict(exclude_unset=True) if hasattr(obj_in, "dict") else obj_in
+            obj_in.model_dump(exclude_unset=True)
+            if hasattr(obj_in, "model_dump")
+            else obj_in
         )
         obj_data.update(kwargs)
 
@@ -56,7 +78,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
             if hasattr(db_obj, field):
                 setattr(db_obj, field, value)
 
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(db_obj)
         return db_obj
 
@@ -65,28 +87,92 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
         obj = self.get(id)
         if obj:
             self.db.delete(obj)
-            self.db.commit()
+            self.db.flush()
             return True
         return False
 
     def count(self, **filters) -> int:
         """Count records with optional filtering"""
-        query = self.db.query(self.model)
-
-        # Apply filters
-        for field, value in filters.items():
-            if hasattr(self.model, field) and value is not None:
-                query = query.filter(getattr(self.model, field) == value)
-
-        return query.count()
+        # COUNT(*) straight off the table; Query.count() wraps a full-row subquery
+        return (
+            self.db.query(func.count())
+            .select_from(self.model)
+            .filter(*_filter_conditions(self.model, filters))
+            .scalar()
+            or 0
+        )
 
     def exists(self, **filters) -> bool:
         """Check if record exists with given filters"""
-        query = self.db.query(self.model)
+        # Selects a constant, so no row is loaded into the ORM
+        return (
+            self.db.query(literal(True))
+            .select_from(self.model)
+            .filter(*_filter_conditions(self.model, filters))
+            .limit(1)
+            .scalar()
+            is not None
+        )
+
+
+class AsyncBaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC):
+    """Async counterpart of BaseRepository; writes only flush"""
+
+    def __init__(self, db: AsyncSession, model: Type[ModelType]):
+        self.db = db
+        self.model = model
+
+    async def get(self, id: Any) -> Optional[ModelType]:
+        """Get a single record by primary key"""
+        return await self.db.get(self.model, id)
+
+    async def get_multi(
+        self, *, skip: int = 0, limit: int = 100, **filters
+    ) -> List[ModelType]:
+        """Get multiple records with optional filtering"""
+        stmt = select(self.model).where(*_filter_conditions(self.model, filters))
+        result = await self.db.execute(stmt.offset(skip).limit(limit))
+        return list(result.scalars().all())
 
-        # Apply filters
-        for field, value in filters.items():
-            if hasattr(self.model, field) and value is not None:
-                query = query.filter(getattr(self.model, field) == value)
+    async def create(self, *, obj_in: CreateSchemaType, **kwargs) -> ModelType:
+        """Create a new record"""
+        obj_in_data = obj_in.model_dump() if hasattr(obj_in, "model_dump") else obj_in
+        obj_in_data.update(kwargs)
+        db_obj = self.model(**obj_in_data)
+
+        self.db.add(db_obj)
+        await self.db.flush()
+        await self.db.refresh(db_obj)
+        return db_obj
+
+    async def update(
+        self, *, db_obj: ModelType, obj_in: UpdateSchemaType, **kwargs
+    ) -> ModelType:
+        """
+        Update an existing record.
+
+        The object is not refreshed after the flush: a refresh would expire
+        eagerly loaded relationships that cannot be lazy loaded under asyncio.
+        """
+        obj_data = (
+            obj_in.model_dump(exclude_unset=True)
+            if hasattr(obj_in, "model_dump")
+            else obj_in
+        )
+        obj_data.update(kwargs)
+
+        for field, value in obj_data.items():
+            if hasattr(db_obj, field):
+                setattr(db_obj, field, value)
 
-        return query.first() is not None
+        await self.db.flush()
+        return db_obj
+
+    async def delete(self, *, id: Any) -> bool:
+        """Delete a record by primary key"""
+        obj = await self.get(id)
+        if obj:
+            await self.db.delete(obj)
+            await self.db.flush()
+            return True
+        return False
@@ -1,6 +1,6 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from typing import Any, Dict, Iterator, List, Optional
+from sqlalchemy.orm import Session, raiseload, selectinload
+from sqlalchemy import and_, func, insert, lambda_stmt, select, update
 from datetime import datetime
 
 from app.models.portfolio import (
@@ -12,6 +12,7 @@ from app.models.portfolio import (
     PortfolioMetrics,
     TransactionType,
 )
+from app.models.materialized_views import portfolio_daily
 from app.schemas.portfolio import (
     PortfolioCreate,
     PortfolioUpdate,
@@ -34,10 +35,26 @@ class PortfolioRepository(BaseRepository[Portfolio, PortfolioCreate, PortfolioUp
         self, user_id: str, portfolio_id: int
     ) -> Optional[Portfolio]:
         """Get a specific portfolio for a user"""
+        stmt = lambda_stmt(
+            lambda: select(Portfolio).where(
+                Portfolio.id == portfolio_id, Portfolio.user_id == user_id
+            )
+        )
+        return self.db.execute(stmt).scalar_one_or_none()
+
+    def get_with_holdings(self, user_id: str, portfolio_id: int) -> Optional[Portfolio]:
+        """
+        Get a user's portfolio with holdings eager loaded.
+
+        Holdings come from one batched SELECT; any other lazy relationship
+        access on the portfolio raises instead of querying. Transaction
+        totals are aggregated separately through TransactionRepository.
+        """
         return (
             self.db.query(Portfolio)
+            .options(selectinload(Portfolio.holdings), raiseload("*"))
             .filter(and_(Portfolio.id == portfolio_id, Portfolio.user_id == user_id))
-            .first()
+            .one_or_none()
         )
 
 
@@ -55,16 +72,12 @@ class HoldingRepository(BaseRepository[Holding, dict, dict]):
         self, portfolio_id: int, symbol: str
     ) -> Optional[Holding]:
         """Get holding by portfolio and symbol"""
-        return (
-            self.db.query(Holding)
-            .filter(
-                and_(
-                    Holding.portfolio_id == portfolio_id,
-                    Holding.symbol == symbol,
-                )
+        stmt = lambda_stmt(
+            lambda: select(Holding).where(
+                Holding.portfolio_id == portfolio_id, Holding.symbol == symbol
             )
-            .first()
         )
+        return self.db.execute(stmt).scalar_one_or_none()
 
     def get_active_holdings(self, portfolio_id: int) -> List[Holding]:
         """Get active holdings (quantity > 0) for a portfolio"""
@@ -81,50 +94,114 @@ class HoldingRepository(BaseRepository[Holding, dict, dict]):
         quantity_change: float,
         price: float,
         transaction_type: TransactionType,
-    ) -> Holding:
+    ) -> Optional[Holding]:
         """Create new holding or update existing one based on transaction"""
-        holding = self.get_by_portfolio_and_symbol(portfolio_id, symbol)
-
-        if transaction_type == TransactionType.buy:
-            if holding:
-                print(f"DEBUG: Updating existing holding with id={holding.id}")
-                # Update existing holding with weighted average cost
-                total_cost = (holding.quantity * holding.average_cost) + (
-                    quantity_change * price
-                )
-                new_quantity = holding.quantity + quantity_change
-                holding.average_cost = (
-                    total_cost / new_quantity if new_quantity > 0 else 0
-                )
-                holding.quantity = new_quantity
-                self.db.commit()
-                self.db.refresh(holding)
-            else:
-                print(f"DEBUG: Creating new holding for symbol={symbol}")
-                # Create new holding without external API call for now
-                holding = Holding(
-                    portfolio_id=portfolio_id,
-                    symbol=symbol,
-                    quantity=quantity_change,
-                    average_cost=price,
-                    company_name=symbol,  # Use symbol as fallback
-                    sector="Unknown",  # Default sector
+        holding_ids = self.create_or_update_holdings_bulk(
+            portfolio_id,
+            [
+                {
+                    "symbol": symbol,
+                    "quantity_change": quantity_change,
+                    "price": price,
+                    "transaction_type": transaction_type,
+                }
+            ],
+        )
+        holding_id = holding_ids.get(symbol)
+        if holding_id is None:
+            # Dividends and splits leave the holding as is (None if absent)
+            return self.get_by_portfolio_and_symbol(portfolio_id, symbol)
+        # Bulk UPDATE bypasses the identity map, so reload any cached copy
+        return self.db.get(Holding, holding_id, populate_existing=True)
+
+    def create_or_update_holdings_bulk(
+        self, portfolio_id: int, ops: List[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """
+        Apply a batch of buy/sell holding changes with one SELECT and two batched writes.
+
+        Each op has symbol, quantity_change, price and transaction_type.
+        Weighted-average costs are computed in memory, in op order. Returns
+        holding ids keyed by symbol.
+        """
+        symbols = {op["symbol"] for op in ops}
+        existing = (
+            self.db.query(
+                Holding.id, Holding.symbol, Holding.quantity, Holding.average_cost
+            )
+            .filter(
+                and_(
+                    Holding.portfolio_id == portfolio_id,
+                    Holding.symbol.in_(symbols),
                 )
-                self.db.add(holding)
-                # Flush to get the ID without committing
-                self.db.flush()
-                print(f"DEBUG: Created new holding with id={holding.id}")
-
-        elif transaction_type == TransactionType.sell:
-            if holding:
-                print(f"DEBUG: Selling from holding with id={holding.id}")
-                holding.quantity = max(0, holding.quantity - quantity_change)
-                self.db.commit()
-                self.db.refresh(holding)
+            )
+            .all()
+        )
+        rows = {
+            row.symbol: {
+                "id": row.id,
+                "quantity": row.quantity,
+                "average_cost": row.average_cost,
+            }
+            for row in existing
+        }
+        new_symbols = set()
+        touched_symbols = set()
+
+        for op in ops:
+            symbol = op["symbol"]
+            quantity_change = op["quantity_change"]
+            price = op["price"]
+            row = rows.get(symbol)
+
+            if op["transaction_type"] == TransactionType.buy:
+                if row is None:
+                    # Create new holding without external API call for now
+                    rows[symbol] = {
+                        "portfolio_id": portfolio_id,
+                        "symbol": symbol,
+                        "quantity": quantity_change,
+                        "average_cost": price,
+                        "company_name": symbol,  # Use symbol as fallback
+                        "sector": "Unknown",  # Default sector
+                    }
+                    new_symbols.add(symbol)
+                else:
+                    # Update existing holding with weighted average cost
+                    total_cost = (row["quantity"] * row["average_cost"]) + (
+                        quantity_change * price
+                    )
+                    new_quantity = row["quantity"] + quantity_change
+                    row["average_cost"] = (
+                        total_cost / new_quantity if new_quantity > 0 else 0
+                    )
+                    row["quantity"] = new_quantity
+            elif op["transaction_type"] == TransactionType.sell:
+                if row is None:
+                    raise ValueError("No holding found to sell")
+                row["quantity"] = max(0, row["quantity"] - quantity_change)
             else:
-                raise ValueError("No holding found to sell")
+                continue
+
+            touched_symbols.add(symbol)
+
+        updates = [
+            rows[symbol] for symbol in touched_symbols if symbol not in new_symbols
+        ]
+        inserts = [rows[symbol] for symbol in new_symbols]
+
+        if updates:
+            # ORM bulk UPDATE by primary key (executemany)
+            self.db.execute(update(Holding), updates)
+        if inserts:
+            # Batched INSERT ... RETURNING hands back the generated ids
+            inserted = self.db.execute(
+                insert(Holding).returning(Holding.id, Holding.symbol), inserts
+            )
+            for holding_id, symbol in inserted:
+                rows[symbol]["id"] = holding_id
 
-        return holding
+        return {symbol: rows[symbol]["id"] for symbol in touched_symbols}
 
 
 class TransactionRepository(BaseRepository[Transaction, dict, dict]):
@@ -137,12 +214,12 @@ class TransactionRepository(BaseRepository[Transaction, dict, dict]):
         """Create a new transaction"""
         db_transaction = Transaction(**transaction_data)
         self.db.add(db_transaction)
-        self.db.commit()
+        self.db.flush()
         self.db.refresh(db_transaction)
         return db_transaction
 
     def get_by_portfolio(
-        self, portfolio_id: int, limit: int = 100, offset: int = 0
+        self, portfolio_id: int, limit: Optional[int] = 100, offset: int = 0
     ) -> List[Transaction]:
         """Get transactions for a portfolio with pagination"""
         return (
@@ -154,6 +231,23 @@ class TransactionRepository(BaseRepository[Transaction, dict, dict]):
             .all()
         )
 
+    def iter_by_portfolio(
+        self, portfolio_id: int, chunk: int = 1000
+    ) -> Iterator[Transaction]:
+        """
+        Stream every transaction for a portfolio, newest first.
+
+        Rows come from a server-side cursor `chunk` at a time, so memory stays
+        flat however long the history is. Use get_by_portfolio for pages.
+        """
+        query = (
+            self.db.query(Transaction)
+            .filter(Transaction.portfolio_id == portfolio_id)
+            .order_by(Transaction.transaction_date.desc())
+            .execution_options(stream_results=True)
+        )
+        yield from query.yield_per(chunk)
+
     def get_by_symbol(self, portfolio_id: int, symbol: str) -> List[Transaction]:
         """Get all transactions for a specific symbol in a portfolio"""
         return (
@@ -207,47 +301,56 @@ class TransactionRepository(BaseRepository[Transaction, dict, dict]):
             .all()
         )
 
-    def calculate_total_invested(self, portfolio_id: int) -> float:
-        """Calculate total amount invested (buy transactions - sell transactions)"""
-        buy_total = (
-            self.db.query(func.sum(Transaction.total_amount))
-            .filter(
-                and_(
-                    Transaction.portfolio_id == portfolio_id,
-                    Transaction.transaction_type == TransactionType.buy,
-                )
+    def aggregate_totals(self, portfolio_id: int) -> Dict[TransactionType, float]:
+        """Sum total_amount per transaction type in a single grouped query"""
+        rows = (
+            self.db.query(
+                Transaction.transaction_type, func.sum(Transaction.total_amount)
             )
-            .scalar()
-            or 0
+            .filter(Transaction.portfolio_id == portfolio_id)
+            .group_by(Transaction.transaction_type)
+            .all()
         )
-
-        sell_total = (
-            self.db.query(func.sum(Transaction.total_amount))
-            .filter(
-                and_(
-                    Transaction.portfolio_id == portfolio_id,
-                    Transaction.transaction_type == TransactionType.sell,
-                )
-            )
-            .scalar()
-            or 0
+        totals = {transaction_type: 0.0 for transaction_type in TransactionType}
+        totals.update(
+            {transaction_type: total or 0.0 for transaction_type, total in rows}
         )
+        return totals
 
-        return buy_total - sell_total
+    def calculate_total_invested(self, portfolio_id: int) -> float:
+        """Calculate total amount invested (buy transactions - sell transactions)"""
+        totals = self.aggregate_totals(portfolio_id)
+        return totals[TransactionType.buy] - totals[TransactionType.sell]
 
     def calculate_total_dividends(self, portfolio_id: int) -> float:
         """Calculate total dividends received"""
-        return (
-            self.db.query(func.sum(Transaction.total_amount))
-            .filter(
-                and_(
-                    Transaction.portfolio_id == portfolio_id,
-                    Transaction.transaction_type == TransactionType.dividend,
-                )
+        return self.aggregate_totals(portfolio_id)[TransactionType.dividend]
+
+    def get_daily_totals(
+        self, portfolio_id: int, start_date: datetime, end_date: datetime
+    ) -> List[Any]:
+        """
+        Running invested and dividend totals per day from mv_portfolio_daily.
+
+        Reads the nightly rollup (PostgreSQL only), so reads scale with the
+        number of days rather than transactions; today's trades appear after
+        the next refresh.
+        """
+        window = {"order_by": portfolio_daily.c.day}
+        running = (
+            select(
+                portfolio_daily.c.day,
+                func.sum(portfolio_daily.c.invested).over(**window).label("invested"),
+                func.sum(portfolio_daily.c.dividends).over(**window).label("dividends"),
             )
-            .scalar()
-            or 0
+            .where(portfolio_daily.c.portfolio_id == portfolio_id)
+            .subquery()
         )
+        return self.db.execute(
+            select(running)
+            .where(running.c.day >= start_date, running.c.day <= end_date)
+            .order_by(running.c.day)
+        ).all()
 
 
 class DividendPaymentRepository(BaseRepository[DividendPayment, dict, dict]):
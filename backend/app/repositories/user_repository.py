@@ -1,46 +1,86 @@
+from datetime import datetime
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import lambda_stmt, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.repositories.base_repository import BaseRepository
+from app.repositories.base_repository import AsyncBaseRepository
 
 
-class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
+class UserRepository(AsyncBaseRepository[User, UserCreate, UserUpdate]):
     """User repository with specific business logic"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         super().__init__(db, User)
 
-    def get_by_uid(self, uid: str) -> Optional[User]:
-        """Get user by Firebase UID"""
-        return self.db.query(User).filter(User.uid == uid).first()
+    async def get_by_uid(
+        self, uid: str, with_portfolios: bool = False
+    ) -> Optional[User]:
+        """Get user by Firebase UID, optionally eager loading portfolios"""
+        # Runs on every authenticated request: a lambda statement is cached by
+        # code location, so the select is not rebuilt on each call
+        stmt = lambda_stmt(lambda: select(User).where(User.uid == uid))
+        execution_options = {}
+        if with_portfolios:
+            # Lazy loading is unavailable under asyncio, so load up front and
+            # overwrite any stale copy already in the session
+            stmt += lambda s: s.options(selectinload(User.portfolios))
+            execution_options["populate_existing"] = True
 
-    def get_by_email(self, email: str) -> Optional[User]:
+        result = await self.db.execute(stmt, execution_options=execution_options)
+        return result.scalar_one_or_none()
+
+    async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
-        return self.db.query(User).filter(User.email == email).first()
+        result = await self.db.execute(
+            lambda_stmt(lambda: select(User).where(User.email == email))
+        )
+        return result.scalar_one_or_none()
 
-    def get_active_users(self) -> list[User]:
+    async def get_active_users(self) -> list[User]:
         """Get all active users"""
-        return self.db.query(User).filter(User.is_active == True).all()
-
-    def deactivate_by_uid(self, uid: str) -> bool:
-        """Deactivate user by UID"""
-        user = self.get_by_uid(uid)
-        if user:
-            user.is_active = False
-            self.db.commit()
-            return True
-        return False
-
-    def update_last_login(self, uid: str) -> Optional[User]:
-        """Update user's last login timestamp"""
-        from datetime import datetime
-
-        user = self.get_by_uid(uid)
-        if user:
-            user.last_login_at = datetime.utcnow()
-            self.db.commit()
-            self.db.refresh(user)
-            return user
-        return None
+        result = await self.db.execute(select(User).where(User.is_active == True))
+        return list(result.scalars().all())
+
+    async def deactivate_by_uid(self, uid: str) -> bool:
+        """Deactivate user by UID in a single UPDATE"""
+        result = await self.db.execute(
+            update(User).where(User.uid == uid).values(is_active=False)
+        )
+        return result.rowcount > 0
+
+    async def update_last_login(self, uid: str) -> bool:
+        """Stamp the user's last login time in a single UPDATE"""
+        result = await self.db.execute(
+            update(User).where(User.uid == uid).values(last_login_at=datetime.utcnow())
+        )
+        return result.rowcount > 0
+
+    async def upsert_login(self, uid: str, email: str, name: Optional[str]) -> User:
+        """
+        Insert the user or stamp last_login_at on an existing one, in one statement.
+
+        New rows keep last_login_at NULL, which lets the caller tell a
+        first sign-in apart from a returning user. Portfolios are eager loaded.
+        """
+        upsert_stmt = (
+            pg_insert(User)
+            .values(uid=uid, email=email, name=name, email_verified=True)
+            .on_conflict_do_update(
+                index_elements=[User.uid],
+                set_={"last_login_at": datetime.utcnow()},
+            )
+            .returning(User)
+        )
+        stmt = (
+            select(User)
+            .from_statement(upsert_stmt)
+            .options(selectinload(User.portfolios))
+            .execution_options(populate_existing=True)
+        )
+
+        result = await self.db.execute(stmt)
+        return result.scalar_one()
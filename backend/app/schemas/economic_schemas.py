@@ -1,9 +1,33 @@
 from datetime import datetime
+from enum import Enum
 from typing import List, Optional, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class EconomicIndicator(BaseModel):
+class EconomicCategory(str, Enum):
+    """Indicator categories accepted by the economic data endpoints."""
+
+    bonds = "bonds"
+    employment = "employment"
+    inflation = "inflation"
+    monetary = "monetary"
+    financial_stability = "financial_stability"
+    leading_indicators = "leading_indicators"
+
+
+class EconomicSchema(BaseModel):
+    """
+    Base for the economic response schemas.
+
+    Instances are frozen: they are built once per upstream fetch and only
+    serialized afterwards, so one instance can be shared between fields
+    and cached responses safely.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+
+class EconomicIndicator(EconomicSchema):
     """Base schema for economic indicators."""
 
     indicator_code: str = Field(..., description="Unique indicator code")
@@ -21,7 +45,7 @@ class EconomicIndicator(BaseModel):
     country: str = Field(default="US", description="Country code")
 
 
-class PMIData(BaseModel):
+class PMIData(EconomicSchema):
     """PMI (Purchasing Managers' Index) data."""
 
     manufacturing: EconomicIndicator = Field(..., description="Manufacturing PMI")
@@ -29,7 +53,7 @@ class PMIData(BaseModel):
     composite: Optional[EconomicIndicator] = Field(None, description="Composite PMI")
 
 
-class InflationData(BaseModel):
+class InflationData(EconomicSchema):
     """Inflation indicators."""
 
     headline: EconomicIndicator = Field(..., description="Headline inflation")
@@ -42,7 +66,7 @@ class InflationData(BaseModel):
     year_over_year: Optional[float] = Field(None, description="Year-over-year change")
 
 
-class EmploymentData(BaseModel):
+class EmploymentData(EconomicSchema):
     """Employment indicators."""
 
     unemployment_rate: EconomicIndicator = Field(..., description="Unemployment rate")
@@ -57,7 +81,7 @@ class EmploymentData(BaseModel):
     )
 
 
-class HousingData(BaseModel):
+class HousingData(EconomicSchema):
     """Housing market indicators."""
 
     housing_starts: EconomicIndicator = Field(..., description="Housing starts")
@@ -72,7 +96,7 @@ class HousingData(BaseModel):
     )
 
 
-class ConsumerSentimentData(BaseModel):
+class ConsumerSentimentData(EconomicSchema):
     """Consumer sentiment indicators."""
 
     consumer_confidence: EconomicIndicator = Field(
@@ -86,7 +110,7 @@ class ConsumerSentimentData(BaseModel):
     )
 
 
-class BusinessSentimentData(BaseModel):
+class BusinessSentimentData(EconomicSchema):
     """Business sentiment indicators."""
 
     business_confidence: EconomicIndicator = Field(
@@ -97,7 +121,7 @@ class BusinessSentimentData(BaseModel):
     )
 
 
-class MonetaryData(BaseModel):
+class MonetaryData(EconomicSchema):
     """Monetary policy indicators."""
 
     fed_funds_rate: EconomicIndicator = Field(..., description="Federal funds rate")
@@ -106,7 +130,7 @@ class MonetaryData(BaseModel):
     sofr: Optional[EconomicIndicator] = Field(None, description="SOFR rate")
 
 
-class FinancialStabilityData(BaseModel):
+class FinancialStabilityData(EconomicSchema):
     """Financial stability indicators."""
 
     yield_curve_slope: EconomicIndicator = Field(
@@ -120,7 +144,7 @@ class FinancialStabilityData(BaseModel):
     )
 
 
-class LeadingIndicators(BaseModel):
+class LeadingIndicators(EconomicSchema):
     """Leading economic indicators."""
 
     lei_oecd: EconomicIndicator = Field(..., description="OECD Leading Economic Index")
@@ -130,7 +154,7 @@ class LeadingIndicators(BaseModel):
 
 
 # Regional Economic Data
-class USEconomicData(BaseModel):
+class USEconomicData(EconomicSchema):
     """US economic indicators collection."""
 
     leading_indicators: LeadingIndicators
@@ -144,7 +168,7 @@ class USEconomicData(BaseModel):
     financial_stability: FinancialStabilityData
 
 
-class GlobalEconomicData(BaseModel):
+class GlobalEconomicData(EconomicSchema):
     """Global economic indicators collection."""
 
     us: USEconomicData
@@ -152,7 +176,7 @@ class GlobalEconomicData(BaseModel):
 
 
 # Response Models
-class EconomicIndicatorsResponse(BaseModel):
+class EconomicIndicatorsResponse(EconomicSchema):
     """Economic indicators API response."""
 
     data: GlobalEconomicData
@@ -160,7 +184,7 @@ class EconomicIndicatorsResponse(BaseModel):
     source_info: Optional[dict] = Field(None, description="Data source information")
 
 
-class EconomicIndicatorDetailResponse(BaseModel):
+class EconomicIndicatorDetailResponse(EconomicSchema):
     """Detailed response for a specific economic indicator."""
 
     indicator: EconomicIndicator
@@ -175,7 +199,7 @@ class EconomicIndicatorDetailResponse(BaseModel):
     )
 
 
-class EconomicSummaryResponse(BaseModel):
+class EconomicSummaryResponse(EconomicSchema):
     """Economic summary response."""
 
     key_indicators: List[EconomicIndicator] = Field(
@@ -1,8 +1,33 @@
 from datetime import datetime
+from enum import Enum
 from typing import List, Optional, Literal
 from pydantic import BaseModel, Field
 
 
+class MarketRegion(str, Enum):
+    """Regions accepted by the market data endpoints."""
+
+    US = "US"
+    EU = "EU"
+    ASIA = "ASIA"
+
+
+class HistoricalPeriod(str, Enum):
+    """Historical data periods accepted by the index detail endpoint."""
+
+    one_day = "1d"
+    five_days = "5d"
+    one_month = "1mo"
+    three_months = "3mo"
+    six_months = "6mo"
+    one_year = "1y"
+    two_years = "2y"
+    five_years = "5y"
+    ten_years = "10y"
+    year_to_date = "ytd"
+    max = "max"
+
+
 class MarketIndex(BaseModel):
     """Base schema for market index data."""
 
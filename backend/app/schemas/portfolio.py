@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -33,8 +33,7 @@ class Portfolio(PortfolioBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Transaction Schemas
@@ -48,17 +47,14 @@ class TransactionBase(BaseModel):
     transaction_date: datetime
     notes: Optional[str] = None
 
-    @validator("transaction_date", pre=True)
+    @field_validator("transaction_date", mode="before")
+    @classmethod
     def parse_transaction_date(cls, value):
         if isinstance(value, str):
-            # Handle both date format (YYYY-MM-DD) and datetime format
+            # One C-level parse covers YYYY-MM-DD (start of day) and full ISO
+            # datetimes, including a trailing "Z", on Python 3.11+
             try:
-                if "T" in value:
-                    # ISO datetime format
-                    return datetime.fromisoformat(value.replace("Z", "+00:00"))
-                else:
-                    # Date format - assume start of day
-                    return datetime.strptime(value, "%Y-%m-%d")
+                return datetime.fromisoformat(value)
             except ValueError:
                 raise ValueError(
                     "Invalid date format. Use YYYY-MM-DD or ISO datetime format"
@@ -77,8 +73,7 @@ class Transaction(TransactionBase):
     total_amount: float
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Holding Schemas
@@ -100,8 +95,7 @@ class Holding(HoldingBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Portfolio Metrics Schemas
@@ -127,8 +121,7 @@ class PortfolioMetrics(PortfolioMetricsBase):
     metric_date: datetime
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Portfolio Summary Schemas
@@ -209,16 +202,24 @@ class RiskMetrics(BaseModel):
 
 
 # Chart Data Schemas
-class ChartDataPoint(BaseModel):
-    x: Any  # Can be date, string, number
-    y: float
-    label: Optional[str] = None
-
-
 class ChartData(BaseModel):
+    """Chart series in columnar form: x[i], y[i] (and labels[i]) form one point"""
+
     chart_type: str  # line, bar, area, etc.
     title: str
     x_axis_label: str
     y_axis_label: str
-    data: List[ChartDataPoint]
+    x: List[Any]  # Can be date, string, number
+    y: List[float]
+    labels: Optional[List[str]] = None
     metadata: Optional[Dict[str, Any]] = None
+
+
+# Dashboard Schemas
+class PortfolioDashboard(BaseModel):
+    summary: PortfolioSummary
+    performance: PortfolioPerformance
+    dividends: DividendAnalysis
+    allocation: PortfolioAllocation
+    value_chart: ChartData
+    dividend_chart: ChartData
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional, List
 from datetime import datetime
 from app.schemas.portfolio import Portfolio as PortfolioSchema
@@ -27,9 +27,7 @@ class UserUpdate(BaseModel):
 
     name: Optional[str] = Field(None, max_length=100, description="사용자 이름")
     phone_number: Optional[str] = Field(None, max_length=20, description="전화번호")
-    preferred_currency: Optional[str] = Field(
-        None, max_length=3, description="선호 통화"
-    )
+    preferred_currency: Optional[str] = Field(None, max_length=3, description="선호 통화")
     timezone: Optional[str] = Field(None, max_length=50, description="시간대")
     language: Optional[str] = Field(None, max_length=10, description="언어 설정")
     notification_settings: Optional[str] = Field(None, description="알림 설정 JSON")
@@ -50,8 +48,7 @@ class UserResponse(UserBase):
     updated_at: Optional[datetime] = None
     last_login_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserProfile(BaseModel):
@@ -63,5 +60,4 @@ class UserProfile(BaseModel):
     is_premium: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
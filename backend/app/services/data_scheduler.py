@@ -1,10 +1,12 @@
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from datetime import datetime, timedelta, time
 from dataclasses import dataclass
 from enum import Enum
 import aiocron
+import httpx
 
 from app.services.providers.fred_provider import FREDProvider
 from app.core.database import get_db
@@ -23,7 +25,14 @@ class UpdateFrequency(Enum):
     QUARTERLY = "quarterly"
 
 
-@dataclass
+def _parse_check_time(value: Any) -> datetime:
+    """Parse a last-check time stored in Redis (bytes or str ISO format)."""
+    if isinstance(value, bytes):
+        value = value.decode()
+    return datetime.fromisoformat(value)
+
+
+@dataclass(frozen=True, slots=True)
 class IndicatorSchedule:
     """Configuration for each FRED indicator's update schedule."""
 
@@ -34,6 +43,16 @@ class IndicatorSchedule:
     business_days_delay: int = 1  # Days to wait after release date
 
 
+def _group_by_frequency(
+    schedules: Dict[str, IndicatorSchedule],
+) -> Dict[str, Tuple[IndicatorSchedule, ...]]:
+    """Group indicator schedules by frequency value."""
+    grouped: Dict[str, List[IndicatorSchedule]] = defaultdict(list)
+    for schedule in schedules.values():
+        grouped[schedule.frequency.value].append(schedule)
+    return {freq: tuple(group) for freq, group in grouped.items()}
+
+
 class FREDDataScheduler:
     """
     Scheduler for automatic FRED data updates based on each indicator's release schedule.
@@ -155,62 +174,127 @@ class FREDDataScheduler:
         ),
     }
 
+    # 주기별 스케줄/지표 수 (INDICATOR_SCHEDULES는 런타임에 바뀌지 않음)
+    SCHEDULES_BY_FREQ = _group_by_frequency(INDICATOR_SCHEDULES)
+    FREQUENCY_STATS = Counter(
+        {freq: len(schedules) for freq, schedules in SCHEDULES_BY_FREQ.items()}
+    )
+    CODES_BY_FREQ = {
+        freq: tuple(schedule.indicator_code for schedule in schedules)
+        for freq, schedules in SCHEDULES_BY_FREQ.items()
+    }
+    ALL_CODES = tuple(INDICATOR_SCHEDULES)
+    # API와 워커 프로세스가 함께 읽는 지표별 마지막 업데이트 시각 (Redis 해시)
+    LAST_CHECKS_KEY = "fred:last_checks"
+
+    # get_update_status 응답용 (daily/weekly/monthly만 노출)
+    INDICATORS_BY_FREQUENCY = {
+        "daily": FREQUENCY_STATS["daily"],
+        "weekly": FREQUENCY_STATS["weekly"],
+        "monthly": FREQUENCY_STATS["monthly"],
+    }
+
     def __init__(self):
         """Initialize FRED data scheduler."""
         self.fred_provider = FREDProvider()
         self.running_jobs = {}
         self.last_check_cache = {}
+        # start/stop 동시 호출 시 cron 작업이 중복 등록되지 않도록 직렬화
+        self._control_lock = asyncio.Lock()
+        # (연, 월) -> 지표별 월간 발표 반영 시각 (현재 월만 보관)
+        self._release_calendar: Dict[Tuple[int, int], Dict[str, datetime]] = {}
+        # 프로세스 수명 동안 FRED 연결을 재사용하는 HTTP 클라이언트
+        # (앱에서는 app.state.http_client를 빌려 쓰고, 워커에서는 직접 생성)
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._owns_http_client = False
+        # 설정되면 last_check_cache를 Redis에도 기록해 다른 프로세스와 공유
+        self._redis = None
 
     async def start_scheduler(self) -> None:
-        """Start all scheduled data update jobs."""
-        logger.info("Starting FRED data scheduler...")
+        """Start all scheduled data update jobs (no-op if already running)."""
+        async with self._control_lock:
+            if self.running_jobs:
+                logger.info("FRED data scheduler is already running")
+                return
 
-        # 일일 지표 체크 (매일 오전 6시)
-        daily_job = aiocron.crontab("0 6 * * *", func=self.check_daily_indicators)
-        self.running_jobs["daily"] = daily_job
+            logger.info("Starting FRED data scheduler...")
 
-        # 주간 지표 체크 (매주 목요일 오전 6시)
-        weekly_job = aiocron.crontab("0 6 * * 4", func=self.check_weekly_indicators)
-        self.running_jobs["weekly"] = weekly_job
+            # 일일 지표 체크 (매일 오전 6시)
+            daily_job = aiocron.crontab("0 6 * * *", func=self.check_daily_indicators)
+            self.running_jobs["daily"] = daily_job
 
-        # 월간 지표 체크 (매일 오후 11시 - 월간 지표 확인용)
-        monthly_job = aiocron.crontab("0 23 * * *", func=self.check_monthly_indicators)
-        self.running_jobs["monthly"] = monthly_job
+            # 주간 지표 체크 (매주 목요일 오전 6시)
+            weekly_job = aiocron.crontab("0 6 * * 4", func=self.check_weekly_indicators)
+            self.running_jobs["weekly"] = weekly_job
 
-        # 즉시 한번 체크 수행
+            # 월간 지표 체크 (매일 오후 11시 - 월간 지표 확인용)
+            monthly_job = aiocron.crontab(
+                "0 23 * * *", func=self.check_monthly_indicators
+            )
+            self.running_jobs["monthly"] = monthly_job
+
+        # 즉시 한번 체크 수행 (락 밖에서 실행해 stop 요청을 막지 않음)
         await self.check_all_indicators()
 
         logger.info("FRED data scheduler started successfully")
 
     async def stop_scheduler(self) -> None:
         """Stop all scheduled jobs."""
-        logger.info("Stopping FRED data scheduler...")
+        async with self._control_lock:
+            logger.info("Stopping FRED data scheduler...")
 
-        for job_name, job in self.running_jobs.items():
-            job.stop()
-            logger.info(f"Stopped {job_name} job")
+            for job_name, job in self.running_jobs.items():
+                job.stop()
+                logger.info(f"Stopped {job_name} job")
 
-        self.running_jobs.clear()
-        logger.info("FRED data scheduler stopped")
+            self.running_jobs.clear()
+            logger.info("FRED data scheduler stopped")
+
+    async def open_http_client(
+        self, client: Optional[httpx.AsyncClient] = None
+    ) -> None:
+        """
+        Route FRED requests through one keep-alive client until closed.
+
+        Pass the process's shared client to borrow it; otherwise the
+        scheduler opens its own and closes it in close_http_client.
+        """
+        if self._http_client is None:
+            self._owns_http_client = client is None
+            self._http_client = client or httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+                timeout=30.0,
+            )
+            self.fred_provider.use_client(self._http_client)
+
+    async def close_http_client(self) -> None:
+        """Stop using the shared client, closing it if the scheduler opened it."""
+        if self._http_client is not None:
+            self.fred_provider.use_client(None)
+            if self._owns_http_client:
+                await self._http_client.aclose()
+            self._http_client = None
+            self._owns_http_client = False
+
+    def use_redis(self, client) -> None:
+        """
+        Share last-check times through Redis (None keeps them in-process).
+
+        Updates may run in the ARQ worker while the API serves status, so
+        both processes read and write the same hash.
+        """
+        self._redis = client
 
     async def check_daily_indicators(self) -> None:
         """Check and update daily indicators."""
-        daily_indicators = [
-            code
-            for code, schedule in self.INDICATOR_SCHEDULES.items()
-            if schedule.frequency == UpdateFrequency.DAILY
-        ]
+        daily_indicators = self.CODES_BY_FREQ.get(UpdateFrequency.DAILY.value, ())
 
         logger.info(f"Checking daily indicators: {daily_indicators}")
         await self._update_indicators(daily_indicators)
 
     async def check_weekly_indicators(self) -> None:
         """Check and update weekly indicators."""
-        weekly_indicators = [
-            code
-            for code, schedule in self.INDICATOR_SCHEDULES.items()
-            if schedule.frequency == UpdateFrequency.WEEKLY
-        ]
+        weekly_indicators = self.CODES_BY_FREQ.get(UpdateFrequency.WEEKLY.value, ())
 
         logger.info(f"Checking weekly indicators: {weekly_indicators}")
         await self._update_indicators(weekly_indicators)
@@ -220,11 +304,10 @@ class FREDDataScheduler:
         now = datetime.now()
         monthly_indicators = []
 
-        for code, schedule in self.INDICATOR_SCHEDULES.items():
-            if schedule.frequency == UpdateFrequency.MONTHLY:
-                # 월간 지표의 발표일 확인
-                if self._should_update_monthly_indicator(schedule, now):
-                    monthly_indicators.append(code)
+        for schedule in self.SCHEDULES_BY_FREQ.get(UpdateFrequency.MONTHLY.value, ()):
+            # 월간 지표의 발표일 확인
+            if self._should_update_monthly_indicator(schedule, now):
+                monthly_indicators.append(schedule.indicator_code)
 
         if monthly_indicators:
             logger.info(f"Checking monthly indicators: {monthly_indicators}")
@@ -233,55 +316,67 @@ class FREDDataScheduler:
     async def check_all_indicators(self) -> None:
         """Manually check all indicators for updates."""
         logger.info("Manual check of all FRED indicators")
-        all_indicators = list(self.INDICATOR_SCHEDULES.keys())
-        await self._update_indicators(all_indicators, force_update=True)
+        await self._update_indicators(self.ALL_CODES, force_update=True)
 
     async def _update_indicators(
-        self, indicator_codes: List[str], force_update: bool = False
+        self, indicator_codes: Sequence[str], force_update: bool = False
     ) -> None:
         """Update specified indicators if new data is available."""
+        if not indicator_codes:
+            return
+
+        try:
+            # 한 번의 호출로 모든 지표를 동시에 조회 (공유 클라이언트 재사용)
+            fred_data = await self.fred_provider.get_multiple_series(
+                list(indicator_codes)
+            )
+        except Exception as e:
+            logger.error(f"Error fetching indicators {list(indicator_codes)}: {e}")
+            return
+
         for indicator_code in indicator_codes:
             try:
-                await self._update_single_indicator(indicator_code, force_update)
+                await self._store_if_newer(
+                    indicator_code, fred_data.get(indicator_code), force_update
+                )
             except Exception as e:
                 logger.error(f"Error updating indicator {indicator_code}: {e}")
 
     async def _update_single_indicator(
         self, indicator_code: str, force_update: bool = False
     ) -> None:
-        """Update a single indicator if new data is available."""
-        try:
-            # 데이터베이스에서 마지막 업데이트 시간 확인
-            last_update = await self._get_last_update_time(indicator_code)
-
-            # FRED에서 최신 데이터 가져오기
-            fred_data = await self.fred_provider.get_economic_series(indicator_code)
-
-            if not fred_data:
-                logger.warning(f"No data received for {indicator_code}")
-                return
+        """Update a single indicator if new data is available (errors propagate)."""
+        # FRED에서 최신 데이터 가져오기
+        fred_data = await self.fred_provider.get_economic_series(indicator_code)
+        await self._store_if_newer(indicator_code, fred_data, force_update)
+
+    async def _store_if_newer(
+        self,
+        indicator_code: str,
+        fred_data: Optional[Dict[str, Any]],
+        force_update: bool = False,
+    ) -> None:
+        """Save fetched indicator data unless the stored copy is already current."""
+        if not fred_data:
+            logger.warning(f"No data received for {indicator_code}")
+            return
 
-            # 새로운 데이터가 있는지 확인
-            latest_data_date = fred_data.get("last_updated")
-            if isinstance(latest_data_date, str):
-                latest_data_date = datetime.fromisoformat(
-                    latest_data_date.replace("Z", "+00:00")
-                )
+        # 데이터베이스에서 마지막 업데이트 시간 확인
+        last_update = await self._get_last_update_time(indicator_code)
 
-            # 업데이트 필요성 확인
-            if not force_update and last_update and latest_data_date:
-                if latest_data_date <= last_update:
-                    logger.debug(f"No new data for {indicator_code}, skipping update")
-                    return
+        # 새로운 데이터가 있는지 확인 (provider가 datetime으로 제공)
+        latest_data_date = fred_data.get("last_updated")
 
-            # 데이터베이스에 저장
-            await self._save_indicator_data(indicator_code, fred_data)
+        # 업데이트 필요성 확인
+        if not force_update and last_update and latest_data_date:
+            if latest_data_date <= last_update:
+                logger.debug(f"No new data for {indicator_code}, skipping update")
+                return
 
-            logger.info(f"Successfully updated {indicator_code} with latest data")
+        # 데이터베이스에 저장
+        await self._save_indicator_data(indicator_code, fred_data)
 
-        except Exception as e:
-            logger.error(f"Error updating indicator {indicator_code}: {e}")
-            raise
+        logger.info(f"Successfully updated {indicator_code} with latest data")
 
     async def _get_last_update_time(self, indicator_code: str) -> Optional[datetime]:
         """Get the last update time for an indicator from database."""
@@ -296,7 +391,14 @@ class FREDDataScheduler:
         #     record = result.fetchone()
         #     return record.last_updated if record else None
 
-        # 임시로 캐시에서 확인
+        # 임시로 캐시에서 확인 (Redis가 있으면 다른 프로세스의 기록 포함)
+        if self._redis is not None:
+            try:
+                value = await self._redis.hget(self.LAST_CHECKS_KEY, indicator_code)
+                if value is not None:
+                    return _parse_check_time(value)
+            except Exception as e:
+                logger.warning(f"Could not read last check for {indicator_code}: {e}")
         return self.last_check_cache.get(indicator_code)
 
     async def _save_indicator_data(
@@ -320,7 +422,15 @@ class FREDDataScheduler:
         #     await db.commit()
 
         # 임시로 캐시에 저장
-        self.last_check_cache[indicator_code] = datetime.now()
+        checked_at = datetime.now()
+        self.last_check_cache[indicator_code] = checked_at
+        if self._redis is not None:
+            try:
+                await self._redis.hset(
+                    self.LAST_CHECKS_KEY, indicator_code, checked_at.isoformat()
+                )
+            except Exception as e:
+                logger.warning(f"Could not share last check for {indicator_code}: {e}")
         logger.info(f"Cached update time for {indicator_code}")
 
     def _should_update_monthly_indicator(
@@ -330,14 +440,31 @@ class FREDDataScheduler:
         if not schedule.release_day:
             return False
 
-        # 이번 달의 발표일 계산
-        release_date = datetime(now.year, now.month, schedule.release_day)
-
-        # 발표일이 지났고, 업무일 딜레이를 고려한 날짜인지 확인
-        update_date = release_date + timedelta(days=schedule.business_days_delay)
+        calendar = self._monthly_release_calendar(now)
+        update_date = calendar.get(schedule.indicator_code)
+        if update_date is None:
+            return False
 
         return now >= update_date
 
+    def _monthly_release_calendar(self, now: datetime) -> Dict[str, datetime]:
+        """Earliest pickup time per monthly indicator, computed once per month."""
+        key = (now.year, now.month)
+        calendar = self._release_calendar.get(key)
+        if calendar is None:
+            calendar = {
+                schedule.indicator_code: datetime(
+                    now.year, now.month, schedule.release_day
+                )
+                + timedelta(days=schedule.business_days_delay)
+                for schedule in self.SCHEDULES_BY_FREQ.get(
+                    UpdateFrequency.MONTHLY.value, ()
+                )
+                if schedule.release_day
+            }
+            self._release_calendar = {key: calendar}
+        return calendar
+
     async def force_update_indicator(self, indicator_code: str) -> bool:
         """Force update a specific indicator."""
         try:
@@ -347,37 +474,30 @@ class FREDDataScheduler:
             logger.error(f"Error force updating {indicator_code}: {e}")
             return False
 
+    async def _read_last_checks(self) -> Dict[str, datetime]:
+        """Last update time per indicator, across processes when Redis is set."""
+        last_checks = dict(self.last_check_cache)
+        if self._redis is not None:
+            try:
+                shared = await self._redis.hgetall(self.LAST_CHECKS_KEY)
+            except Exception as e:
+                logger.warning(f"Could not read shared last checks: {e}")
+            else:
+                for code, value in shared.items():
+                    if isinstance(code, bytes):
+                        code = code.decode()
+                    last_checks[code] = _parse_check_time(value)
+        return last_checks
+
     async def get_update_status(self) -> Dict[str, Any]:
         """Get status of all scheduled indicators."""
-        status = {
-            "total_indicators": len(self.INDICATOR_SCHEDULES),
+        return {
+            "total_indicators": len(self.ALL_CODES),
             "running_jobs": len(self.running_jobs),
-            "last_checks": self.last_check_cache,
-            "indicators_by_frequency": {
-                "daily": len(
-                    [
-                        s
-                        for s in self.INDICATOR_SCHEDULES.values()
-                        if s.frequency == UpdateFrequency.DAILY
-                    ]
-                ),
-                "weekly": len(
-                    [
-                        s
-                        for s in self.INDICATOR_SCHEDULES.values()
-                        if s.frequency == UpdateFrequency.WEEKLY
-                    ]
-                ),
-                "monthly": len(
-                    [
-                        s
-                        for s in self.INDICATOR_SCHEDULES.values()
-                        if s.frequency == UpdateFrequency.MONTHLY
-                    ]
-                ),
-            },
+            "last_checks": await self._read_last_checks(),
+            # 호출자가 응답을 수정해도 클래스 상태가 바뀌지 않도록 복사본 반환
+            "indicators_by_frequency": dict(self.INDICATORS_BY_FREQUENCY),
         }
-        return status
 
 
 # 전역 스케줄러 인스턴스
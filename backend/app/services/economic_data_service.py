@@ -2,8 +2,12 @@ from typing import Optional, Dict, Any, List
 from datetime import datetime
 import logging
 
+import orjson
+from fastapi import Request
+
 from app.services.providers.base import EconomicDataProvider, CacheProvider
 from app.services.providers.fred_provider import FREDProvider
+from app.services.providers.redis_cache import RedisCacheProvider
 from app.schemas.economic_schemas import (
     EconomicIndicator,
     EconomicIndicatorsResponse,
@@ -24,6 +28,15 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Cache lifetime per indicator frequency (seconds). Nothing invalidates Redis
+# when a release lands, so even slow series are capped at a few hours
+FREQUENCY_CACHE_TTLS = {
+    "daily": 3600,
+    "weekly": 10800,
+    "monthly": 21600,
+    "quarterly": 21600,
+}
+
 
 class EconomicDataService:
     """
@@ -42,6 +55,17 @@ class EconomicDataService:
 
     async def get_all_indicators(self) -> EconomicIndicatorsResponse:
         """Get all economic indicators."""
+        return EconomicIndicatorsResponse.model_validate(
+            orjson.loads(await self.get_all_indicators_json())
+        )
+
+    async def get_all_indicators_json(self) -> bytes:
+        """
+        Get all economic indicators as serialized JSON.
+
+        A cache hit is passed through as stored, skipping the parse and
+        re-dump that returning a model would cost.
+        """
         try:
             # Check cache first
             cache_key = "economic_indicators_all"
@@ -49,19 +73,9 @@ class EconomicDataService:
 
             if cached_data:
                 logger.info("Returning cached economic indicators")
-                return EconomicIndicatorsResponse.model_validate_json(cached_data)
+                return cached_data.encode()
 
-            # Fetch from provider
-            logger.info("Fetching fresh economic indicators")
-            raw_data = await self.economic_provider.get_all_indicators()
-
-            # Transform to response model
-            response = self._build_indicators_response(raw_data)
-
-            # Cache the result
-            await self._set_cache(cache_key, response.model_dump_json())
-
-            return response
+            return await self._load_all_indicators(cache_key)
 
         except Exception as e:
             logger.error(f"Error getting economic indicators: {e}")
@@ -77,21 +91,44 @@ class EconomicDataService:
                 logger.info(
                     f"Returning cached economic indicators for category: {category}"
                 )
-                return cached_data
+                return orjson.loads(cached_data)
 
-            # Fetch from provider
-            logger.info(f"Fetching fresh economic indicators for category: {category}")
-            raw_data = await self.economic_provider.get_indicators_by_category(category)
-
-            # Cache the result
-            await self._set_cache(cache_key, raw_data, ttl=1800)  # 30 minutes
-
-            return raw_data
+            return await self._load_indicators_by_category(category, cache_key)
 
         except Exception as e:
             logger.error(f"Error getting indicators for category {category}: {e}")
             raise
 
+    async def _load_all_indicators(self, cache_key: str) -> bytes:
+        """Fetch all indicators from the provider and store them under cache_key."""
+        logger.info("Fetching fresh economic indicators")
+        raw_data = await self.economic_provider.get_all_indicators()
+
+        # Transform to response model
+        body = self._build_indicators_response(raw_data).model_dump_json()
+
+        # Cache the result for its fastest-moving indicator's window
+        ttl = self._cache_ttl(raw_data)
+        if ttl is not None:
+            await self._set_cache(cache_key, body, ttl=ttl)
+
+        return body.encode()
+
+    async def _load_indicators_by_category(
+        self, category: str, cache_key: str
+    ) -> Dict[str, Any]:
+        """Fetch one category from the provider and store it under cache_key."""
+        logger.info(f"Fetching fresh economic indicators for category: {category}")
+        raw_data = await self.economic_provider.get_indicators_by_category(category)
+
+        ttl = self._cache_ttl(raw_data)
+        if ttl is not None:
+            await self._set_cache(
+                cache_key, orjson.dumps(raw_data, default=str).decode(), ttl=ttl
+            )
+
+        return raw_data
+
     async def get_indicator_detail(
         self, indicator_code: str
     ) -> EconomicIndicatorDetailResponse:
@@ -102,7 +139,9 @@ class EconomicDataService:
 
             if cached_data:
                 logger.info(f"Returning cached indicator detail for {indicator_code}")
-                return EconomicIndicatorDetailResponse.model_validate_json(cached_data)
+                return EconomicIndicatorDetailResponse.model_validate(
+                    orjson.loads(cached_data)
+                )
 
             # Fetch current data
             indicator_data = await self.economic_provider.get_economic_series(
@@ -151,20 +190,15 @@ class EconomicDataService:
     async def refresh_cache(self, category: Optional[str] = None) -> bool:
         """Force refresh of cached economic data."""
         try:
+            # Overwrite in place rather than delete-then-read: readers keep
+            # the old entry until the new one lands, and a failed fetch
+            # leaves it intact
             if category:
                 cache_key = f"economic_indicators_{category}"
-                # Delete existing cache
-                if self.cache_provider:
-                    await self.cache_provider.delete(cache_key)
-                # Fetch fresh data
-                await self.get_indicators_by_category(category)
+                await self._load_indicators_by_category(category, cache_key)
             else:
                 cache_key = "economic_indicators_all"
-                # Delete existing cache
-                if self.cache_provider:
-                    await self.cache_provider.delete(cache_key)
-                # Fetch fresh data
-                await self.get_all_indicators()
+                await self._load_all_indicators(cache_key)
 
             logger.info(
                 f"Successfully refreshed cache for category: {category or 'all'}"
@@ -180,95 +214,101 @@ class EconomicDataService:
     ) -> EconomicIndicatorsResponse:
         """Build EconomicIndicatorsResponse from raw provider data."""
 
-        # 카테고리별로 데이터 분류
-        bonds_data = {k: v for k, v in raw_data.items() if v.get("category") == "bonds"}
-        employment_data = {
-            k: v for k, v in raw_data.items() if v.get("category") == "employment"
-        }
-        inflation_data = {
-            k: v for k, v in raw_data.items() if v.get("category") == "inflation"
-        }
-        monetary_data = {
-            k: v for k, v in raw_data.items() if v.get("category") == "monetary"
-        }
-        financial_data = {
-            k: v
-            for k, v in raw_data.items()
-            if v.get("category") == "financial_stability"
-        }
-        leading_data = {
-            k: v
-            for k, v in raw_data.items()
-            if v.get("category") == "leading_indicators"
+        # 카테고리별로 데이터 분류 (한 번의 순회로 버킷/카테고리 목록 생성)
+        buckets: Dict[str, Dict[str, Any]] = {
+            "employment": {},
+            "inflation": {},
+            "monetary": {},
+            "financial_stability": {},
+            "leading_indicators": {},
         }
+        # 등장 순서를 유지하는 카테고리 집합 (응답/ETag가 프로세스마다 같도록)
+        categories: Dict[str, None] = {}
+        for code, indicator in raw_data.items():
+            category = indicator.get("category", "general")
+            categories[category] = None
+            bucket = buckets.get(category)
+            if bucket is not None:
+                bucket[code] = indicator
+
+        employment_data = buckets["employment"]
+        inflation_data = buckets["inflation"]
+        monetary_data = buckets["monetary"]
+        financial_data = buckets["financial_stability"]
+        leading_data = buckets["leading_indicators"]
+
+        # 응답 전체에서 같은 시각을 사용 (지표마다 datetime.now() 호출하지 않음)
+        now = datetime.now()
 
         try:
+            # Both LEI fields come from the same series; schemas are frozen,
+            # so one instance can back both
+            lei = self._build_economic_indicator(leading_data.get("CLICKSA2", {}), now)
+
             # Build US economic data structure
             us_data = USEconomicData(
                 leading_indicators=LeadingIndicators(
-                    lei_oecd=self._build_economic_indicator(
-                        leading_data.get("CLICKSA2", {})
-                    ),
-                    lei_conference_board=self._build_economic_indicator(
-                        leading_data.get("CLICKSA2", {})
-                    ),
+                    lei_oecd=lei,
+                    lei_conference_board=lei,
                 ),
                 pmi=PMIData(
                     manufacturing=self._build_placeholder_indicator(
-                        "Manufacturing PMI"
+                        "Manufacturing PMI", now
                     ),
-                    services=self._build_placeholder_indicator("Services PMI"),
+                    services=self._build_placeholder_indicator("Services PMI", now),
                 ),
                 inflation=InflationData(
                     headline=self._build_economic_indicator(
-                        inflation_data.get("CPIAUCSL", {})
+                        inflation_data.get("CPIAUCSL", {}), now
                     ),
                     core=self._build_economic_indicator(
-                        inflation_data.get("USACPIALL", {})
+                        inflation_data.get("USACPIALL", {}), now
                     ),
                 ),
                 employment=EmploymentData(
                     unemployment_rate=self._build_economic_indicator(
-                        employment_data.get("UNRATE", {})
+                        employment_data.get("UNRATE", {}), now
                     ),
                     nonfarm_payrolls=self._build_economic_indicator(
-                        employment_data.get("PAYEMS", {})
+                        employment_data.get("PAYEMS", {}), now
                     ),
                     average_hourly_earnings=self._build_economic_indicator(
-                        employment_data.get("AHEPA", {})
+                        employment_data.get("AHEPA", {}), now
                     ),
                 ),
                 housing=HousingData(
-                    housing_starts=self._build_placeholder_indicator("Housing Starts"),
+                    housing_starts=self._build_placeholder_indicator(
+                        "Housing Starts", now
+                    ),
                     existing_home_sales=self._build_placeholder_indicator(
-                        "Existing Home Sales"
+                        "Existing Home Sales", now
                     ),
                 ),
                 consumer_sentiment=ConsumerSentimentData(
                     consumer_confidence=self._build_placeholder_indicator(
-                        "Consumer Confidence"
+                        "Consumer Confidence", now
                     ),
                     consumer_expectations=self._build_placeholder_indicator(
-                        "Consumer Expectations"
+                        "Consumer Expectations", now
                     ),
                 ),
                 monetary=MonetaryData(
                     fed_funds_rate=self._build_economic_indicator(
-                        monetary_data.get("FEDFUNDS", {})
+                        monetary_data.get("FEDFUNDS", {}), now
                     ),
                     m2_money_supply=self._build_economic_indicator(
-                        monetary_data.get("M2SL", {})
+                        monetary_data.get("M2SL", {}), now
                     ),
                     ted_spread=self._build_economic_indicator(
-                        financial_data.get("TEDRATE", {})
+                        financial_data.get("TEDRATE", {}), now
                     ),
                 ),
                 financial_stability=FinancialStabilityData(
                     yield_curve_slope=self._build_placeholder_indicator(
-                        "Yield Curve Slope"
+                        "Yield Curve Slope", now
                     ),
                     financial_stress_index=self._build_economic_indicator(
-                        financial_data.get("STLFSI", {})
+                        financial_data.get("STLFSI", {}), now
                     ),
                 ),
             )
@@ -277,13 +317,11 @@ class EconomicDataService:
 
             return EconomicIndicatorsResponse(
                 data=global_data,
-                last_updated=datetime.now(),
+                last_updated=now,
                 source_info={
                     "provider": "FRED",
                     "indicators_count": len(raw_data),
-                    "categories": list(
-                        set(v.get("category", "general") for v in raw_data.values())
-                    ),
+                    "categories": list(categories),
                 },
             )
 
@@ -291,10 +329,14 @@ class EconomicDataService:
             logger.error(f"Error building indicators response: {e}")
             raise
 
-    def _build_economic_indicator(self, data: Dict[str, Any]) -> EconomicIndicator:
-        """Build EconomicIndicator from provider data."""
+    def _build_economic_indicator(
+        self, data: Dict[str, Any], now: Optional[datetime] = None
+    ) -> EconomicIndicator:
+        """Build EconomicIndicator from provider data, stamped with now if undated."""
+        if now is None:
+            now = datetime.now()
         if not data:
-            return self._build_placeholder_indicator("Data Not Available")
+            return self._build_placeholder_indicator("Data Not Available", now)
 
         return EconomicIndicator(
             indicator_code=data.get("indicator_code", "N/A"),
@@ -306,12 +348,16 @@ class EconomicDataService:
             unit=data.get("unit", "Index"),
             frequency=data.get("frequency", "monthly"),
             source=data.get("source", "FRED"),
-            timestamp=data.get("timestamp", datetime.now()),
+            timestamp=data.get("timestamp", now),
             country=data.get("country", "US"),
         )
 
-    def _build_placeholder_indicator(self, name: str) -> EconomicIndicator:
+    def _build_placeholder_indicator(
+        self, name: str, now: Optional[datetime] = None
+    ) -> EconomicIndicator:
         """Build placeholder indicator when data is not available."""
+        if now is None:
+            now = datetime.now()
         return EconomicIndicator(
             indicator_code="N/A",
             name=name,
@@ -319,10 +365,32 @@ class EconomicDataService:
             unit="Index",
             frequency="monthly",
             source="Placeholder",
-            timestamp=datetime.now(),
+            timestamp=now,
             country="US",
         )
 
+    def _cache_ttl(self, raw_data: Dict[str, Any]) -> Optional[int]:
+        """
+        TTL for a set of series: the shortest frequency window among them.
+
+        None when any series is a provider fallback, so mock or empty data
+        from an outage is never cached, nor written over a good entry.
+        """
+        # Only a real FRED observation carries last_updated; the mock and
+        # empty-indicator fallbacks do not
+        if any("last_updated" not in series for series in raw_data.values()):
+            return None
+
+        return min(
+            (
+                FREQUENCY_CACHE_TTLS.get(
+                    series.get("frequency"), settings.economic_data_cache_ttl
+                )
+                for series in raw_data.values()
+            ),
+            default=settings.economic_data_cache_ttl,
+        )
+
     async def _get_from_cache(self, key: str) -> Optional[str]:
         """Get data from cache if available."""
         if not self.cache_provider:
@@ -347,11 +415,19 @@ class EconomicDataService:
 
 
 # Factory function for creating EconomicDataService with proper dependencies
-def create_economic_data_service() -> EconomicDataService:
+def create_economic_data_service(request: Request) -> EconomicDataService:
     """
     Factory function to create EconomicDataService with dependencies.
     Follows Dependency Injection pattern.
     """
-    economic_provider = FREDProvider()
-    # For now, create without cache provider to avoid FastAPI dependency issues
-    return EconomicDataService(economic_provider, None)
+    economic_provider = FREDProvider(
+        client=request.app.state.http_client,
+        semaphore=request.app.state.fred_semaphore,
+    )
+    # The ARQ pool is a redis.asyncio client; reuse it so cached responses
+    # are shared by every worker. Without Redis the service runs uncached.
+    redis_client = request.app.state.arq
+    cache_provider = (
+        RedisCacheProvider(redis_client) if redis_client is not None else None
+    )
+    return EconomicDataService(economic_provider, cache_provider)
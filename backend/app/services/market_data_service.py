@@ -1,11 +1,15 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
+import asyncio
 import logging
-import json
+import orjson
 import requests
 import os
 
+from fastapi import Request
+
 from app.services.providers.base import MarketDataProvider, CacheProvider
+from app.services.providers.redis_cache import RedisCacheProvider
 from app.schemas.market_schemas import (
     MarketIndicesResponse,
     MarketOverviewResponse,
@@ -19,6 +23,27 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Suspiciously round index levels that mock providers tend to return
+_ROUND_MOCK_VALUES = frozenset((100, 1000, 2000, 3000, 4500, 18000, 28000, 35000))
+
+# Region of every index symbol the providers return
+_SYMBOL_REGION = {
+    **dict.fromkeys(("DJIA", "SP500", "NASDAQ", "RUSsell2000", "PHLX_SOX"), "us"),
+    **dict.fromkeys(("EURO_STOXX50", "FTSE100", "DAX", "CAC40", "IBEX35"), "eu"),
+    **dict.fromkeys(
+        (
+            "NIKKEI225",
+            "TOPIX",
+            "SHANGHAI_COMPOSITE",
+            "HANG_SENG",
+            "KOSPI",
+            "KOSDAQ",
+            "ASX200",
+        ),
+        "asia",
+    ),
+}
+
 
 class MarketDataService:
     """
@@ -99,22 +124,27 @@ class MarketDataService:
                 logger.info(f"Returning cached market indices for region: {region}")
                 return self._parse_cached_indices(cached_data)
 
-            # Fetch from provider
-            logger.info(f"Fetching fresh market indices for region: {region}")
-            raw_data = await self.market_provider.get_indices(region)
-
-            # Transform to response model
-            response = self._build_indices_response(raw_data, region)
-
-            # Cache the result
-            await self._set_cache(cache_key, response.model_dump_json())
-
-            return response
+            return await self._load_indices(region, cache_key)
 
         except Exception as e:
             logger.error(f"Error getting market indices: {e}")
             raise
 
+    async def _load_indices(
+        self, region: Optional[str], cache_key: str
+    ) -> MarketIndicesResponse:
+        """Fetch indices from the provider and store them under cache_key."""
+        logger.info(f"Fetching fresh market indices for region: {region}")
+        raw_data = await self.market_provider.get_indices(region)
+
+        # Transform to response model
+        response = self._build_indices_response(raw_data, region)
+
+        # Cache the result
+        await self._set_cache(cache_key, response.model_dump_json())
+
+        return response
+
     async def get_index_detail(
         self, symbol: str, period: str = "1d"
     ) -> MarketIndexDetailResponse:
@@ -128,42 +158,67 @@ class MarketDataService:
         Returns:
             MarketIndexDetailResponse with detailed index data
         """
+        index, historical_data = await self.get_index_detail_rows(symbol, period)
+        return MarketIndexDetailResponse(
+            index=index,
+            historical_data=historical_data,
+            related_indices=None,  # TODO: Implement related indices logic
+        )
+
+    async def get_index_detail_rows(
+        self, symbol: str, period: str
+    ) -> Tuple[MarketIndex, Optional[List[Dict[str, Any]]]]:
+        """
+        Get an index quote and its historical rows as provider dicts.
+
+        The rows list is still held in full; callers that stream it only
+        avoid validating it into a response model and encoding it as one body.
+        """
         try:
             cache_key = f"index_detail_{symbol}_{period}"
             cached_data = await self._get_from_cache(cache_key)
 
             if cached_data:
                 logger.info(f"Returning cached index detail for {symbol}")
-                return MarketIndexDetailResponse.model_validate_json(cached_data)
-
-            # Fetch current quote
-            quote_data = await self.market_provider.get_quote(symbol)
-
-            # Fetch historical data if period is specified
-            historical_data = None
-            if period != "1d":
-                historical_data = await self.market_provider.get_historical_data(
-                    symbol, period
+                detail = orjson.loads(cached_data)
+                return (
+                    MarketIndex.model_validate(detail["index"]),
+                    detail["historical_data"],
                 )
 
-            # Build response
-            response = MarketIndexDetailResponse(
-                index=self._build_market_index(quote_data),
-                historical_data=historical_data,
-                related_indices=None,  # TODO: Implement related indices logic
+            # Quote and history are independent upstream calls, so fetch
+            # them concurrently
+            quote_data, historical_data = await asyncio.gather(
+                self.market_provider.get_quote(symbol),
+                self._get_historical_data(symbol, period),
             )
+            index = self._build_market_index(quote_data)
+
+            # Cache with shorter TTL for detailed data (5 minutes)
+            detail_json = orjson.dumps(
+                {
+                    "index": index.model_dump(mode="json"),
+                    "historical_data": historical_data,
+                    "related_indices": None,
+                },
+                default=str,
+            )
+            await self._set_cache(cache_key, detail_json.decode(), ttl=300)
 
-            # Cache with shorter TTL for detailed data
-            await self._set_cache(
-                cache_key, response.model_dump_json(), ttl=300
-            )  # 5 minutes
-
-            return response
+            return index, historical_data
 
         except Exception as e:
             logger.error(f"Error getting index detail for {symbol}: {e}")
             raise
 
+    async def _get_historical_data(
+        self, symbol: str, period: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Fetch historical data if a period beyond the current day is specified."""
+        if period == "1d":
+            return None
+        return await self.market_provider.get_historical_data(symbol, period)
+
     async def get_quote(self, symbol: str) -> Dict[str, Any]:
         """
         Get real-time quote for a specific symbol.
@@ -180,7 +235,7 @@ class MarketDataService:
 
             if cached_data:
                 logger.info(f"Returning cached quote for {symbol}")
-                return json.loads(cached_data)
+                return orjson.loads(cached_data)
 
             # Fetch quote from provider
             quote_data = await self.market_provider.get_quote(symbol)
@@ -201,7 +256,9 @@ class MarketDataService:
                 logger.info(f"Caching real data for {symbol} with standard TTL")
 
             # Cache with appropriate TTL
-            await self._set_cache(cache_key, json.dumps(quote_data), ttl=cache_ttl)
+            await self._set_cache(
+                cache_key, orjson.dumps(quote_data).decode(), ttl=cache_ttl
+            )
 
             return quote_data
 
@@ -230,20 +287,14 @@ class MarketDataService:
                 return True
 
             # Check for suspiciously round numbers (often indicates mock data)
-            if current_value == int(current_value) and current_value in [
-                100,
-                1000,
-                2000,
-                3000,
-                4500,
-                18000,
-                28000,
-                35000,
-            ]:
+            if (
+                current_value == int(current_value)
+                and current_value in _ROUND_MOCK_VALUES
+            ):
                 return True
 
             # Check for volume patterns typical of mock data
-            if volume > 0 and (volume % 1000000 == 0 or str(volume).endswith("000000")):
+            if volume > 0 and volume % 1000000 == 0:
                 return True
 
             # Check for unusually high volatility (typical of mock random data)
@@ -269,12 +320,14 @@ class MarketDataService:
 
             if cached_data:
                 logger.info("Returning cached market overview")
-                return MarketOverviewResponse.model_validate_json(cached_data)
+                return MarketOverviewResponse.model_validate(orjson.loads(cached_data))
 
             # Fetch indices data
             indices_response = await self.get_indices()
 
-            # TODO: Add bonds, volatility, commodities, currencies
+            # TODO: Add bonds, volatility, commodities, currencies, fetched
+            # alongside indices with asyncio.gather(..., return_exceptions=True)
+            # so one failing provider does not sink the overview
             # For now, just return indices
             response = MarketOverviewResponse(
                 indices=indices_response,
@@ -307,12 +360,10 @@ class MarketDataService:
         try:
             cache_key = f"market_indices_{region or 'all'}"
 
-            # Delete existing cache
-            if self.cache_provider:
-                await self.cache_provider.delete(cache_key)
-
-            # Fetch fresh data
-            await self.get_indices(region)
+            # Overwrite in place rather than delete-then-read: readers keep
+            # the old entry until the new one lands, and a failed fetch
+            # leaves it intact
+            await self._load_indices(region, cache_key)
 
             logger.info(f"Successfully refreshed cache for region: {region}")
             return True
@@ -330,93 +381,98 @@ class MarketDataService:
         us_data = {}
         eu_data = {}
         asia_data = {}
+        by_region = {"us": us_data, "eu": eu_data, "asia": asia_data}
 
         for symbol, data in raw_data.items():
-            if symbol in ["DJIA", "SP500", "NASDAQ", "RUSsell2000", "PHLX_SOX"]:
-                us_data[symbol] = data
-            elif symbol in ["EURO_STOXX50", "FTSE100", "DAX", "CAC40", "IBEX35"]:
-                eu_data[symbol] = data
-            elif symbol in [
-                "NIKKEI225",
-                "TOPIX",
-                "SHANGHAI_COMPOSITE",
-                "HANG_SENG",
-                "KOSPI",
-                "KOSDAQ",
-                "ASX200",
-            ]:
-                asia_data[symbol] = data
+            target = by_region.get(_SYMBOL_REGION.get(symbol))
+            if target is not None:
+                target[symbol] = data
+
+        # One timestamp for the whole response instead of one per index
+        now = datetime.now()
 
         # Build US indices (required)
-        us_indices = self._build_us_indices(us_data)
+        us_indices = self._build_us_indices(us_data, now)
 
         # Build optional regional indices
-        european_indices = self._build_european_indices(eu_data) if eu_data else None
+        european_indices = (
+            self._build_european_indices(eu_data, now) if eu_data else None
+        )
         asia_pacific_indices = (
-            self._build_asia_pacific_indices(asia_data) if asia_data else None
+            self._build_asia_pacific_indices(asia_data, now) if asia_data else None
         )
 
         return MarketIndicesResponse(
             us_indices=us_indices,
             european_indices=european_indices,
             asia_pacific_indices=asia_pacific_indices,
-            timestamp=datetime.now(),
+            timestamp=now,
         )
 
-    def _build_us_indices(self, data: Dict[str, Any]) -> USMarketIndices:
+    def _build_us_indices(self, data: Dict[str, Any], now: datetime) -> USMarketIndices:
         """Build US indices from data."""
         return USMarketIndices(
-            djia=self._build_market_index(data.get("DJIA", {})),
-            sp500=self._build_market_index(data.get("SP500", {})),
-            nasdaq=self._build_market_index(data.get("NASDAQ", {})),
-            russell2000=self._build_market_index(data.get("RUSsell2000", {})),
+            djia=self._build_market_index(data.get("DJIA", {}), now),
+            sp500=self._build_market_index(data.get("SP500", {}), now),
+            nasdaq=self._build_market_index(data.get("NASDAQ", {}), now),
+            russell2000=self._build_market_index(data.get("RUSsell2000", {}), now),
             phlx_sox=(
-                self._build_market_index(data.get("PHLX_SOX"))
+                self._build_market_index(data.get("PHLX_SOX"), now)
                 if "PHLX_SOX" in data
                 else None
             ),
         )
 
-    def _build_european_indices(self, data: Dict[str, Any]) -> EuropeanIndices:
+    def _build_european_indices(
+        self, data: Dict[str, Any], now: datetime
+    ) -> EuropeanIndices:
         """Build European indices from data."""
         return EuropeanIndices(
-            euro_stoxx50=self._build_market_index(data.get("EURO_STOXX50", {})),
-            ftse100=self._build_market_index(data.get("FTSE100", {})),
-            dax=self._build_market_index(data.get("DAX", {})),
-            cac40=self._build_market_index(data.get("CAC40", {})),
+            euro_stoxx50=self._build_market_index(data.get("EURO_STOXX50", {}), now),
+            ftse100=self._build_market_index(data.get("FTSE100", {}), now),
+            dax=self._build_market_index(data.get("DAX", {}), now),
+            cac40=self._build_market_index(data.get("CAC40", {}), now),
             ibex35=(
-                self._build_market_index(data.get("IBEX35"))
+                self._build_market_index(data.get("IBEX35"), now)
                 if "IBEX35" in data
                 else None
             ),
         )
 
-    def _build_asia_pacific_indices(self, data: Dict[str, Any]) -> AsiaPacificIndices:
+    def _build_asia_pacific_indices(
+        self, data: Dict[str, Any], now: datetime
+    ) -> AsiaPacificIndices:
         """Build Asia-Pacific indices from data."""
         return AsiaPacificIndices(
-            nikkei225=self._build_market_index(data.get("NIKKEI225", {})),
+            nikkei225=self._build_market_index(data.get("NIKKEI225", {}), now),
             topix=(
-                self._build_market_index(data.get("TOPIX")) if "TOPIX" in data else None
+                self._build_market_index(data.get("TOPIX"), now)
+                if "TOPIX" in data
+                else None
             ),
             shanghai_composite=self._build_market_index(
-                data.get("SHANGHAI_COMPOSITE", {})
+                data.get("SHANGHAI_COMPOSITE", {}), now
             ),
-            hang_seng=self._build_market_index(data.get("HANG_SENG", {})),
-            kospi=self._build_market_index(data.get("KOSPI", {})),
+            hang_seng=self._build_market_index(data.get("HANG_SENG", {}), now),
+            kospi=self._build_market_index(data.get("KOSPI", {}), now),
             kosdaq=(
-                self._build_market_index(data.get("KOSDAQ"))
+                self._build_market_index(data.get("KOSDAQ"), now)
                 if "KOSDAQ" in data
                 else None
             ),
             asx200=(
-                self._build_market_index(data.get("ASX200"))
+                self._build_market_index(data.get("ASX200"), now)
                 if "ASX200" in data
                 else None
             ),
         )
 
-    def _build_market_index(self, data: Dict[str, Any]) -> MarketIndex:
-        """Build MarketIndex from provider data."""
+    def _build_market_index(
+        self, data: Dict[str, Any], now: Optional[datetime] = None
+    ) -> MarketIndex:
+        """Build MarketIndex from provider data, stamped with now if undated."""
+        if now is None:
+            now = datetime.now()
         if not data:
             # Return placeholder data if no data available
             return MarketIndex(
@@ -425,7 +481,7 @@ class MarketDataService:
                 current_value=0.0,
                 change=0.0,
                 change_percent=0.0,
-                timestamp=datetime.now(),
+                timestamp=now,
                 market_status="closed",
             )
 
@@ -435,7 +491,7 @@ class MarketDataService:
             current_value=data.get("current_value", 0.0),
             change=data.get("change", 0.0),
             change_percent=data.get("change_percent", 0.0),
-            timestamp=data.get("timestamp", datetime.now()),
+            timestamp=data.get("timestamp", now),
             market_status=data.get("market_status", "closed"),
         )
 
@@ -464,7 +520,7 @@ class MarketDataService:
     def _parse_cached_indices(self, cached_data: str) -> MarketIndicesResponse:
         """Parse cached indices data."""
         try:
-            return MarketIndicesResponse.model_validate_json(cached_data)
+            return MarketIndicesResponse.model_validate(orjson.loads(cached_data))
         except Exception as e:
             logger.warning(f"Error parsing cached indices data: {e}")
             raise
@@ -561,16 +617,26 @@ class MarketDataService:
 
 
 # Factory function for creating MarketDataService with proper dependencies
-def create_market_data_service() -> MarketDataService:
+def create_market_data_service(request: Request) -> MarketDataService:
     """
     Factory function to create MarketDataService with dependencies.
     Follows Dependency Injection pattern.
     """
     from app.services.providers.alpha_vantage import AlphaVantageProvider
 
-    market_provider = AlphaVantageProvider()
-    # For now, create without cache provider to avoid FastAPI dependency issues
-    return MarketDataService(market_provider, None)
+    market_provider = AlphaVantageProvider(
+        client=request.app.state.http_client,
+        semaphore=request.app.state.market_semaphore,
+    )
+    # Share the ARQ pool's Redis client, as create_economic_data_service does;
+    # without Redis the service runs uncached
+    redis_client = request.app.state.arq
+    cache_provider = (
+        RedisCacheProvider(redis_client, prefix="market:")
+        if redis_client is not None
+        else None
+    )
+    return MarketDataService(market_provider, cache_provider)
 
 
 # Singleton instance
@@ -1,10 +1,13 @@
+from fastapi import Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, func
-from typing import List, Optional, Dict, Tuple
+from typing import Iterator, List, Optional, Dict, Tuple
 from datetime import datetime, timedelta, timezone
 import pandas as pd
 import numpy as np
 from collections import defaultdict
+import csv
+import io
 
 from app.models.portfolio import (
     Portfolio,
@@ -24,13 +27,14 @@ from app.schemas.portfolio import (
     PortfolioPerformance,
     DividendAnalysis,
     PortfolioAllocation,
+    PortfolioDashboard,
     RiskMetrics,
     ChartData,
-    ChartDataPoint,
     PerformanceDataPoint,
     DividendDataPoint,
     AssetAllocation,
 )
+from app.core.database import get_sync_db
 from app.repositories.portfolio_repository import (
     PortfolioRepository,
     HoldingRepository,
@@ -41,6 +45,36 @@ from app.repositories.portfolio_repository import (
 # TODO: Re-enable when market_data_service is properly implemented
 # from app.services.market_data_service import market_data_service
 
+# Reasonable mock prices/yields until market data integration lands
+MOCK_PRICES = {
+    "AAPL": 150.0,
+    "GOOGL": 120.0,
+    "MSFT": 300.0,
+    "TSLA": 200.0,
+    "NVDA": 400.0,
+    "AMZN": 140.0,
+}
+MOCK_DIVIDEND_YIELDS = {
+    "AAPL": 0.5,
+    "GOOGL": 0.0,
+    "MSFT": 0.7,
+    "TSLA": 0.0,
+    "NVDA": 0.1,
+    "AMZN": 0.0,
+}
+
+
+TRANSACTION_CSV_COLUMNS = [
+    "date",
+    "symbol",
+    "type",
+    "quantity",
+    "price",
+    "fees",
+    "total_amount",
+    "notes",
+]
+
 
 class PortfolioService:
     def __init__(self, db: Session):
@@ -60,15 +94,17 @@ class PortfolioService:
             portfolio_data.dividend_strategy.value
         )
 
-        portfolio_data_dict = portfolio_data.dict()
+        portfolio_data_dict = portfolio_data.model_dump()
         portfolio_data_dict["dividend_strategy"] = strategy_enum_member
 
         # Use repository to create portfolio
-        return self.portfolio_repo.create(
+        portfolio = self.portfolio_repo.create(
             obj_in=portfolio_data,
             user_id=user_id,
             dividend_strategy=strategy_enum_member,
         )
+        self.db.commit()
+        return portfolio
 
     def get_portfolios(self, user_id: str) -> List[Portfolio]:
         """Get all portfolios for a user"""
@@ -86,7 +122,9 @@ class PortfolioService:
         if not portfolio:
             return None
 
-        return self.portfolio_repo.update(db_obj=portfolio, obj_in=update_data)
+        portfolio = self.portfolio_repo.update(db_obj=portfolio, obj_in=update_data)
+        self.db.commit()
+        return portfolio
 
     def delete_portfolio(self, portfolio_id: int, user_id: str) -> bool:
         """Delete a portfolio"""
@@ -94,7 +132,9 @@ class PortfolioService:
         if not portfolio:
             return False
 
-        return self.portfolio_repo.delete(id=portfolio_id)
+        self.portfolio_repo.delete(id=portfolio_id)
+        self.db.commit()
+        return True
 
     # Transaction Operations
     def get_transactions(self, portfolio_id: int, user_id: str) -> List[Transaction]:
@@ -105,6 +145,44 @@ class PortfolioService:
 
         return self.transaction_repo.get_by_portfolio(portfolio_id)
 
+    def export_transactions_csv(
+        self, portfolio_id: int, user_id: str
+    ) -> Optional[Iterator[str]]:
+        """Stream a portfolio's full transaction history as CSV chunks"""
+        portfolio = self.get_portfolio(portfolio_id, user_id)
+        if not portfolio:
+            return None
+
+        return self._iter_transactions_csv(portfolio_id)
+
+    def _iter_transactions_csv(
+        self, portfolio_id: int, chunk: int = 1000
+    ) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(TRANSACTION_CSV_COLUMNS)
+
+        transactions = self.transaction_repo.iter_by_portfolio(portfolio_id, chunk)
+        for count, transaction in enumerate(transactions, start=1):
+            writer.writerow(
+                [
+                    transaction.transaction_date.isoformat(),
+                    transaction.symbol,
+                    transaction.transaction_type.value,
+                    transaction.quantity,
+                    transaction.price,
+                    transaction.fees,
+                    transaction.total_amount,
+                    transaction.notes or "",
+                ]
+            )
+            if count % chunk == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+
+        yield buffer.getvalue()
+
     def add_transaction(
         self, portfolio_id: int, user_id: str, transaction_data: TransactionCreate
     ) -> Optional[Transaction]:
@@ -140,7 +218,7 @@ class PortfolioService:
             )
 
         # Create transaction with holding_id using repository
-        transaction_dict = transaction_data.dict()
+        transaction_dict = transaction_data.model_dump()
         transaction_dict.update(
             {
                 "portfolio_id": portfolio_id,
@@ -150,6 +228,8 @@ class PortfolioService:
         )
 
         db_transaction = self.transaction_repo.create_transaction(transaction_dict)
+        # Holding change and transaction row commit together
+        self.db.commit()
         print(f"DEBUG: Created transaction with holding_id={db_transaction.holding_id}")
         return db_transaction
 
@@ -184,11 +264,123 @@ class PortfolioService:
 
         holdings = self.holding_repo.get_by_portfolio(portfolio_id)
         transactions = self.transaction_repo.get_by_portfolio(portfolio_id, limit=10)
+        # One grouped SUM covers both invested and dividend totals
+        totals = self.transaction_repo.aggregate_totals(portfolio_id)
+
+        return self._build_summary(
+            portfolio,
+            holdings,
+            transactions,
+            total_invested=totals[TransactionType.buy] - totals[TransactionType.sell],
+            # Value the holdings already loaded instead of re-selecting them
+            total_value=self._calculate_holdings_value(holdings),
+            total_dividends=totals[TransactionType.dividend],
+        )
+
+    def get_portfolio_performance(
+        self,
+        portfolio_id: int,
+        user_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Optional[PortfolioPerformance]:
+        """Get portfolio performance over time"""
+        portfolio = self.get_portfolio(portfolio_id, user_id)
+        if not portfolio:
+            return None
+
+        return self._build_performance(
+            portfolio,
+            start_date,
+            end_date,
+            total_invested=self._calculate_total_invested(portfolio_id),
+        )
+
+    def get_dividend_analysis(
+        self, portfolio_id: int, user_id: str
+    ) -> Optional[DividendAnalysis]:
+        """Get dividend analysis for portfolio"""
+        portfolio = self.get_portfolio(portfolio_id, user_id)
+        if not portfolio:
+            return None
+
+        return self._build_dividend_analysis(
+            portfolio_id,
+            self.dividend_repo.get_by_portfolio(portfolio_id),
+            total_value=self._calculate_current_portfolio_value(portfolio_id),
+        )
+
+    def get_asset_allocation(
+        self, portfolio_id: int, user_id: str
+    ) -> Optional[PortfolioAllocation]:
+        """Get asset allocation breakdown"""
+        portfolio = self.get_portfolio(portfolio_id, user_id)
+        if not portfolio:
+            return None
 
-        # Calculate portfolio metrics
-        total_invested = self._calculate_total_invested(portfolio_id)
-        total_value = self._calculate_current_portfolio_value(portfolio_id)
-        total_dividends = self._calculate_total_dividends(portfolio_id)
+        holdings = self.holding_repo.get_by_portfolio(portfolio_id)
+        return self._build_allocation(
+            portfolio_id,
+            holdings,
+            total_value=self._calculate_holdings_value(holdings),
+        )
+
+    def get_portfolio_dashboard(
+        self, portfolio_id: int, user_id: str
+    ) -> Optional[PortfolioDashboard]:
+        """Get every dashboard section from a single load of the portfolio data"""
+        portfolio = self.portfolio_repo.get_with_holdings(user_id, portfolio_id)
+        if not portfolio:
+            return None
+
+        holdings = portfolio.holdings
+        dividends = self.dividend_repo.get_by_portfolio(portfolio_id)
+
+        # One grouped SUM covers both invested and dividend totals; only the
+        # ten most recent rows are built as ORM objects
+        totals = self.transaction_repo.aggregate_totals(portfolio_id)
+        total_invested = totals[TransactionType.buy] - totals[TransactionType.sell]
+        total_dividends = totals[TransactionType.dividend]
+        total_value = self._calculate_holdings_value(holdings)
+
+        summary = self._build_summary(
+            portfolio,
+            holdings,
+            self.transaction_repo.get_by_portfolio(portfolio_id, limit=10),
+            total_invested=total_invested,
+            total_value=total_value,
+            total_dividends=total_dividends,
+        )
+        performance = self._build_performance(
+            portfolio, None, None, total_invested=total_invested
+        )
+        dividend_analysis = self._build_dividend_analysis(
+            portfolio_id, dividends, total_value=total_value
+        )
+        allocation = self._build_allocation(
+            portfolio_id, holdings, total_value=total_value
+        )
+
+        return PortfolioDashboard(
+            summary=summary,
+            performance=performance,
+            dividends=dividend_analysis,
+            allocation=allocation,
+            value_chart=self._build_value_chart(performance),
+            dividend_chart=self._build_dividend_chart(dividend_analysis),
+        )
+
+    # Section builders shared by the single-section endpoints and the dashboard
+    def _build_summary(
+        self,
+        portfolio: Portfolio,
+        holdings: List[Holding],
+        recent_transactions: List[Transaction],
+        total_invested: float,
+        total_value: float,
+        total_dividends: float,
+    ) -> PortfolioSummary:
+        """Assemble the portfolio summary from preloaded data"""
         total_return = total_value - total_invested + total_dividends
         return_percentage = (
             (total_return / total_invested * 100) if total_invested > 0 else 0
@@ -203,21 +395,18 @@ class PortfolioService:
             total_dividends=total_dividends,
             holdings_count=len(holdings),
             top_holdings=holdings[:5],  # Top 5 holdings
-            recent_transactions=transactions,
+            recent_transactions=recent_transactions,
         )
 
-    def get_portfolio_performance(
+    def _build_performance(
         self,
-        portfolio_id: int,
-        user_id: str,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-    ) -> Optional[PortfolioPerformance]:
-        """Get portfolio performance over time"""
-        portfolio = self.get_portfolio(portfolio_id, user_id)
-        if not portfolio:
-            return None
-
+        portfolio: Portfolio,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        total_invested: float,
+    ) -> PortfolioPerformance:
+        """Assemble portfolio performance from snapshots or mock growth data"""
+        portfolio_id = portfolio.id
         if not start_date:
             start_date = portfolio.created_at
         if not end_date:
@@ -238,63 +427,78 @@ class PortfolioService:
             .all()
         )
 
-        data_points = []
+        daily_totals = (
+            []
+            if snapshots
+            else self._get_daily_totals(portfolio_id, start_date, end_date)
+        )
 
         if snapshots:
             # Use actual snapshot data
-            for snapshot in snapshots:
-                data_points.append(
-                    PerformanceDataPoint(
-                        date=snapshot.snapshot_date.isoformat(),
-                        portfolio_value=snapshot.total_value,
-                        total_invested=snapshot.total_invested,
-                        total_return=snapshot.total_return,
-                        return_percentage=snapshot.return_percentage,
-                        dividends=snapshot.total_dividends,
-                    )
-                )
+            data_points = performance_points(
+                dates=[snapshot.snapshot_date.isoformat() for snapshot in snapshots],
+                portfolio_values=[snapshot.total_value for snapshot in snapshots],
+                total_invested=[snapshot.total_invested for snapshot in snapshots],
+                total_returns=[snapshot.total_return for snapshot in snapshots],
+                return_percentages=[
+                    snapshot.return_percentage for snapshot in snapshots
+                ],
+                dividends=[snapshot.total_dividends for snapshot in snapshots],
+            )
+        elif daily_totals:
+            # Cost-basis history from the daily rollup; no historical prices
+            # are stored, so value is carried at the amount invested
+            invested = np.array([day.invested for day in daily_totals], dtype=float)
+            dividends = np.array([day.dividends for day in daily_totals], dtype=float)
+            return_percentages = np.divide(
+                dividends * 100,
+                invested,
+                out=np.zeros_like(invested),
+                where=invested > 0,
+            )
+            data_points = performance_points(
+                dates=[day.day.isoformat() for day in daily_totals],
+                portfolio_values=invested.tolist(),
+                total_invested=invested.tolist(),
+                total_returns=dividends.tolist(),
+                return_percentages=return_percentages.tolist(),
+                dividends=dividends.tolist(),
+            )
         else:
-            # Generate mock data for demo purposes
-            total_invested = self._calculate_total_invested(portfolio_id)
-            current_value = self._calculate_current_portfolio_value(portfolio_id)
-
-            # Generate 6 months of mock data
-            current_date = start_date
-            months = 0
-            while current_date <= end_date and months < 6:
-                # Simulate realistic portfolio growth
-                growth_factor = 1 + (0.08 * months / 12)  # 8% annual growth
-                volatility = (
-                    0.03 * (months % 3 - 1) if months > 0 else 0
-                )  # Some volatility
-
-                if months == 0:
-                    # Start with total invested
-                    portfolio_value = total_invested
-                    dividends = 0
-                else:
-                    portfolio_value = total_invested * growth_factor * (1 + volatility)
-                    dividends = (
-                        total_invested * 0.025 * months / 12
-                    )  # 2.5% annual dividend yield
-
-                total_return = portfolio_value - total_invested + dividends
-                return_percentage = (
-                    (total_return / total_invested * 100) if total_invested > 0 else 0
-                )
+            # Generate up to 6 months of mock data for demo purposes
+            steps = 0
+            if end_date >= start_date:
+                steps = min(6, (end_date - start_date) // timedelta(days=30) + 1)
+            months = np.arange(steps)
+
+            # Simulate realistic portfolio growth: 8% annual growth with some
+            # volatility and a 2.5% annual dividend yield
+            growth_factor = 1 + (0.08 * months / 12)
+            volatility = np.where(months > 0, 0.03 * (months % 3 - 1), 0.0)
+            portfolio_values = np.where(
+                months > 0,
+                total_invested * growth_factor * (1 + volatility),
+                total_invested,  # Start with total invested
+            )
+            dividends = np.where(months > 0, total_invested * 0.025 * months / 12, 0.0)
+            total_returns = portfolio_values - total_invested + dividends
+            return_percentages = (
+                total_returns / total_invested * 100
+                if total_invested > 0
+                else np.zeros(steps)
+            )
 
-                data_points.append(
-                    PerformanceDataPoint(
-                        date=current_date.isoformat(),
-                        portfolio_value=portfolio_value,
-                        total_invested=total_invested,
-                        total_return=total_return,
-                        return_percentage=return_percentage,
-                        dividends=dividends,
-                    )
-                )
-                current_date += timedelta(days=30)  # Monthly data points
-                months += 1
+            data_points = performance_points(
+                dates=[
+                    (start_date + timedelta(days=30 * month)).isoformat()
+                    for month in months.tolist()
+                ],
+                portfolio_values=portfolio_values.tolist(),
+                total_invested=[total_invested] * steps,
+                total_returns=total_returns.tolist(),
+                return_percentages=return_percentages.tolist(),
+                dividends=dividends.tolist(),
+            )
 
         # Calculate metrics
         metrics = self._calculate_portfolio_metrics(portfolio_id, start_date, end_date)
@@ -307,16 +511,13 @@ class PortfolioService:
             metrics=metrics,
         )
 
-    def get_dividend_analysis(
-        self, portfolio_id: int, user_id: str
-    ) -> Optional[DividendAnalysis]:
-        """Get dividend analysis for portfolio"""
-        portfolio = self.get_portfolio(portfolio_id, user_id)
-        if not portfolio:
-            return None
-
-        dividends = self.dividend_repo.get_by_portfolio(portfolio_id)
-
+    def _build_dividend_analysis(
+        self,
+        portfolio_id: int,
+        dividends: List[DividendPayment],
+        total_value: float,
+    ) -> DividendAnalysis:
+        """Assemble dividend analysis from preloaded dividend payments"""
         # Group dividends by month
         monthly_dividends = defaultdict(float)
         cumulative_dividend = 0
@@ -329,13 +530,10 @@ class PortfolioService:
                 monthly_dividends[month_key] += dividend.total_dividend
                 cumulative_dividend += dividend.total_dividend
 
-                # Calculate dividend yield (simplified)
-                portfolio_value = self._calculate_portfolio_value_at_date(
-                    portfolio_id, dividend.payment_date
-                )
+                # Historical valuation would need price history; use current value
                 dividend_yield = (
-                    (dividend.total_dividend / portfolio_value * 100)
-                    if portfolio_value > 0
+                    (dividend.total_dividend / total_value * 100)
+                    if total_value > 0
                     else 0
                 )
 
@@ -348,13 +546,10 @@ class PortfolioService:
                     )
                 )
         else:
-            # Generate mock dividend data for demo
-            portfolio_value = self._calculate_current_portfolio_value(portfolio_id)
-
-            # Generate 6 months of mock dividend data
+            # Generate 6 months of mock dividend data for demo
             for month in range(6):
                 date = datetime.now() - timedelta(days=30 * (5 - month))
-                monthly_dividend = portfolio_value * 0.02 / 12  # 2% annual yield
+                monthly_dividend = total_value * 0.02 / 12  # 2% annual yield
                 cumulative_dividend += monthly_dividend
                 dividend_yield = 2.0  # 2% yield
 
@@ -386,17 +581,10 @@ class PortfolioService:
             data_points=data_points,
         )
 
-    def get_asset_allocation(
-        self, portfolio_id: int, user_id: str
-    ) -> Optional[PortfolioAllocation]:
-        """Get asset allocation breakdown"""
-        portfolio = self.get_portfolio(portfolio_id, user_id)
-        if not portfolio:
-            return None
-
-        holdings = self.holding_repo.get_by_portfolio(portfolio_id)
-        total_value = self._calculate_current_portfolio_value(portfolio_id)
-
+    def _build_allocation(
+        self, portfolio_id: int, holdings: List[Holding], total_value: float
+    ) -> PortfolioAllocation:
+        """Assemble asset allocation from preloaded holdings"""
         allocations = []
         sector_breakdown = defaultdict(float)
 
@@ -431,14 +619,29 @@ class PortfolioService:
         """Calculate total amount invested"""
         return self.transaction_repo.calculate_total_invested(portfolio_id)
 
+    def _get_daily_totals(
+        self, portfolio_id: int, start_date: datetime, end_date: datetime
+    ) -> List:
+        """Daily rollup rows; the materialized view only exists on PostgreSQL"""
+        if self.db.get_bind().dialect.name != "postgresql":
+            return []
+        return self.transaction_repo.get_daily_totals(
+            portfolio_id, start_date, end_date
+        )
+
     def _calculate_current_portfolio_value(self, portfolio_id: int) -> float:
         """Calculate current portfolio value"""
         holdings = self.holding_repo.get_active_holdings(portfolio_id)
+        return self._calculate_holdings_value(holdings)
+
+    def _calculate_holdings_value(self, holdings: List[Holding]) -> float:
+        """Calculate the current value of the given holdings"""
         total_value = 0
 
         for holding in holdings:
-            current_price = self._get_current_price(holding.symbol)
-            total_value += holding.quantity * current_price
+            if holding.quantity > 0:
+                current_price = self._get_current_price(holding.symbol)
+                total_value += holding.quantity * current_price
 
         return total_value
 
@@ -446,14 +649,6 @@ class PortfolioService:
         """Calculate total dividends received"""
         return self.transaction_repo.calculate_total_dividends(portfolio_id)
 
-    def _calculate_portfolio_value_at_date(
-        self, portfolio_id: int, date: datetime
-    ) -> float:
-        """Calculate portfolio value at specific date"""
-        # This would require historical price data
-        # For now, return current value as placeholder
-        return self._calculate_current_portfolio_value(portfolio_id)
-
     def _calculate_dividend_growth_rate(
         self, monthly_dividends: Dict[str, float]
     ) -> float:
@@ -502,30 +697,12 @@ class PortfolioService:
     def _get_current_price(self, symbol: str) -> float:
         """Get current price for symbol - placeholder implementation"""
         # TODO: Implement proper market data service integration
-        # For now, return a reasonable mock price based on symbol
-        mock_prices = {
-            "AAPL": 150.0,
-            "GOOGL": 120.0,
-            "MSFT": 300.0,
-            "TSLA": 200.0,
-            "NVDA": 400.0,
-            "AMZN": 140.0,
-        }
-        return mock_prices.get(symbol, 100.0)  # Default price if symbol not found
+        return MOCK_PRICES.get(symbol, 100.0)  # Default price if symbol not found
 
     def _get_dividend_yield(self, symbol: str) -> Optional[float]:
         """Get dividend yield for symbol - placeholder implementation"""
         # TODO: Implement proper market data service integration
-        # For now, return a reasonable mock dividend yield
-        mock_yields = {
-            "AAPL": 0.5,
-            "GOOGL": 0.0,
-            "MSFT": 0.7,
-            "TSLA": 0.0,
-            "NVDA": 0.1,
-            "AMZN": 0.0,
-        }
-        return mock_yields.get(symbol, 0.2)  # Default 0.2% yield
+        return MOCK_DIVIDEND_YIELDS.get(symbol, 0.2)  # Default 0.2% yield
 
     # Chart Data Generation
     def get_portfolio_value_chart(
@@ -536,30 +713,7 @@ class PortfolioService:
         if not performance:
             return None
 
-        data_points = []
-        for point in performance.data_points:
-            # Handle both datetime and string date formats
-            date_str = (
-                point.date.isoformat()
-                if hasattr(point.date, "isoformat")
-                else str(point.date)
-            )
-
-            data_points.append(
-                ChartDataPoint(
-                    x=date_str,
-                    y=point.portfolio_value,
-                    label=f"${point.portfolio_value:,.2f}",
-                )
-            )
-
-        return ChartData(
-            chart_type="line",
-            title="Portfolio Value Over Time",
-            x_axis_label="Date",
-            y_axis_label="Value ($)",
-            data=data_points,
-        )
+        return self._build_value_chart(performance)
 
     def get_dividend_chart(
         self, portfolio_id: int, user_id: str
@@ -569,18 +723,72 @@ class PortfolioService:
         if not analysis:
             return None
 
-        chart_points = [
-            ChartDataPoint(
-                x=point.date,  # Already formatted string "YYYY-MM"
-                y=point.monthly_dividend,
-            )
-            for point in analysis.data_points
-        ]
+        return self._build_dividend_chart(analysis)
+
+    # Chart builders read already-validated models, so skip re-validating
+    # their x/y lists
+    def _build_value_chart(self, performance: PortfolioPerformance) -> ChartData:
+        """Build the portfolio value line chart from performance data"""
+        # PerformanceDataPoint.date is already an ISO formatted string
+        dates = [point.date for point in performance.data_points]
+        values = [point.portfolio_value for point in performance.data_points]
+
+        return ChartData.model_construct(
+            chart_type="line",
+            title="Portfolio Value Over Time",
+            x_axis_label="Date",
+            y_axis_label="Value ($)",
+            x=dates,
+            y=values,
+            labels=[f"${value:,.2f}" for value in values],
+        )
 
-        return ChartData(
+    def _build_dividend_chart(self, analysis: DividendAnalysis) -> ChartData:
+        """Build the monthly dividend bar chart from a dividend analysis"""
+        return ChartData.model_construct(
             chart_type="bar",
             title="Monthly Dividend Income",
             x_axis_label="Month",
             y_axis_label="Dividend Amount",
-            data=chart_points,
+            x=[point.date for point in analysis.data_points],
+            y=[point.monthly_dividend for point in analysis.data_points],
         )
+
+
+def performance_points(
+    dates: List[str],
+    portfolio_values: List[float],
+    total_invested: List[float],
+    total_returns: List[float],
+    return_percentages: List[float],
+    dividends: List[float],
+) -> List[PerformanceDataPoint]:
+    """
+    Zip parallel performance columns into data points.
+
+    Points are validated on construction: for flat models the pydantic-core
+    constructor is faster than model_construct, which runs in Python.
+    """
+    return [
+        PerformanceDataPoint(
+            date=date,
+            portfolio_value=value,
+            total_invested=invested,
+            total_return=total_return,
+            return_percentage=return_percentage,
+            dividends=dividend,
+        )
+        for date, value, invested, total_return, return_percentage, dividend in zip(
+            dates,
+            portfolio_values,
+            total_invested,
+            total_returns,
+            return_percentages,
+            dividends,
+        )
+    ]
+
+
+def get_portfolio_service(db: Session = Depends(get_sync_db)) -> PortfolioService:
+    """FastAPI dependency providing one PortfolioService per request."""
+    return PortfolioService(db)
@@ -1,10 +1,11 @@
-import requests
 import asyncio
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import logging
 import time
 
+import httpx
+
 from app.services.providers.base import MarketDataProvider, DataTransformer
 from app.core.config import settings
 
@@ -42,12 +43,22 @@ class AlphaVantageProvider(MarketDataProvider):
         "DXY": "UUP",  # Invesco DB US Dollar Index Bullish Fund
     }
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ):
         self.api_key = api_key or settings.alpha_vantage_api_key
         self.transformer = AlphaVantageTransformer()
         self.base_url = "https://www.alphavantage.co/query"
         self.request_delay = 12.0  # Alpha Vantage free tier: 5 requests per minute
-        self.last_request_time = 0
+        self.last_request_time = float("-inf")
+        self._rate_limit_lock = asyncio.Lock()
+        self._client = client
+        self._semaphore = semaphore or asyncio.Semaphore(
+            settings.market_max_concurrency
+        )
 
         if not self.api_key:
             logger.warning(
@@ -70,10 +81,7 @@ class AlphaVantageProvider(MarketDataProvider):
                 symbols = ["DJIA", "SP500", "NASDAQ", "NIKKEI225", "HANG_SENG", "KOSPI"]
 
             # Fetch data for each symbol
-            loop = asyncio.get_event_loop()
-            raw_data = await loop.run_in_executor(
-                None, self._fetch_multiple_quotes, symbols
-            )
+            raw_data = await self._fetch_multiple_quotes(symbols)
 
             return self.transformer.transform_market_data(raw_data)
 
@@ -86,10 +94,7 @@ class AlphaVantageProvider(MarketDataProvider):
         try:
             alpha_symbol = self.SYMBOL_MAPPING.get(symbol, symbol)
 
-            loop = asyncio.get_event_loop()
-            data = await loop.run_in_executor(
-                None, self._fetch_single_quote, alpha_symbol
-            )
+            data = await self._fetch_single_quote(alpha_symbol)
 
             return self.transformer.transform_quote_data(data, symbol)
 
@@ -104,10 +109,7 @@ class AlphaVantageProvider(MarketDataProvider):
         try:
             alpha_symbol = self.SYMBOL_MAPPING.get(symbol, symbol)
 
-            loop = asyncio.get_event_loop()
-            data = await loop.run_in_executor(
-                None, self._fetch_historical_data, alpha_symbol
-            )
+            data = await self._fetch_historical_data(alpha_symbol)
 
             return self.transformer.transform_historical_data(data, symbol)
 
@@ -115,24 +117,35 @@ class AlphaVantageProvider(MarketDataProvider):
             logger.error(f"Error fetching historical data for {symbol}: {e}")
             raise
 
-    def _wait_for_rate_limit(self):
+    async def _wait_for_rate_limit(self):
         """Ensure we don't exceed Alpha Vantage rate limits."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+        # Serialize slot allocation so concurrent callers still respect the delay
+        async with self._rate_limit_lock:
+            current_time = time.monotonic()
+            time_since_last = current_time - self.last_request_time
+
+            if time_since_last < self.request_delay:
+                sleep_time = self.request_delay - time_since_last
+                logger.info(
+                    f"Alpha Vantage rate limiting: waiting {sleep_time:.1f} seconds"
+                )
+                await asyncio.sleep(sleep_time)
 
-        if time_since_last < self.request_delay:
-            sleep_time = self.request_delay - time_since_last
-            logger.info(
-                f"Alpha Vantage rate limiting: waiting {sleep_time:.1f} seconds"
-            )
-            time.sleep(sleep_time)
+            self.last_request_time = time.monotonic()
+
+    async def _get(self, params: Dict[str, Any]) -> httpx.Response:
+        """Issue a GET against Alpha Vantage, reusing the shared client."""
+        async with self._semaphore:
+            if self._client is not None:
+                return await self._client.get(self.base_url, params=params)
 
-        self.last_request_time = time.time()
+            async with httpx.AsyncClient(timeout=30.0) as client:
+                return await client.get(self.base_url, params=params)
 
-    def _fetch_single_quote(self, symbol: str) -> Dict[str, Any]:
+    async def _fetch_single_quote(self, symbol: str) -> Dict[str, Any]:
         """Fetch single quote from Alpha Vantage."""
         try:
-            self._wait_for_rate_limit()
+            await self._wait_for_rate_limit()
 
             params = {
                 "function": "GLOBAL_QUOTE",
@@ -140,7 +153,7 @@ class AlphaVantageProvider(MarketDataProvider):
                 "apikey": self.api_key,
             }
 
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = await self._get(params)
             response.raise_for_status()
 
             data = response.json()
@@ -171,14 +184,14 @@ class AlphaVantageProvider(MarketDataProvider):
             logger.error(f"Failed to fetch Alpha Vantage data for {symbol}: {e}")
             raise
 
-    def _fetch_multiple_quotes(self, symbols: List[str]) -> Dict[str, Any]:
+    async def _fetch_multiple_quotes(self, symbols: List[str]) -> Dict[str, Any]:
         """Fetch multiple quotes from Alpha Vantage."""
         result = {}
 
         for symbol in symbols:
             try:
                 alpha_symbol = self.SYMBOL_MAPPING.get(symbol, symbol)
-                quote_data = self._fetch_single_quote(alpha_symbol)
+                quote_data = await self._fetch_single_quote(alpha_symbol)
                 result[symbol] = quote_data
             except Exception as e:
                 logger.warning(f"Failed to fetch data for {symbol}: {e}")
@@ -187,10 +200,10 @@ class AlphaVantageProvider(MarketDataProvider):
 
         return result
 
-    def _fetch_historical_data(self, symbol: str) -> Dict[str, Any]:
+    async def _fetch_historical_data(self, symbol: str) -> Dict[str, Any]:
         """Fetch historical data from Alpha Vantage."""
         try:
-            self._wait_for_rate_limit()
+            await self._wait_for_rate_limit()
 
             params = {
                 "function": "TIME_SERIES_DAILY",
@@ -198,7 +211,7 @@ class AlphaVantageProvider(MarketDataProvider):
                 "apikey": self.api_key,
             }
 
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = await self._get(params)
             response.raise_for_status()
 
             data = response.json()
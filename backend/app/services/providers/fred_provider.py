@@ -3,7 +3,7 @@ import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import httpx
-from fredapi import Fred
+import pandas as pd
 
 from app.services.providers.base import EconomicDataProvider, DataTransformer
 from app.core.config import settings
@@ -104,34 +104,35 @@ class FREDProvider(EconomicDataProvider):
         },
     }
 
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize FRED provider with API key."""
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ):
+        """Initialize FRED provider with API key and optional shared HTTP client."""
         self.api_key = api_key or settings.fred_api_key
         if not self.api_key:
             logger.warning("FRED API key not provided. Some features may not work.")
-            self.fred_client = None
-        else:
-            self.fred_client = Fred(api_key=self.api_key)
 
+        self._client = client
+        self._semaphore = semaphore or asyncio.Semaphore(settings.fred_max_concurrency)
         self.transformer = FREDTransformer()
         self.base_url = "https://api.stlouisfed.org/fred"
 
+    def use_client(self, client: Optional[httpx.AsyncClient]) -> None:
+        """Send requests through client; None goes back to per-call clients."""
+        self._client = client
+
     async def get_economic_series(self, series_id: str) -> Dict[str, Any]:
         """Fetch single economic data series from FRED."""
-        if not self.fred_client:
+        if not self.api_key:
             return self._get_mock_data(series_id)
 
         try:
-            loop = asyncio.get_event_loop()
-
-            # Get series data
-            series_data = await loop.run_in_executor(
-                None, self._fetch_series_data, series_id
-            )
-
-            # Get series info
-            series_info = await loop.run_in_executor(
-                None, self._fetch_series_info, series_id
+            series_data, series_info = await asyncio.gather(
+                self._fetch_series_data(series_id),
+                self._fetch_series_info(series_id),
             )
 
             return self.transformer.transform_economic_data(
@@ -150,7 +151,7 @@ class FREDProvider(EconomicDataProvider):
         """Fetch multiple economic data series from FRED."""
         result = {}
 
-        if not self.fred_client:
+        if not self.api_key:
             return {
                 series_id: self._get_mock_data(series_id) for series_id in series_ids
             }
@@ -187,20 +188,53 @@ class FREDProvider(EconomicDataProvider):
 
     async def get_all_indicators(self) -> Dict[str, Any]:
         """Get all supported economic indicators."""
-        all_series = list(self.FRED_SERIES_MAPPING.keys())
-        return await self.get_multiple_series(all_series)
+        return await self.get_multiple_series(list(self.FRED_SERIES_MAPPING))
+
+    async def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Issue a GET against the FRED REST API, reusing the shared client."""
+        url = f"{self.base_url}/{path}"
+        params = {**params, "api_key": self.api_key, "file_type": "json"}
+
+        async with self._semaphore:
+            if self._client is not None:
+                response = await self._client.get(url, params=params)
+            else:
+                async with httpx.AsyncClient(timeout=30.0) as client:
+                    response = await client.get(url, params=params)
 
-    def _fetch_series_data(self, series_id: str):
-        """Synchronous helper to fetch series data."""
+        response.raise_for_status()
+        return response.json()
+
+    async def _fetch_series_data(self, series_id: str) -> pd.Series:
+        """Fetch series observations as a date-indexed pandas Series."""
         # Get data for the last 2 years
         end_date = datetime.now()
         start_date = end_date - timedelta(days=730)
 
-        return self.fred_client.get_series(series_id, start=start_date, end=end_date)
-
-    def _fetch_series_info(self, series_id: str):
-        """Synchronous helper to fetch series metadata."""
-        return self.fred_client.get_series_info(series_id)
+        payload = await self._get(
+            "series/observations",
+            {
+                "series_id": series_id,
+                "observation_start": start_date.strftime("%Y-%m-%d"),
+                "observation_end": end_date.strftime("%Y-%m-%d"),
+            },
+        )
+
+        # FRED marks missing observations with "."
+        observations = [
+            obs for obs in payload.get("observations", []) if obs.get("value") != "."
+        ]
+        return pd.Series(
+            [float(obs["value"]) for obs in observations],
+            index=pd.to_datetime([obs["date"] for obs in observations]),
+            dtype="float64",
+        )
+
+    async def _fetch_series_info(self, series_id: str) -> Dict[str, Any]:
+        """Fetch series metadata."""
+        payload = await self._get("series", {"series_id": series_id})
+        seriess = payload.get("seriess") or [{}]
+        return seriess[0]
 
     def _get_mock_data(self, series_id: str) -> Dict[str, Any]:
         """Generate mock data when FRED API is not available."""
@@ -289,9 +323,8 @@ class FREDTransformer(DataTransformer):
                 "timestamp": datetime.now(),
                 "country": "US",
                 "category": mapping.get("category", "general"),
-                "last_updated": (
-                    series_data.index[-1] if not series_data.empty else datetime.now()
-                ),
+                # Plain datetime so consumers never need to parse it
+                "last_updated": series_data.index[-1].to_pydatetime(),
             }
 
         except Exception as e:
@@ -0,0 +1,32 @@
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from app.services.providers.base import CacheProvider
+
+
+class RedisCacheProvider(CacheProvider):
+    """Redis-backed cache provider, shared by every worker process."""
+
+    def __init__(self, client: Redis, prefix: str = "econ:"):
+        self._client = client
+        self._prefix = prefix
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get cached data."""
+        value = await self._client.get(self._prefix + key)
+        if isinstance(value, bytes):
+            return value.decode()
+        return value
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        """Set cached data with TTL."""
+        await self._client.set(self._prefix + key, value, ex=ttl)
+
+    async def delete(self, key: str) -> None:
+        """Delete cached data."""
+        await self._client.delete(self._prefix + key)
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists in cache."""
+        return bool(await self._client.exists(self._prefix + key))
@@ -60,7 +60,7 @@ class YahooFinanceProvider(MarketDataProvider):
     def __init__(self):
         self.transformer = YahooFinanceTransformer()
         self.request_delay = 3.0  # Further increased delay
-        self.last_request_time = 0
+        self.last_request_time = float("-inf")
         self.max_retries = 3  # Add retry mechanism
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
@@ -152,7 +152,7 @@ class YahooFinanceProvider(MarketDataProvider):
 
     def _wait_for_rate_limit(self):
         """Ensure we don't exceed rate limits with exponential backoff."""
-        current_time = time.time()
+        current_time = time.monotonic()
         time_since_last = current_time - self.last_request_time
 
         if time_since_last < self.request_delay:
@@ -162,7 +162,7 @@ class YahooFinanceProvider(MarketDataProvider):
             logger.info(f"Rate limiting: waiting {sleep_time:.2f} seconds")
             time.sleep(sleep_time)
 
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
 
     def _fetch_single_ticker_safely(self, yahoo_symbol: str) -> Dict[str, Any]:
         """Safely fetch single ticker data with multiple fallback methods and retries."""
@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from app.core.cache import AsyncTTLCache
+
+
+class TestAsyncTTLCache:
+    """Test cases for AsyncTTLCache."""
+
+    @pytest.mark.asyncio
+    async def test_should_load_once_for_concurrent_callers(self):
+        cache = AsyncTTLCache(ttl=60)
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"value": 1}
+
+        results = await asyncio.gather(
+            *(cache.get_or_load(("key",), loader) for _ in range(5))
+        )
+
+        assert calls == 1
+        assert all(result == {"value": 1} for result in results)
+
+    @pytest.mark.asyncio
+    async def test_should_reload_when_entry_expired(self):
+        cache = AsyncTTLCache(ttl=0)
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await cache.get_or_load("key", loader) == 1
+        assert await cache.get_or_load("key", loader) == 2
+
+    @pytest.mark.asyncio
+    async def test_should_not_cache_failed_loads(self):
+        cache = AsyncTTLCache(ttl=60)
+
+        async def failing_loader():
+            raise RuntimeError("upstream down")
+
+        async def loader():
+            return "ok"
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load("key", failing_loader)
+
+        assert await cache.get_or_load("key", loader) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_should_finish_load_for_waiters_when_first_caller_cancelled(self):
+        cache = AsyncTTLCache(ttl=60)
+        release = asyncio.Event()
+
+        async def loader():
+            await release.wait()
+            return "ok"
+
+        first = asyncio.create_task(cache.get_or_load("key", loader))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_load("key", loader))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        release.set()
+
+        assert await waiter == "ok"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    @pytest.mark.asyncio
+    async def test_should_reload_after_clear(self):
+        cache = AsyncTTLCache(ttl=60)
+        cache.set("key", "stale")
+
+        cache.clear()
+
+        assert cache.get("key") is None
+
+    def test_should_honor_per_entry_ttl(self):
+        cache = AsyncTTLCache(ttl=60)
+        cache.set("short", "value", ttl=0)
+        cache.set("long", "value")
+
+        assert cache.get("short") is None
+        assert cache.get("long") == "value"
+
+    def test_should_evict_oldest_entry_when_full(self):
+        cache = AsyncTTLCache(ttl=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
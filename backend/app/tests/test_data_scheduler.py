@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from app.services.data_scheduler import FREDDataScheduler
+
+
+class TestFREDDataScheduler:
+    """Test cases for FREDDataScheduler start/stop control."""
+
+    @pytest.mark.asyncio
+    async def test_should_register_jobs_once_when_started_concurrently(self, mocker):
+        scheduler = FREDDataScheduler()
+        check_all = mocker.patch.object(
+            scheduler, "check_all_indicators", mocker.AsyncMock()
+        )
+        crontab = mocker.patch("app.services.data_scheduler.aiocron.crontab")
+
+        await asyncio.gather(scheduler.start_scheduler(), scheduler.start_scheduler())
+
+        assert crontab.call_count == 3
+        assert check_all.await_count == 1
+        assert set(scheduler.running_jobs) == {"daily", "weekly", "monthly"}
+
+        await scheduler.stop_scheduler()
+
+        assert scheduler.running_jobs == {}
+
+    @pytest.mark.asyncio
+    async def test_should_fetch_indicators_in_one_call(self, mocker):
+        scheduler = FREDDataScheduler()
+        fetch = mocker.patch.object(
+            scheduler.fred_provider,
+            "get_multiple_series",
+            mocker.AsyncMock(
+                return_value={
+                    "DGS2": {"value": 4.5},
+                    "DGS10": {"value": 4.8},
+                    "UNRATE": {},
+                }
+            ),
+        )
+
+        await scheduler._update_indicators(("DGS2", "DGS10", "UNRATE"))
+
+        fetch.assert_awaited_once_with(["DGS2", "DGS10", "UNRATE"])
+        assert set(scheduler.last_check_cache) == {"DGS2", "DGS10"}
+
+    @pytest.mark.asyncio
+    async def test_should_update_remaining_indicators_when_one_fails(self, mocker):
+        scheduler = FREDDataScheduler()
+        mocker.patch.object(
+            scheduler.fred_provider,
+            "get_multiple_series",
+            mocker.AsyncMock(
+                return_value={
+                    "DGS2": {"value": 4.5},
+                    "DGS10": {"value": 4.8},
+                    "UNRATE": {"value": 3.8},
+                }
+            ),
+        )
+        started = []
+
+        async def store(indicator_code, fred_data, force_update=False):
+            started.append(indicator_code)
+            if indicator_code == "DGS2":
+                raise RuntimeError("database unavailable")
+            scheduler.last_check_cache[indicator_code] = True
+
+        mocker.patch.object(scheduler, "_store_if_newer", store)
+
+        await scheduler._update_indicators(("DGS2", "DGS10", "UNRATE"))
+
+        assert started == ["DGS2", "DGS10", "UNRATE"]
+        assert set(scheduler.last_check_cache) == {"DGS10", "UNRATE"}
+
+    @pytest.mark.asyncio
+    async def test_should_report_checks_recorded_by_another_process(self):
+        class FakeRedis:
+            def __init__(self):
+                self.hashes = {}
+
+            async def hset(self, name, key, value):
+                self.hashes.setdefault(name, {})[key.encode()] = value.encode()
+
+            async def hget(self, name, key):
+                return self.hashes.get(name, {}).get(key.encode())
+
+            async def hgetall(self, name):
+                return dict(self.hashes.get(name, {}))
+
+        redis = FakeRedis()
+        worker, api = FREDDataScheduler(), FREDDataScheduler()
+        worker.use_redis(redis)
+        api.use_redis(redis)
+
+        await worker._save_indicator_data("DGS10", {"value": 4.8})
+        status = await api.get_update_status()
+
+        assert api.last_check_cache == {}
+        assert status["last_checks"] == {"DGS10": worker.last_check_cache["DGS10"]}
+        assert await api._get_last_update_time("DGS10") == (
+            worker.last_check_cache["DGS10"]
+        )
@@ -0,0 +1,126 @@
+import pytest
+from datetime import datetime
+from typing import Any, Dict
+
+from app.services.economic_data_service import (
+    FREQUENCY_CACHE_TTLS,
+    EconomicDataService,
+)
+from app.services.providers.base import CacheProvider, EconomicDataProvider
+from app.services.providers.fred_provider import FREDProvider
+
+
+class MockEconomicDataProvider(EconomicDataProvider):
+    """Mock implementation of EconomicDataProvider for testing."""
+
+    def __init__(self, indicators: Dict[str, Any]):
+        self.indicators = indicators
+
+    async def get_economic_series(self, series_id: str) -> Dict[str, Any]:
+        """Return mock series data."""
+        return self.indicators.get(series_id, {})
+
+    async def get_multiple_series(self, series_ids) -> Dict[str, Any]:
+        """Return mock data for several series."""
+        return {series_id: self.indicators[series_id] for series_id in series_ids}
+
+    async def get_indicators_by_category(self, category: str) -> Dict[str, Any]:
+        """Return mock indicators in category."""
+        return {
+            code: indicator
+            for code, indicator in self.indicators.items()
+            if indicator["category"] == category
+        }
+
+    async def get_all_indicators(self) -> Dict[str, Any]:
+        """Return all mock indicators."""
+        return self.indicators
+
+
+class MockCacheProvider(CacheProvider):
+    """Mock implementation of CacheProvider recording TTLs."""
+
+    def __init__(self):
+        self.cache = {}
+        self.ttls = {}
+
+    async def get(self, key: str) -> str:
+        """Get cached data."""
+        return self.cache.get(key)
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        """Set cached data."""
+        self.cache[key] = value
+        self.ttls[key] = ttl
+
+    async def delete(self, key: str) -> None:
+        """Delete cached data."""
+        self.cache.pop(key, None)
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists."""
+        return key in self.cache
+
+
+def observed_indicator(code: str, category: str) -> Dict[str, Any]:
+    """Indicator shaped like FREDTransformer output for a real observation."""
+    return {
+        "indicator_code": code,
+        "name": code,
+        "value": 3.8,
+        "previous_value": 3.7,
+        "change": 0.1,
+        "change_percent": 2.7,
+        "unit": "Percent",
+        "frequency": "monthly",
+        "source": "FRED",
+        "timestamp": datetime.now(),
+        "country": "US",
+        "category": category,
+        "last_updated": datetime(2024, 1, 1),
+    }
+
+
+class TestEconomicDataService:
+    """Test suite for EconomicDataService caching."""
+
+    @pytest.mark.asyncio
+    async def test_should_cap_cache_ttl_for_monthly_series(self):
+        """Test: should cache monthly data far below its release period."""
+        # Given: real monthly observations
+        provider = MockEconomicDataProvider(
+            {"UNRATE": observed_indicator("UNRATE", "employment")}
+        )
+        cache = MockCacheProvider()
+        service = EconomicDataService(provider, cache)
+
+        # When: the category is fetched
+        await service.get_indicators_by_category("employment")
+
+        # Then: it is cached with the capped monthly TTL
+        assert cache.ttls["economic_indicators_employment"] == (
+            FREQUENCY_CACHE_TTLS["monthly"]
+        )
+        assert FREQUENCY_CACHE_TTLS["monthly"] < 86400
+
+    @pytest.mark.asyncio
+    async def test_should_not_cache_fallback_data(self):
+        """Test: should not cache mock data served during a FRED outage."""
+        # Given: a good cached entry and a provider falling back to mock data
+        fallback = FREDProvider(api_key="")._get_mock_data("UNRATE")
+        provider = MockEconomicDataProvider(
+            {
+                "UNRATE": fallback,
+                "PAYEMS": observed_indicator("PAYEMS", "employment"),
+            }
+        )
+        cache = MockCacheProvider()
+        cache.cache["economic_indicators_employment"] = "good"
+        service = EconomicDataService(provider, cache)
+
+        # When: the category is refreshed
+        assert await service.refresh_cache("employment") is True
+
+        # Then: the fallback payload is not written over the good entry
+        assert cache.cache["economic_indicators_employment"] == "good"
+        assert "economic_indicators_employment" not in cache.ttls
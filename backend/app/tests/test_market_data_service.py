@@ -202,6 +202,21 @@ class TestMarketDataService:
         assert len(result.historical_data) > 0
         assert result.historical_data[0]["symbol"] == symbol
 
+    @pytest.mark.asyncio
+    async def test_should_share_cache_entry_between_detail_and_rows(
+        self, market_service
+    ):
+        """Test: streamed rows and index detail should read one cache entry."""
+        # Given: rows fetched for a multi-year period
+        index, rows = await market_service.get_index_detail_rows("SP500", "5y")
+
+        # When: the same detail is requested through the response model
+        result = await market_service.get_index_detail("SP500", "5y")
+
+        # Then: the cached entry validates into the same data
+        assert result.index == index
+        assert result.historical_data == rows
+
     @pytest.mark.asyncio
     async def test_should_get_market_overview_with_all_sections(self, market_service):
         """Test: should get market overview with all sections."""
@@ -259,3 +274,20 @@ class TestMarketDataService:
         # Then: should return data successfully without caching
         assert isinstance(result, MarketIndicesResponse)
         assert result.us_indices.sp500.current_value == 4500.0
+
+    @pytest.mark.asyncio
+    async def test_should_keep_cached_data_when_refresh_fails(
+        self, market_service, mock_market_provider, mock_cache_provider
+    ):
+        """Test: should keep the cached entry when a refresh fetch fails."""
+        # Given: cached indices and a provider that now fails
+        await market_service.get_indices()
+        cached_before = await mock_cache_provider.get("market_indices_all")
+        mock_market_provider.get_indices = AsyncMock(side_effect=RuntimeError("down"))
+
+        # When: refresh_cache is called
+        result = await market_service.refresh_cache()
+
+        # Then: the refresh fails but the previous entry is still served
+        assert result is False
+        assert await mock_cache_provider.get("market_indices_all") == cached_before
@@ -0,0 +1,174 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models.portfolio import Holding, Portfolio, Transaction, TransactionType
+from app.repositories.portfolio_repository import (
+    HoldingRepository,
+    PortfolioRepository,
+    TransactionRepository,
+)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    portfolio = Portfolio(user_id="user-1", name="Test")
+    session.add(portfolio)
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+class TestPortfolioRepository:
+    """Test cases for PortfolioRepository."""
+
+    def test_should_eager_load_holdings_and_raise_on_other_relationships(self, db):
+        HoldingRepository(db).create_or_update_holding(
+            1, "AAPL", 10, 100.0, TransactionType.buy
+        )
+        db.expunge_all()
+
+        portfolio = PortfolioRepository(db).get_with_holdings("user-1", 1)
+
+        assert [holding.symbol for holding in portfolio.holdings] == ["AAPL"]
+        with pytest.raises(InvalidRequestError):
+            portfolio.transactions
+        with pytest.raises(InvalidRequestError):
+            portfolio.user
+
+    def test_should_not_return_other_users_portfolio(self, db):
+        assert PortfolioRepository(db).get_with_holdings("user-2", 1) is None
+
+
+class TestHoldingRepository:
+    """Test cases for HoldingRepository."""
+
+    def test_should_apply_bulk_ops_with_weighted_average_cost(self, db):
+        repo = HoldingRepository(db)
+
+        holding_ids = repo.create_or_update_holdings_bulk(
+            1,
+            [
+                {
+                    "symbol": "AAPL",
+                    "quantity_change": 10,
+                    "price": 100.0,
+                    "transaction_type": TransactionType.buy,
+                },
+                {
+                    "symbol": "AAPL",
+                    "quantity_change": 10,
+                    "price": 200.0,
+                    "transaction_type": TransactionType.buy,
+                },
+                {
+                    "symbol": "AAPL",
+                    "quantity_change": 5,
+                    "price": 250.0,
+                    "transaction_type": TransactionType.sell,
+                },
+                {
+                    "symbol": "MSFT",
+                    "quantity_change": 3,
+                    "price": 300.0,
+                    "transaction_type": TransactionType.buy,
+                },
+            ],
+        )
+
+        aapl = db.get(Holding, holding_ids["AAPL"])
+        assert aapl.quantity == 15
+        assert aapl.average_cost == 150.0
+        assert db.get(Holding, holding_ids["MSFT"]).quantity == 3
+
+    def test_should_update_existing_holding_through_single_op(self, db):
+        repo = HoldingRepository(db)
+        repo.create_or_update_holding(1, "AAPL", 10, 100.0, TransactionType.buy)
+
+        holding = repo.create_or_update_holding(
+            1, "AAPL", 10, 200.0, TransactionType.buy
+        )
+
+        assert holding.quantity == 20
+        assert holding.average_cost == 150.0
+        assert db.query(Holding).count() == 1
+
+    def test_should_reduce_quantity_and_keep_average_cost_on_sell(self, db):
+        repo = HoldingRepository(db)
+        repo.create_or_update_holding(1, "AAPL", 10, 100.0, TransactionType.buy)
+
+        holding = repo.create_or_update_holding(
+            1, "AAPL", 4, 250.0, TransactionType.sell
+        )
+
+        assert holding.quantity == 6
+        assert holding.average_cost == 100.0
+
+    def test_should_reject_sell_without_holding(self, db):
+        repo = HoldingRepository(db)
+
+        with pytest.raises(ValueError):
+            repo.create_or_update_holding(1, "AAPL", 1, 100.0, TransactionType.sell)
+
+    def test_should_leave_holding_untouched_on_dividend(self, db):
+        repo = HoldingRepository(db)
+        repo.create_or_update_holding(1, "AAPL", 10, 100.0, TransactionType.buy)
+
+        holding = repo.create_or_update_holding(
+            1, "AAPL", 10, 2.5, TransactionType.dividend
+        )
+
+        assert holding.quantity == 10
+        assert holding.average_cost == 100.0
+        assert (
+            repo.create_or_update_holding(1, "MSFT", 1, 1.0, TransactionType.dividend)
+            is None
+        )
+
+
+def add_transactions(db, rows):
+    for symbol, transaction_type, quantity, amount in rows:
+        db.add(
+            Transaction(
+                portfolio_id=1,
+                symbol=symbol,
+                transaction_type=transaction_type,
+                quantity=quantity,
+                price=amount / quantity,
+                total_amount=amount,
+                transaction_date=datetime(2024, 1, 1),
+            )
+        )
+    db.commit()
+
+
+class TestTransactionRepository:
+    """Test cases for TransactionRepository."""
+
+    def test_should_aggregate_totals_per_transaction_type(self, db):
+        add_transactions(
+            db,
+            [
+                ("AAPL", TransactionType.buy, 1, 1000.0),
+                ("AAPL", TransactionType.buy, 1, 500.0),
+                ("AAPL", TransactionType.sell, 1, 300.0),
+                ("AAPL", TransactionType.dividend, 1, 25.0),
+            ],
+        )
+        repo = TransactionRepository(db)
+
+        totals = repo.aggregate_totals(1)
+
+        assert totals[TransactionType.buy] == 1500.0
+        assert totals[TransactionType.sell] == 300.0
+        assert totals[TransactionType.dividend] == 25.0
+        assert repo.calculate_total_invested(1) == 1200.0
+        assert repo.calculate_total_dividends(2) == 0.0
@@ -0,0 +1,64 @@
+"""
+ARQ worker configuration for FRED data updates.
+
+Run the worker in its own process so long FRED fetches never share the
+API's event loop:
+
+    arq app.workers.arq_config.WorkerSettings
+"""
+
+import logging
+from typing import Any, Dict
+
+from arq import cron
+from arq.connections import RedisSettings
+
+from app.core.config import settings
+from app.models.materialized_views import refresh_portfolio_daily
+from app.services.data_scheduler import scheduler
+
+logger = logging.getLogger(__name__)
+
+redis_settings = RedisSettings.from_dsn(settings.redis_url)
+
+
+async def startup(ctx: Dict[str, Any]) -> None:
+    """Share one FRED HTTP client across jobs and record checks in Redis."""
+    await scheduler.open_http_client()
+    # The API reads these last-check times for /scheduler/status
+    scheduler.use_redis(ctx["redis"])
+
+
+async def shutdown(ctx: Dict[str, Any]) -> None:
+    """Close the worker's FRED HTTP client."""
+    scheduler.use_redis(None)
+    await scheduler.close_http_client()
+
+
+async def check_all_indicators_task(ctx: Dict[str, Any]) -> None:
+    """Update every configured FRED indicator."""
+    logger.info(f"Job {ctx.get('job_id')}: updating all FRED indicators")
+    await scheduler.check_all_indicators()
+
+
+async def force_update_indicator_task(ctx: Dict[str, Any], indicator_code: str) -> bool:
+    """Force an update of a single FRED indicator."""
+    logger.info(f"Job {ctx.get('job_id')}: force updating {indicator_code}")
+    return await scheduler.force_update_indicator(indicator_code)
+
+
+async def refresh_portfolio_daily_task(ctx: Dict[str, Any]) -> None:
+    """Refresh the mv_portfolio_daily rollup."""
+    logger.info(f"Job {ctx.get('job_id')}: refreshing mv_portfolio_daily")
+    await refresh_portfolio_daily()
+
+
+class WorkerSettings:
+    """Settings consumed by the `arq` CLI."""
+
+    functions = [check_all_indicators_task, force_update_indicator_task]
+    cron_jobs = [cron(refresh_portfolio_daily_task, hour=3, minute=0)]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = redis_settings
+    job_timeout = 30 * 60  # Headroom for a full refresh when FRED is slow
@@ -165,18 +165,15 @@ export interface PortfolioAllocation {
 }
 
 // Chart Types
-export interface ChartDataPoint {
-    x: string | number | Date;
-    y: number;
-    label?: string;
-}
-
+// Columnar series: x[i], y[i] (and labels[i]) describe one point
 export interface ChartData {
     chart_type: string;
     title: string;
     x_axis_label: string;
     y_axis_label: string;
-    data: ChartDataPoint[];
+    x: (string | number)[];
+    y: number[];
+    labels?: string[];
     metadata?: Record<string, unknown>;
 }
 